@@ -0,0 +1,68 @@
+"""
+Concurrent resume-upload load test for /match/match/resume.
+Usage:
+    python -m ai_job_dashboard.api.bench_load resume.pdf --concurrency 32 --requests 500
+Run it against the API before and after a change and compare req/s and p99.
+"""
+import argparse
+import asyncio
+import os
+import time
+from collections import Counter
+import aiohttp
+import numpy as np
+
+
+async def _worker(session, url, path, payload, queue, latencies, statuses):
+    while True:
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        form = aiohttp.FormData()
+        form.add_field("file", payload, filename=os.path.basename(path))
+        t0 = time.perf_counter()
+        try:
+            async with session.post(url, data=form) as resp:
+                await resp.read()
+                statuses[resp.status] += 1
+        except aiohttp.ClientError:
+            statuses["error"] += 1
+        latencies.append((time.perf_counter() - t0) * 1000)
+
+
+async def run(url, path, concurrency, n_requests, timeout):
+    with open(path, "rb") as f:
+        payload = f.read()
+    queue = asyncio.Queue()
+    for i in range(n_requests):
+        queue.put_nowait(i)
+    latencies, statuses = [], Counter()
+    conn = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=conn, timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+        t0 = time.perf_counter()
+        await asyncio.gather(*[_worker(session, url, path, payload, queue, latencies, statuses)
+                               for _ in range(concurrency)])
+        elapsed = time.perf_counter() - t0
+    return elapsed, np.array(latencies), statuses
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("resume")
+    parser.add_argument("--url", default="http://127.0.0.1:8000/match/match/resume")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--timeout", type=float, default=120)
+    args = parser.parse_args()
+    elapsed, lat, statuses = asyncio.run(run(args.url, args.resume, args.concurrency, args.requests, args.timeout))
+    ok = statuses.get(200, 0)
+    print(f"{args.requests} requests, concurrency {args.concurrency}, {elapsed:.1f}s")
+    print(f"throughput: {args.requests / elapsed:.1f} req/s ({ok / elapsed:.1f} ok/s)")
+    if len(lat):
+        print(f"latency ms: p50 {np.percentile(lat, 50):.0f}  p90 {np.percentile(lat, 90):.0f}  p99 {np.percentile(lat, 99):.0f}")
+    print("status codes:", dict(statuses))
+
+
+if __name__ == '__main__':
+    main()
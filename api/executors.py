@@ -0,0 +1,87 @@
+import asyncio
+import contextvars
+import functools
+import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from fastapi import HTTPException
+from ai_job_dashboard.utils.config import (
+    API_PARSE_WORKERS, API_PARSE_PROCESSES, API_WORKERS, API_MAX_PENDING, API_REQUEST_TIMEOUT,
+)
+from ai_job_dashboard.utils import metrics
+
+# resume parsing is pure-Python CPU work, so by default it gets its own processes;
+# spawn avoids forking a process that already runs threads
+if API_PARSE_PROCESSES:
+    parse_pool = ProcessPoolExecutor(max_workers=API_PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+else:
+    parse_pool = ThreadPoolExecutor(max_workers=API_PARSE_WORKERS, thread_name_prefix="parse")
+# encoding, FAISS, SQLAlchemy and redis calls: native code or blocking IO
+work_pool = ThreadPoolExecutor(max_workers=API_WORKERS, thread_name_prefix="match")
+
+# pool futures started under the current Admission slot
+_slot_work = contextvars.ContextVar("slot_work", default=None)
+
+
+async def run_in(pool, fn, *args, **kwargs):
+    future = pool.submit(functools.partial(fn, *args, **kwargs))
+    work = _slot_work.get()
+    if work is not None:
+        work.append(future)
+    return await asyncio.wrap_future(future)
+
+
+class Admission:
+    """Caps requests in flight (running + queued on the pools); the rest get 429."""
+
+    def __init__(self, limit=API_MAX_PENDING, name="match"):
+        self.limit = limit
+        self.name = name
+        self.pending = 0
+
+    @contextmanager
+    def slot(self):
+        # only touched from the event loop thread, so a plain counter is enough
+        if self.pending >= self.limit:
+            metrics.inc("api_rejected_total", endpoint=self.name)
+            raise HTTPException(status_code=429, detail="server busy, retry later")
+        self.pending += 1
+        metrics.set_gauge("api_pending", self.pending, endpoint=self.name)
+        work = []
+        token = _slot_work.set(work)
+        try:
+            yield
+        finally:
+            _slot_work.reset(token)
+            # after a timeout the request is gone but its pool work may still be running;
+            # the slot stays taken until that finishes so the limit covers real load
+            running = [f for f in work if not f.done()]
+            if running:
+                self._release_when_done(running)
+            else:
+                self._release()
+
+    def _release(self):
+        self.pending -= 1
+        metrics.set_gauge("api_pending", self.pending, endpoint=self.name)
+
+    def _release_when_done(self, futures):
+        loop = asyncio.get_running_loop()
+        left = [len(futures)]
+
+        def finished():
+            left[0] -= 1
+            if not left[0]:
+                self._release()
+
+        for f in futures:
+            # done callbacks run on the pool thread; the counter is only touched on the loop
+            f.add_done_callback(lambda _: loop.call_soon_threadsafe(finished))
+
+
+async def with_timeout(coro, timeout=API_REQUEST_TIMEOUT):
+    try:
+        return await asyncio.wait_for(coro, timeout)
+    except asyncio.TimeoutError:
+        metrics.inc("api_timeouts_total")
+        raise HTTPException(status_code=504, detail="request timed out")
@@ -1,31 +1,27 @@
+from datetime import date
+from typing import Optional
 from fastapi import FastAPI, HTTPException
 from ai_job_dashboard.db.db import get_session
-from ai_job_dashboard.db.models import Job
-from sqlalchemy import select
+from ai_job_dashboard.db.skill_counts import top_skills as skill_counts
 from fastapi.middleware.cors import CORSMiddleware
+from ai_job_dashboard.api.jobs_api import router as jobs_router
 from ai_job_dashboard.api.match_api import router as match_router
+from ai_job_dashboard.api.health import router as health_router
 
 
 app = FastAPI(title="AI Job Dashboard API")
-app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
+app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"],
+                   expose_headers=["X-Next-Cursor"])
+app.include_router(jobs_router, prefix="/jobs")
 app.include_router(match_router, prefix="/match")
-
-@app.get("/jobs")
-def list_jobs(limit: int = 100):
-    session = get_session()
-    stmt = select(Job).limit(limit)
-    res = session.execute(stmt).scalars().all()
-    return [{"id": j.id, "title": j.title, "company": j.company, "location": j.location, "skills": j.skills} for j in res]
+app.include_router(health_router)
 
 @app.get("/skills/top")
-def top_skills(limit: int = 20):
+def top_skills(limit: int = 20, source: Optional[str] = None, location: Optional[str] = None,
+               since: Optional[date] = None, until: Optional[date] = None):
+    # summed from the skill_counts roll-up, so it covers every job, not a sample
     session = get_session()
-    # naive aggregation in Python
-    stmt = select(Job).limit(1000)
-    rows = session.execute(stmt).scalars().all()
-    counts = {}
-    for j in rows:
-        for s in j.skills or []:
-            counts[s] = counts.get(s,0) + 1
-    top = sorted(counts.items(), key=lambda x: -x[1])[:limit]
-    return [{"skill": k, "count": v} for k,v in top]
+    try:
+        return skill_counts(session, limit=limit, source=source, location=location, since=since, until=until)
+    finally:
+        session.close()
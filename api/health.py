@@ -1,7 +1,12 @@
 from fastapi import APIRouter
+from ai_job_dashboard.utils import metrics
 
 router = APIRouter()
 
 @router.get("/health")
 def health():
     return {"status": "ok"}
+
+@router.get("/metrics")
+def get_metrics():
+    return metrics.snapshot()
@@ -0,0 +1,113 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, or_, and_
+from ai_job_dashboard.db.db import get_session, timestamp_param
+from ai_job_dashboard.db.fulltext import search_jobs
+from ai_job_dashboard.db.models import Job
+
+router = APIRouter()
+
+# only what the list returns is selected; description/raw_data never leave the database here
+LIST_COLUMNS = (Job.id, Job.title, Job.company, Job.location, Job.skills)
+STREAM_BATCH = 1000
+
+
+def encode_cursor(row, order):
+    key = {"id": row["id"]}
+    if order == "created_at":
+        key["created_at"] = row["created_at"].isoformat() if row["created_at"] else None
+    return base64.urlsafe_b64encode(json.dumps(key).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor, order):
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if order == "created_at":
+            return int(key["id"]), datetime.fromisoformat(key["created_at"]) if key["created_at"] else None
+        return int(key["id"]), None
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="invalid cursor")
+
+
+def _page_query(dialect, order, after, source=None, company=None, location=None, title=None):
+    """Newest first; after is the decoded cursor of the last row already returned."""
+    columns = LIST_COLUMNS + ((Job.created_at,) if order == "created_at" else ())
+    stmt = select(*columns)
+    if source:
+        stmt = stmt.where(Job.source == source)
+    if company:
+        stmt = stmt.where(Job.company == company)
+    if location:
+        stmt = stmt.where(Job.location == location)
+    if title:
+        # prefix match so the title index stays usable
+        stmt = stmt.where(Job.title.like(title.replace("%", r"\%").replace("_", r"\_") + "%", escape="\\"))
+    if order == "created_at":
+        stmt = stmt.order_by(Job.created_at.desc(), Job.id.desc())
+        if after:
+            last_id, last_created = after[0], timestamp_param(after[1], dialect)
+            stmt = stmt.where(or_(Job.created_at < last_created, and_(Job.created_at == last_created, Job.id < last_id)))
+    else:
+        stmt = stmt.order_by(Job.id.desc())
+        if after:
+            stmt = stmt.where(Job.id < after[0])
+    return stmt
+
+
+def _item(row):
+    return {"id": row["id"], "title": row["title"], "company": row["company"], "location": row["location"], "skills": row["skills"]}
+
+
+def _stream(order, after, filters):
+    # keyset batches on a private session: memory stays flat however many rows are sent
+    session = get_session()
+    dialect = session.get_bind().dialect.name
+    try:
+        while True:
+            rows = session.execute(_page_query(dialect, order, after, **filters).limit(STREAM_BATCH)).mappings().all()
+            if not rows:
+                break
+            yield "".join(json.dumps(_item(r)) + "\n" for r in rows)
+            last = rows[-1]
+            after = (last["id"], last.get("created_at"))
+    finally:
+        session.close()
+
+
+@router.get("")
+def list_jobs(response: Response, limit: int = Query(100, ge=1, le=1000), cursor: Optional[str] = None,
+              order: str = Query("id", regex="^(id|created_at)$"), source: Optional[str] = None,
+              company: Optional[str] = None, location: Optional[str] = None, title: Optional[str] = None,
+              stream: bool = False):
+    """
+    One page of jobs, newest first. The X-Next-Cursor response header is the cursor for the
+    next page (absent on the last one). stream=true sends every matching job (limit ignored)
+    as NDJSON, one object per line.
+    """
+    after = decode_cursor(cursor, order) if cursor else None
+    filters = {"source": source, "company": company, "location": location, "title": title}
+    if stream:
+        return StreamingResponse(_stream(order, after, filters), media_type="application/x-ndjson")
+    session = get_session()
+    try:
+        rows = session.execute(_page_query(session.get_bind().dialect.name, order, after, **filters).limit(limit)).mappings().all()
+    finally:
+        session.close()
+    if len(rows) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(rows[-1], order)
+    return [_item(r) for r in rows]
+
+
+@router.get("/search")
+def search(q: str = Query(..., min_length=1), limit: int = Query(20, ge=1, le=200), offset: int = Query(0, ge=0, le=10000),
+           source: Optional[str] = None, company: Optional[str] = None, location: Optional[str] = None):
+    """Keyword search over title/company/location/description, best match first, with <b>-highlighted snippets."""
+    session = get_session()
+    try:
+        return search_jobs(session, q, limit=limit, offset=offset, source=source, company=company, location=location)
+    finally:
+        session.close()
@@ -1,83 +1,118 @@
-from fastapi import APIRouter, UploadFile, File
-from ai_job_dashboard.nlp.embeddings import get_model
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, UploadFile, File, Query
 from ai_job_dashboard.db.db import get_session
 from ai_job_dashboard.db.models import Job
-from sqlalchemy import select
-import pandas as pd
-import io
-import pdfplumber
-import docx
-import numpy as np
 from ai_job_dashboard.utils.logger import get_logger
-from ai_job_dashboard.ml.faiss_index import search as faiss_search
-import redis
-import os
-import joblib
+from ai_job_dashboard.ml.faiss_index import normalize_query, search_vector, get_snapshot, neighbors, reconstruct
+from ai_job_dashboard.ml.hybrid_rank import hybrid_search
+from ai_job_dashboard.ml.embedding_service import encode_async
+from ai_job_dashboard.ml.embedding_store import get_vectors, load_vectors
+from ai_job_dashboard.db.hydrate import hydrate_jobs
+from ai_job_dashboard.api.resume_parsing import extract_text
+from ai_job_dashboard.api.executors import parse_pool, work_pool, run_in, with_timeout, Admission
+from ai_job_dashboard.ml import embedding_cache
+from ai_job_dashboard.nlp.skill_extraction import extract_skills_from_text
+from ai_job_dashboard.utils.config import MATCH_HYBRID, MATCH_FUSION
 
 router = APIRouter()
 logger = get_logger("MatchAPI")
+admission = Admission(name="match_resume")
 
-# Redis client for caching embeddings
-REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-r = redis.from_url(REDIS_URL)
+# extra per-hit fields from hybrid ranking, passed through when present
+HIT_FIELDS = ("semantic_score", "skill_score", "skill_gap")
 
-def extract_text_from_file(file: UploadFile):
-    content = file.file.read()
-    name = file.filename.lower()
-    if name.endswith(".pdf"):
-        text = ""
-        with io.BytesIO(content) as bio:
-            with pdfplumber.open(bio) as pdf:
-                for page in pdf.pages:
-                    text += page.extract_text() or ""
-        return text
-    if name.endswith(".docx") or name.endswith(".doc"):
-        doc = docx.Document(io.BytesIO(content))
-        txt = []
-        for p in doc.paragraphs:
-            txt.append(p.text)
-        return "\\n".join(txt)
-    # fallback: try decode
+def _with_jobs(session, results):
+    # one IN query for all hits, rank order preserved
+    hits = {res["idx"]: res for res in results}
+    jobs = hydrate_jobs(session, [res["idx"] for res in results])
+    out = []
+    for j in jobs:
+        hit = hits[j["id"]]
+        item = {"job_id": j["job_id"], "title": j["title"], "company": j["company"], "score": hit["score"]}
+        item.update((f, hit[f]) for f in HIT_FIELDS if f in hit)
+        out.append(item)
+    return out
+
+def _filters(location=None, source=None, min_salary=None, max_salary=None, posted_after=None):
+    # applied inside the FAISS search (see job_filters); None when nothing is filtered
+    filters = {"location": location, "source": source, "min_salary": min_salary,
+               "max_salary": max_salary, "posted_after": posted_after}
+    return {k: v for k, v in filters.items() if v is not None} or None
+
+def _match_vector(qemb, top_k, text=None, hybrid=False, fusion=MATCH_FUSION, with_gap=False, filters=None):
+    # runs on the work pool: FAISS and the DB are both blocking
+    # use FAISS search; pin one index generation for the whole request
+    snap = get_snapshot()
+    try:
+        if hybrid:
+            # FAISS candidates re-ranked by overlap with the resume's skills
+            results = hybrid_search(qemb, extract_skills_from_text(text), top_k=top_k, snapshot=snap,
+                                    fusion=fusion, with_gap=with_gap, filters=filters)
+        else:
+            results = search_vector(qemb, top_k=top_k, snapshot=snap, filters=filters)
+    except ValueError as e:
+        return {"error": str(e)}
+    # fetch job details from DB for results
+    session = get_session()
     try:
-        return content.decode("utf-8", errors="ignore")
-    except Exception:
-        return ""
+        return {"results": _with_jobs(session, results), "index_generation": snap.generation}
+    finally:
+        session.close()
 
-@router.post("/match/resume")
-async def match_resume(file: UploadFile = File(...), top_k: int = 10):
-    text = extract_text_from_file(file)
+async def _match_resume(file, top_k, hybrid, fusion, with_gap, filters):
+    content = await file.read()
+    text = await run_in(parse_pool, extract_text, content, file.filename)
     if not text:
         return {"error":"could not parse resume"}
-    model = get_model()
-    emb = model.encode([text], convert_to_numpy=True)[0].astype('float32')
-    # optionally cache resume embedding in redis with short TTL
-    key = f"resume_emb:{hash(text)% (10**9)}"
-    r.set(key, emb.tobytes(), ex=3600)
-    # use FAISS search
-    results = faiss_search(text, top_k=top_k)
-    # fetch job details from DB for results
-    session = get_session()
-    out = []
-    for res in results:
-        job = session.query(Job).filter(Job.job_id==res["id"]).one_or_none()
-        if job:
-            out.append({"job_id": job.job_id, "title": job.title, "company": job.company, "score": res["score"]})
-    return {"results": out}
+    # repeat uploads are served from the embedding cache and skip inference
+    vec = await run_in(work_pool, embedding_cache.get, text)
+    if vec is None:
+        # encoded by the batching service, so concurrent uploads share one model call
+        vec = await encode_async(text)
+        await run_in(work_pool, embedding_cache.put, text, vec)
+    return await run_in(work_pool, _match_vector, normalize_query(vec), top_k, text, hybrid, fusion, with_gap,
+                        filters)
+
+@router.post("/match/resume")
+async def match_resume(file: UploadFile = File(...), top_k: int = 10, hybrid: bool = MATCH_HYBRID,
+                       fusion: str = Query(MATCH_FUSION, regex="^(weighted|rrf)$"), skill_gap: bool = False,
+                       location: Optional[str] = None, source: Optional[str] = None, min_salary: Optional[float] = None,
+                       max_salary: Optional[float] = None, posted_after: Optional[date] = None):
+    filters = _filters(location, source, min_salary, max_salary, posted_after)
+    with admission.slot():
+        return await with_timeout(_match_resume(file, top_k, hybrid, fusion, skill_gap, filters))
+
+def _similar_by_vector(session, snap, job_id, key, top_k, filters=None):
+    # indexed vector first, then the stored one; the model only runs for never-embedded jobs
+    vec = reconstruct(snap, key) if key is not None else None
+    if vec is None:
+        job = session.query(Job).filter(Job.job_id==job_id).one_or_none()
+        if not job:
+            return None
+        vec = load_vectors(session, [job.id]).get(job.id)
+        if vec is None:
+            vec = get_vectors(session, [(job.id, job.title, job.description)])[0]
+    results = search_vector(vec, top_k=top_k + 1, snapshot=snap, filters=filters)
+    return [res for res in results if res["id"] != job_id][:top_k]
 
 @router.get("/job/{job_id}/similar")
-def similar_jobs(job_id: str, top_k: int = 10):
-    # find similar via FAISS by locating job text in meta
+def similar_jobs(job_id: str, top_k: int = 10, location: Optional[str] = None, source: Optional[str] = None,
+                 min_salary: Optional[float] = None, max_salary: Optional[float] = None, posted_after: Optional[date] = None):
+    filters = _filters(location, source, min_salary, max_salary, posted_after)
+    snap = get_snapshot()
+    key = snap.key_for(job_id)
     session = get_session()
-    job = session.query(Job).filter(Job.job_id==job_id).one_or_none()
-    if not job:
-        return {"error":"job not found"}
-    text = (job.title or "") + " " + (job.description or "")
-    results = faiss_search(text, top_k=top_k)
-    out = []
-    for res in results:
-        if res["id"] == job_id:
-            continue
-        j = session.query(Job).filter(Job.job_id==res["id"]).one_or_none()
-        if j:
-            out.append({"job_id": j.job_id, "title": j.title, "company": j.company, "score": res["score"]})
-    return {"results": out}
+    try:
+        # fast path: neighbours precomputed when this index generation was built (unfiltered only)
+        results = neighbors(snap, key, top_k) if key is not None and not filters else None
+        if results is None:
+            try:
+                results = _similar_by_vector(session, snap, job_id, key, top_k, filters)
+            except ValueError as e:
+                return {"error": str(e)}
+            if results is None:
+                return {"error":"job not found"}
+        return {"results": _with_jobs(session, results), "index_generation": snap.generation}
+    finally:
+        session.close()
@@ -0,0 +1,27 @@
+import io
+import pdfplumber
+import docx
+
+# kept free of app/DB imports: this runs inside the parse process pool
+
+
+def extract_text(content, filename):
+    name = (filename or "").lower()
+    if name.endswith(".pdf"):
+        text = ""
+        with io.BytesIO(content) as bio:
+            with pdfplumber.open(bio) as pdf:
+                for page in pdf.pages:
+                    text += page.extract_text() or ""
+        return text
+    if name.endswith(".docx") or name.endswith(".doc"):
+        doc = docx.Document(io.BytesIO(content))
+        txt = []
+        for p in doc.paragraphs:
+            txt.append(p.text)
+        return "\n".join(txt)
+    # fallback: try decode
+    try:
+        return content.decode("utf-8", errors="ignore")
+    except Exception:
+        return ""
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, literal
 from sqlalchemy.orm import sessionmaker, declarative_base
 from ai_job_dashboard.utils.config import DATABASE_URL
 
@@ -8,3 +8,10 @@ Base = declarative_base()
 
 def get_session():
     return SessionLocal()
+
+def timestamp_param(value, dialect):
+    # sqlite keeps timestamps as text ('YYYY-MM-DD HH:MM:SS' from CURRENT_TIMESTAMP) but binds
+    # datetimes with microseconds, so they would never compare equal; bind the stored form
+    if dialect == "sqlite" and value is not None:
+        return literal(value.strftime("%Y-%m-%d %H:%M:%S") + (f".{value.microsecond:06d}" if value.microsecond else ""))
+    return value
@@ -0,0 +1,120 @@
+"""
+Keyword search over jobs backed by the database's own inverted index:
+Postgres: a generated, weighted tsvector column with a GIN index (kept current by Postgres itself).
+SQLite: an external-content FTS5 table kept in sync by triggers.
+Set up (idempotent; also run by the ETL's init_db):
+    python -m ai_job_dashboard.db.fulltext
+"""
+import re
+import time
+from sqlalchemy import text
+from ai_job_dashboard.utils.logger import get_logger
+
+logger = get_logger("FullText")
+
+# title matters most, then company/location, then the body (tsvector weights A/B/C, bm25 column weights)
+PG_SETUP = [
+    """ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_tsv tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(company, '') || ' ' || coalesce(location, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'C')) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_jobs_search_tsv ON jobs USING GIN (search_tsv)",
+]
+
+SQLITE_SETUP = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+        title, company, location, description, content='jobs', content_rowid='id', tokenize='porter unicode61')""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+        INSERT INTO jobs_fts(rowid, title, company, location, description)
+        VALUES (new.id, new.title, new.company, new.location, new.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description)
+        VALUES ('delete', old.id, old.title, old.company, old.location, old.description);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE OF title, company, location, description ON jobs BEGIN
+        INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location, description)
+        VALUES ('delete', old.id, old.title, old.company, old.location, old.description);
+        INSERT INTO jobs_fts(rowid, title, company, location, description)
+        VALUES (new.id, new.title, new.company, new.location, new.description);
+    END""",
+]
+
+PG_SEARCH = """
+SELECT j.id, j.job_id, j.title, j.company, j.location, r.score,
+       ts_headline('english', coalesce(j.description, ''), r.q,
+                   'MaxFragments=2, MaxWords=24, MinWords=8, StartSel=<b>, StopSel=</b>') AS highlight
+FROM (
+    SELECT id, ts_rank_cd(search_tsv, q, 32) AS score, q
+    FROM jobs, websearch_to_tsquery('english', :q) AS q
+    WHERE search_tsv @@ q {filters}
+    ORDER BY score DESC, id DESC
+    LIMIT :limit OFFSET :offset
+) r JOIN jobs j ON j.id = r.id
+ORDER BY r.score DESC, j.id DESC
+"""
+
+SQLITE_SEARCH = """
+SELECT j.id, j.job_id, j.title, j.company, j.location,
+       -bm25(jobs_fts, 10.0, 3.0, 3.0, 1.0) AS score,
+       snippet(jobs_fts, 3, '<b>', '</b>', '...', 24) AS highlight
+FROM jobs_fts JOIN jobs j ON j.id = jobs_fts.rowid
+WHERE jobs_fts MATCH :q {filters}
+ORDER BY bm25(jobs_fts, 10.0, 3.0, 3.0, 1.0), j.id DESC
+LIMIT :limit OFFSET :offset
+"""
+
+FILTER_COLUMNS = ("source", "company", "location")
+
+
+def ensure_fulltext(engine):
+    """Create the index (and on SQLite the FTS table + triggers) if missing."""
+    dialect = engine.dialect.name
+    t0 = time.perf_counter()
+    with engine.begin() as conn:
+        if dialect == "postgresql":
+            for ddl in PG_SETUP:
+                conn.execute(text(ddl))
+        elif dialect == "sqlite":
+            existed = conn.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'jobs_fts'")).first()
+            for ddl in SQLITE_SETUP:
+                conn.execute(text(ddl))
+            if not existed:
+                # index the rows that predate the triggers
+                conn.execute(text("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')"))
+        else:
+            raise NotImplementedError(f"full-text search not supported on {dialect}")
+    logger.info(f"Full-text index ready ({dialect}) in {time.perf_counter() - t0:.1f}s")
+
+
+def fts5_query(q):
+    # user text -> FTS5 syntax: every word quoted (no operator injection), implicitly ANDed
+    return " ".join(f'"{w}"' for w in re.findall(r"\w+", q.lower()))
+
+
+def search_jobs(session, q, limit=20, offset=0, **filters):
+    """Ranked keyword hits (best first) with a highlighted description snippet; filters are exact matches."""
+    dialect = session.get_bind().dialect.name
+    params = {"limit": limit, "offset": offset}
+    clauses = []
+    for col in FILTER_COLUMNS:
+        if filters.get(col):
+            # the sqlite query joins jobs as j; in postgres the inner query reads jobs directly
+            clauses.append(f"AND {'j.' if dialect == 'sqlite' else ''}{col} = :{col}")
+            params[col] = filters[col]
+    if dialect == "postgresql":
+        sql, params["q"] = PG_SEARCH, q
+    elif dialect == "sqlite":
+        sql, params["q"] = SQLITE_SEARCH, fts5_query(q)
+        if not params["q"]:
+            return []
+    else:
+        raise NotImplementedError(f"full-text search not supported on {dialect}")
+    rows = session.execute(text(sql.format(filters=" ".join(clauses))), params).mappings()
+    return [dict(r, score=float(r["score"])) for r in rows]
+
+
+if __name__ == "__main__":
+    from ai_job_dashboard.db.db import engine
+
+    ensure_fulltext(engine)
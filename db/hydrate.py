@@ -0,0 +1,42 @@
+from sqlalchemy import select
+from ai_job_dashboard.db.models import Job
+from ai_job_dashboard.utils.config import HYDRATE_CACHE_SIZE, HYDRATE_CACHE_TTL
+from ai_job_dashboard.utils.lru import LRUCache
+
+# columns the result lists display; description/raw_data are never loaded here
+SUMMARY_COLUMNS = (Job.id, Job.job_id, Job.title, Job.company, Job.location)
+CHUNK_SIZE = 1000
+
+# keyed by Job.id; entries expire after HYDRATE_CACHE_TTL so writes from other processes show up
+_cache = LRUCache(maxsize=HYDRATE_CACHE_SIZE, ttl=HYDRATE_CACHE_TTL)
+
+
+def hydrate_jobs(session, keys):
+    """
+    Job summaries for Job.id keys (e.g. FAISS hits) in the order given,
+    using one IN query for everything not already cached. Unknown keys are dropped.
+    """
+    found = {}
+    missing = []
+    for k in keys:
+        v = _cache.get(k)
+        if v is None:
+            missing.append(k)
+        else:
+            found[k] = v
+    for start in range(0, len(missing), CHUNK_SIZE):
+        stmt = select(*SUMMARY_COLUMNS).where(Job.id.in_(missing[start:start + CHUNK_SIZE]))
+        for row in session.execute(stmt).mappings():
+            summary = dict(row)
+            found[summary["id"]] = summary
+            _cache.set(summary["id"], summary)
+    return [found[k] for k in keys if k in found]
+
+
+def invalidate(keys=None):
+    """Drop cached summaries for Job.id keys, or everything when keys is None."""
+    if keys is None:
+        _cache.clear()
+        return
+    for k in keys:
+        _cache.pop(k)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, JSON, Float, Text
+from sqlalchemy import Column, Integer, String, Date, DateTime, JSON, Float, Text, LargeBinary, ForeignKey, Index
 from sqlalchemy.sql import func
 from ai_job_dashboard.db.db import Base
 
@@ -20,4 +20,46 @@ class Job(Base):
     description = Column(Text)
     skills = Column(JSON)  # list of skill strings
     raw_data = Column(JSON)  # raw payload
-    created_at = Column(DateTime, server_default=func.now())
+    created_at = Column(DateTime, server_default=func.now(), index=True)  # /jobs keyset order
+    # bumped on every change; the incremental FAISS refresh uses it as a watermark
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), index=True)
+    # last time the detail page was downloaded (even if nothing changed); drives scrape dedup
+    fetched_at = Column(DateTime)
+
+
+class JobEmbedding(Base):
+    """Cached embedding of a job's title + description for one model."""
+    __tablename__ = "job_embeddings"
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    model_name = Column(String, primary_key=True)
+    content_hash = Column(String(64))  # sha256 of the embedded text
+    vector = Column(LargeBinary)  # L2-normalized float32 bytes
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+
+class JobSkill(Base):
+    """One row per (job, skill), with the job's filter dimensions at the time it was counted."""
+    __tablename__ = "job_skills"
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    skill = Column(String, primary_key=True, index=True)
+    source = Column(String, nullable=False, default="")
+    location = Column(String, nullable=False, default="")
+    day = Column(Date, nullable=False)  # posted_date, else the day the job was first scraped
+
+
+class SkillCount(Base):
+    """job_skills rolled up per skill/source/location/day; /skills/top sums this instead of scanning jobs."""
+    __tablename__ = "skill_counts"
+    skill = Column(String, primary_key=True)
+    source = Column(String, primary_key=True)
+    location = Column(String, primary_key=True)
+    day = Column(Date, primary_key=True)
+    count = Column(Integer, nullable=False)
+    __table_args__ = (Index("ix_skill_counts_day", "day"),)
+
+
+class JobDeletion(Base):
+    """Deleted job ids, written by a trigger on jobs (db/schema.py); the FAISS refresh reads them incrementally."""
+    __tablename__ = "job_deletions"
+    job_id = Column(Integer, primary_key=True)  # jobs.id of the deleted row
+    deleted_at = Column(DateTime, server_default=func.now(), nullable=False, index=True)
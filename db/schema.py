@@ -0,0 +1,89 @@
+"""
+Schema upgrades create_all cannot make: columns and indexes added to tables that already exist,
+and the triggers that log deleted jobs into job_deletions and take their skills out of
+skill_counts.
+Idempotent; also run by the ETL's init_db:
+    python -m ai_job_dashboard.db.schema
+"""
+from sqlalchemy import inspect, text
+from ai_job_dashboard.db.models import Job
+from ai_job_dashboard.utils.logger import get_logger
+
+logger = get_logger("Schema")
+
+# jobs columns added after the table first shipped; rows that predate them are left NULL
+# (readers coalesce updated_at/fetched_at with created_at)
+JOB_COLUMNS = ("updated_at", "fetched_at")
+JOB_INDEXES = {"ix_jobs_created_at": "created_at", "ix_jobs_updated_at": "updated_at"}
+
+PG_DELETE_LOG = [
+    """CREATE OR REPLACE FUNCTION jobs_log_delete() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO job_deletions (job_id, deleted_at) VALUES (OLD.id, now())
+        ON CONFLICT (job_id) DO UPDATE SET deleted_at = EXCLUDED.deleted_at;
+        RETURN OLD;
+    END $$ LANGUAGE plpgsql""",
+    "DROP TRIGGER IF EXISTS jobs_log_delete ON jobs",
+    "CREATE TRIGGER jobs_log_delete AFTER DELETE ON jobs FOR EACH ROW EXECUTE FUNCTION jobs_log_delete()",
+]
+
+SQLITE_DELETE_LOG = [
+    """CREATE TRIGGER IF NOT EXISTS jobs_log_delete AFTER DELETE ON jobs BEGIN
+        INSERT OR REPLACE INTO job_deletions (job_id, deleted_at) VALUES (old.id, CURRENT_TIMESTAMP);
+    END""",
+]
+
+# BEFORE DELETE: the job's job_skills rows must still be there to know what to decrement
+# (postgres cascades them in its own AFTER triggers, which fire ahead of ours)
+SKILL_COUNTS_DECREMENT = """
+        UPDATE skill_counts SET count = count - 1 WHERE EXISTS (
+            SELECT 1 FROM job_skills s WHERE s.job_id = {old}.id AND s.skill = skill_counts.skill
+            AND s.source = skill_counts.source AND s.location = skill_counts.location AND s.day = skill_counts.day);
+        DELETE FROM skill_counts WHERE count <= 0
+            AND skill IN (SELECT skill FROM job_skills WHERE job_id = {old}.id);"""
+
+PG_DELETE_SKILLS = [
+    """CREATE OR REPLACE FUNCTION jobs_uncount_skills() RETURNS trigger AS $$
+    BEGIN""" + SKILL_COUNTS_DECREMENT.format(old="OLD") + """
+        RETURN OLD;
+    END $$ LANGUAGE plpgsql""",
+    "DROP TRIGGER IF EXISTS jobs_uncount_skills ON jobs",
+    "CREATE TRIGGER jobs_uncount_skills BEFORE DELETE ON jobs FOR EACH ROW EXECUTE FUNCTION jobs_uncount_skills()",
+]
+
+SQLITE_DELETE_SKILLS = [
+    # sqlite only cascades with PRAGMA foreign_keys on, so drop the job_skills rows here too
+    """CREATE TRIGGER IF NOT EXISTS jobs_uncount_skills BEFORE DELETE ON jobs BEGIN""" +
+    SKILL_COUNTS_DECREMENT.format(old="old") + """
+        DELETE FROM job_skills WHERE job_id = old.id;
+    END""",
+]
+
+
+def ensure_schema(engine):
+    """Add missing jobs columns/indexes and the deletion triggers; expects create_all to have run."""
+    dialect = engine.dialect.name
+    if dialect not in ("postgresql", "sqlite"):
+        raise NotImplementedError(f"schema upgrades not supported on {dialect}")
+    with engine.begin() as conn:
+        existing = {c["name"] for c in inspect(conn).get_columns("jobs")}
+        for name in JOB_COLUMNS:
+            if name not in existing:
+                ddl_type = Job.__table__.c[name].type.compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE jobs ADD COLUMN {name} {ddl_type}"))
+                logger.info(f"Added jobs.{name}")
+        if dialect == "postgresql" and "updated_at" not in existing:
+            # sqlite cannot give an added column a non-constant default; coalesce covers it there
+            conn.execute(text("ALTER TABLE jobs ALTER COLUMN updated_at SET DEFAULT now()"))
+        for index, column in JOB_INDEXES.items():
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index} ON jobs ({column})"))
+        triggers = PG_DELETE_LOG + PG_DELETE_SKILLS if dialect == "postgresql" else SQLITE_DELETE_LOG + SQLITE_DELETE_SKILLS
+        for ddl in triggers:
+            conn.execute(text(ddl))
+
+
+if __name__ == "__main__":
+    from ai_job_dashboard.db.db import Base, engine
+
+    Base.metadata.create_all(bind=engine)
+    ensure_schema(engine)
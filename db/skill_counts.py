@@ -0,0 +1,136 @@
+"""
+Skill counts kept in the database: job_skills (one row per job and skill) and its roll-up
+skill_counts, maintained incrementally by the ETL writer and the skill backfill; deleted jobs are
+taken out by a trigger on jobs (db/schema.py).
+Full rebuild (first deploy, or to correct drift):
+    python -m ai_job_dashboard.db.skill_counts --rebuild
+"""
+import argparse
+import time
+from collections import Counter
+from datetime import date
+from sqlalchemy import select, delete, insert, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from ai_job_dashboard.db.models import Job, JobSkill, SkillCount
+from ai_job_dashboard.utils.logger import get_logger
+
+logger = get_logger("SkillCounts")
+CHUNK_SIZE = 1000
+JOB_COLUMNS = (Job.id, Job.skills, Job.source, Job.location, Job.posted_date, Job.created_at)
+
+
+def _dims(row):
+    seen = row.posted_date or row.created_at
+    return row.source or "", row.location or "", seen.date() if seen else date.today()
+
+
+def _skill_rows(row):
+    source, location, day = _dims(row)
+    return [{"job_id": row.id, "skill": s, "source": source, "location": location, "day": day}
+            for s in sorted(set(row.skills or []))]
+
+
+def _upsert(session):
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return pg_insert(SkillCount)
+    if dialect == "sqlite":
+        return sqlite_insert(SkillCount)
+    raise NotImplementedError(f"skill counts not supported on {dialect}")
+
+
+def _apply(session, delta):
+    changes = [{"skill": k[0], "source": k[1], "location": k[2], "day": k[3], "count": n} for k, n in delta.items() if n]
+    if not changes:
+        return
+    stmt = _upsert(session)
+    stmt = stmt.on_conflict_do_update(index_elements=[SkillCount.skill, SkillCount.source, SkillCount.location, SkillCount.day],
+                                      set_={"count": SkillCount.count + stmt.excluded.count})
+    session.execute(stmt, changes)
+    touched = sorted({c["skill"] for c in changes})
+    for start in range(0, len(touched), CHUNK_SIZE):
+        session.execute(delete(SkillCount).where(SkillCount.skill.in_(touched[start:start + CHUNK_SIZE]),
+                                                 SkillCount.count <= 0))
+
+
+def refresh_job_skills(session, job_ids):
+    """
+    Re-derive job_skills for these Job.ids (after their skills, source, location or date changed)
+    and apply only the difference to skill_counts. Runs in the caller's transaction.
+    """
+    job_ids = sorted(set(job_ids))
+    delta = Counter()
+    for start in range(0, len(job_ids), CHUNK_SIZE):
+        chunk = job_ids[start:start + CHUNK_SIZE]
+        old = session.execute(select(JobSkill.skill, JobSkill.source, JobSkill.location, JobSkill.day)
+                              .where(JobSkill.job_id.in_(chunk)))
+        for r in old:
+            delta[(r.skill, r.source, r.location, r.day)] -= 1
+        new = []
+        for row in session.execute(select(*JOB_COLUMNS).where(Job.id.in_(chunk))):
+            new += _skill_rows(row)
+        for r in new:
+            delta[(r["skill"], r["source"], r["location"], r["day"])] += 1
+        session.execute(delete(JobSkill).where(JobSkill.job_id.in_(chunk)))
+        if new:
+            session.execute(insert(JobSkill), new)
+    _apply(session, delta)
+
+
+def rebuild(session, chunk_size=5000):
+    """Recompute both tables from jobs.skills in one transaction."""
+    t0 = time.perf_counter()
+    session.execute(delete(SkillCount))
+    session.execute(delete(JobSkill))
+    last_id = 0
+    n_rows = 0
+    while True:
+        rows = session.execute(select(*JOB_COLUMNS).where(Job.id > last_id).order_by(Job.id).limit(chunk_size)).all()
+        if not rows:
+            break
+        new = [r for row in rows for r in _skill_rows(row)]
+        if new:
+            session.execute(insert(JobSkill), new)
+        n_rows += len(new)
+        last_id = rows[-1].id
+    dims = (JobSkill.skill, JobSkill.source, JobSkill.location, JobSkill.day)
+    session.execute(insert(SkillCount).from_select(
+        ["skill", "source", "location", "day", "count"],
+        select(*dims, func.count()).group_by(*dims)))
+    session.commit()
+    logger.info(f"Rebuilt skill counts from {n_rows} job skills in {time.perf_counter() - t0:.1f}s")
+    return n_rows
+
+
+def top_skills(session, limit=20, source=None, location=None, since=None, until=None):
+    """Most frequent skills over the whole corpus, optionally filtered; since/until are inclusive dates."""
+    total = func.sum(SkillCount.count).label("count")
+    stmt = select(SkillCount.skill, total).group_by(SkillCount.skill).order_by(total.desc(), SkillCount.skill)
+    if source:
+        stmt = stmt.where(SkillCount.source == source)
+    if location:
+        stmt = stmt.where(SkillCount.location == location)
+    if since:
+        stmt = stmt.where(SkillCount.day >= since)
+    if until:
+        stmt = stmt.where(SkillCount.day <= until)
+    if limit:
+        stmt = stmt.limit(limit)
+    return [{"skill": r.skill, "count": int(r.count)} for r in session.execute(stmt)]
+
+
+if __name__ == "__main__":
+    from ai_job_dashboard.db.db import get_session
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rebuild", action="store_true")
+    args = parser.parse_args()
+    session = get_session()
+    try:
+        if args.rebuild:
+            rebuild(session)
+        for r in top_skills(session, limit=20):
+            print(f"{r['skill']:<30}{r['count']:>8}")
+    finally:
+        session.close()
@@ -0,0 +1,87 @@
+"""
+Compare embedding backends on stored job descriptions: cold start, texts/sec, peak RSS
+and cosine agreement with the full-precision SentenceTransformer.
+Usage:
+    python -m ai_job_dashboard.ml.bench_embeddings --backends torch,int8,onnx,onnx-int8 --limit 2000
+"""
+import argparse
+import multiprocessing
+import resource
+import time
+import numpy as np
+from sqlalchemy import select
+from ai_job_dashboard.db.db import get_session
+from ai_job_dashboard.db.models import Job
+from ai_job_dashboard.utils.logger import get_logger
+
+logger = get_logger("bench_embeddings")
+
+
+def sample_texts(limit):
+    session = get_session()
+    try:
+        stmt = select(Job.title, Job.description).where(Job.description.isnot(None)).order_by(Job.id).limit(limit)
+        return [(t or "") + " " + (d or "") for t, d in session.execute(stmt)]
+    finally:
+        session.close()
+
+
+def _measure(backend, texts, batch_size, conn):
+    # runs in a fresh process so cold start and RSS are not shared between backends
+    from ai_job_dashboard.ml.embeddings import load_model
+
+    t0 = time.perf_counter()
+    model = load_model(backend)
+    model.encode(texts[:1], show_progress_bar=False, convert_to_numpy=True)
+    cold = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    emb = model.encode(texts, batch_size=batch_size, show_progress_bar=False, convert_to_numpy=True)
+    elapsed = time.perf_counter() - t0
+    # ru_maxrss is in KB on Linux
+    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    conn.send({"cold_s": cold, "texts_per_s": len(texts) / elapsed, "rss_mb": rss_mb,
+               "emb": np.asarray(emb, dtype='float32')})
+    conn.close()
+
+
+def measure(backend, texts, batch_size):
+    ctx = multiprocessing.get_context("spawn")
+    parent, child = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_measure, args=(backend, texts, batch_size, child))
+    proc.start()
+    result = parent.recv()
+    proc.join()
+    return result
+
+
+def cosine_rows(a, b):
+    a = a / np.linalg.norm(a, axis=1, keepdims=True)
+    b = b / np.linalg.norm(b, axis=1, keepdims=True)
+    return (a * b).sum(axis=1)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backends", default="torch,int8,onnx,onnx-int8")
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+    texts = sample_texts(args.limit)
+    if not texts:
+        logger.error("No job descriptions in the DB to benchmark on.")
+        return
+    backends = args.backends.split(",")
+    if "torch" not in backends:
+        backends.insert(0, "torch")  # reference for the agreement column
+    results = {b: measure(b, texts, args.batch_size) for b in backends}
+    ref = results["torch"]["emb"]
+    print(f"\n{len(texts)} stored job texts, batch size {args.batch_size}")
+    print(f"{'backend':<12}{'cold s':>8}{'texts/s':>10}{'RSS MB':>9}{'cos mean':>10}{'cos min':>9}")
+    for b, r in results.items():
+        cos = cosine_rows(ref, r["emb"])
+        print(f"{b:<12}{r['cold_s']:>8.2f}{r['texts_per_s']:>10.1f}{r['rss_mb']:>9.0f}"
+              f"{cos.mean():>10.4f}{cos.min():>9.4f}")
+
+
+if __name__ == '__main__':
+    main()
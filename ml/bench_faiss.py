@@ -0,0 +1,158 @@
+"""
+Recall / latency / memory benchmark for the FAISS index types on a synthetic corpus.
+Usage:
+    python -m ai_job_dashboard.ml.bench_faiss --n 100000 --types flat,ivf_flat,ivf_pq,hnsw
+    python -m ai_job_dashboard.ml.bench_faiss --n 5000000 --types ivf_pq --nprobe 8,32,128
+    python -m ai_job_dashboard.ml.bench_faiss --selectivity 1,0.1,0.01,0.001   # filtered searches
+"""
+import argparse
+import time
+import numpy as np
+import faiss
+from ai_job_dashboard.ml.faiss_index import make_index, search_index, search_filtered
+from ai_job_dashboard.utils.logger import get_logger
+
+logger = get_logger("bench_faiss")
+
+
+def synthetic_corpus(n, dim, n_clusters=1000, seed=0, chunk=200000):
+    """Clustered, L2-normalized vectors; roughly the shape of sentence embeddings."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((n_clusters, dim)).astype('float32')
+    out = np.empty((n, dim), dtype='float32')
+    for start in range(0, n, chunk):
+        stop = min(n, start + chunk)
+        assign = rng.integers(0, n_clusters, stop - start)
+        out[start:stop] = centers[assign] + 0.5 * rng.standard_normal((stop - start, dim)).astype('float32')
+    faiss.normalize_L2(out)
+    return out
+
+
+def exact_filtered(corpus, queries, allowed, k, chunk=256):
+    """Exact top-k ids among ``allowed`` (ids are corpus positions here), batched over queries."""
+    sub = corpus[allowed]
+    out = np.empty((len(queries), k), dtype='int64')
+    for start in range(0, len(queries), chunk):
+        scores = queries[start:start + chunk] @ sub.T
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top = np.take_along_axis(top, np.argsort(-np.take_along_axis(scores, top, 1), axis=1), 1)
+        out[start:start + chunk] = allowed[top]
+    return out
+
+
+def recall_at_k(found, truth, k):
+    hits = sum(len(set(f[:k]) & set(t[:k])) for f, t in zip(found, truth))
+    return hits / float(len(truth) * k)
+
+
+def run_queries(index, queries, k, kwargs):
+    """One query per call, like the API does; returns labels and per-query latencies in ms."""
+    labels = np.empty((len(queries), k), dtype='int64')
+    lat = np.empty(len(queries))
+    for i, q in enumerate(queries):
+        q = q.reshape(1, -1)
+        t0 = time.perf_counter()
+        _, I = search_index(index, q, k, **kwargs)
+        lat[i] = (time.perf_counter() - t0) * 1000
+        labels[i] = I[0]
+    return labels, lat
+
+
+def run_filtered_queries(index, queries, k, allowed, kwargs):
+    """Like run_queries, restricted to the ``allowed`` keys through search_filtered()."""
+    labels = np.empty((len(queries), k), dtype='int64')
+    lat = np.empty(len(queries))
+    for i, q in enumerate(queries):
+        t0 = time.perf_counter()
+        _, I = search_filtered(index, q.reshape(1, -1), k, allowed, **kwargs)
+        lat[i] = (time.perf_counter() - t0) * 1000
+        labels[i] = I[0]
+    return labels, lat
+
+
+def index_bytes(index):
+    return faiss.serialize_index(index).nbytes
+
+
+def bench(n, dim, n_queries, k, types, nprobes, efs, train_size, selectivities=(1.0,)):
+    corpus = synthetic_corpus(n, dim)
+    queries = synthetic_corpus(n_queries, dim, seed=1)
+    ids = np.arange(n, dtype='int64')
+
+    # exact ground truth from a flat scan, batched
+    flat = make_index(corpus, kind="flat")
+    flat.add_with_ids(corpus, ids)
+    _, truth = flat.search(queries, k)
+    # a random subset of the corpus per selectivity, with its own exact ground truth
+    rng = np.random.default_rng(2)
+    subsets = {}
+    for s in selectivities:
+        if s < 1:
+            allowed = np.sort(rng.choice(ids, max(k, int(n * s)), replace=False))
+            subsets[s] = allowed, exact_filtered(corpus, queries, allowed, k)
+
+    rows = []
+    for kind in types:
+        t0 = time.perf_counter()
+        index = flat if kind == "flat" else make_index(corpus, kind=kind, train_size=train_size)
+        if kind != "flat":
+            index.add_with_ids(corpus, ids)
+        build_s = time.perf_counter() - t0
+        mem_mb = index_bytes(index) / 1e6
+        if kind in ("ivf_flat", "ivf_pq"):
+            settings = [("nprobe", v, {"nprobe": v}) for v in nprobes]
+        elif kind == "hnsw":
+            settings = [("efSearch", v, {"ef_search": v}) for v in efs]
+        else:
+            settings = [("-", "-", {})]
+        for name, value, kwargs in settings:
+            for s in selectivities:
+                if s < 1:
+                    allowed, filtered_truth = subsets[s]
+                    found, lat = run_filtered_queries(index, queries, k, allowed, kwargs)
+                else:
+                    filtered_truth = truth
+                    found, lat = run_queries(index, queries, k, kwargs)
+                rows.append({
+                    "type": kind, "param": f"{name}={value}", "sel": s,
+                    "recall": recall_at_k(found, filtered_truth, k),
+                    "p50_ms": float(np.percentile(lat, 50)), "p99_ms": float(np.percentile(lat, 99)),
+                    "mem_mb": mem_mb, "build_s": build_s,
+                })
+    return rows
+
+
+def print_table(rows, n, dim, k):
+    print(f"\nn={n} dim={dim} recall@{k} vs flat")
+    print(f"{'type':<10}{'param':<16}{'filter':>8}{'recall':>8}{'p50 ms':>10}{'p99 ms':>10}{'mem MB':>10}{'build s':>10}")
+    for r in rows:
+        print(f"{r['type']:<10}{r['param']:<16}{r['sel']:>8g}{r['recall']:>8.3f}{r['p50_ms']:>10.3f}"
+              f"{r['p99_ms']:>10.3f}{r['mem_mb']:>10.1f}{r['build_s']:>10.1f}")
+
+
+def _ints(s):
+    return [int(x) for x in s.split(",") if x]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=100000)
+    parser.add_argument("--dim", type=int, default=384)  # all-MiniLM-L6-v2
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--types", default="flat,ivf_flat,ivf_pq,hnsw")
+    parser.add_argument("--nprobe", default="1,8,32,128")
+    parser.add_argument("--ef", default="16,64,256")
+    parser.add_argument("--train-size", type=int, default=100000)
+    # fraction of the corpus a filter lets through; 1 is an unfiltered search
+    parser.add_argument("--selectivity", default="1")
+    args = parser.parse_args()
+    logger.info(f"Benchmarking {args.types} on {args.n} synthetic vectors")
+    rows = bench(args.n, args.dim, args.queries, args.k, args.types.split(","),
+                 _ints(args.nprobe), _ints(args.ef), args.train_size,
+                 [float(x) for x in args.selectivity.split(",") if x])
+    print_table(rows, args.n, args.dim, args.k)
+
+
+if __name__ == '__main__':
+    main()
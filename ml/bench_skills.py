@@ -0,0 +1,106 @@
+"""
+Skill extraction throughput: compiled single-pass matcher vs. one regex per skill.
+Usage:
+    python -m ai_job_dashboard.ml.bench_skills --skills 5000 --docs 2000
+    python -m ai_job_dashboard.ml.bench_skills --skills 5000 --from-db
+"""
+import argparse
+import random
+import re
+import string
+import time
+from ai_job_dashboard.ml.skill_extraction import SKILL_TAXONOMY, SkillMatcher
+from ai_job_dashboard.utils.logger import get_logger
+
+logger = get_logger("bench_skills")
+
+
+def synthetic_taxonomy(n_skills, seed=0):
+    """The shipped taxonomy padded with made-up one/two-word skills up to n_skills."""
+    rng = random.Random(seed)
+    taxonomy = dict(SKILL_TAXONOMY)
+    while len(taxonomy) < n_skills:
+        words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(rng.randint(1, 2))]
+        taxonomy.setdefault(" ".join(words), [])
+    return taxonomy
+
+
+def synthetic_docs(taxonomy, n_docs, words_per_doc=600, seed=1):
+    """~4KB job descriptions with a few dozen skills mixed into filler text."""
+    rng = random.Random(seed)
+    skills = list(taxonomy)
+    filler = ["experience", "with", "team", "build", "and", "the", "data", "of", "strong", "our",
+              "work", "in", "to", "you", "will", "platform", "years", "skills", "models", "product"]
+    docs = []
+    for _ in range(n_docs):
+        words = [rng.choice(filler) for _ in range(words_per_doc)]
+        for _ in range(30):
+            words[rng.randrange(words_per_doc)] = rng.choice(skills)
+        docs.append(" ".join(words).capitalize() + ".")
+    return docs
+
+
+def db_docs(limit):
+    from ai_job_dashboard.db.db import get_session
+    from ai_job_dashboard.db.models import Job
+
+    session = get_session()
+    try:
+        rows = session.query(Job.description).filter(Job.description.isnot(None)).limit(limit).all()
+        return [r[0] for r in rows]
+    finally:
+        session.close()
+
+
+def legacy_extract(text, skills):
+    # the previous implementation: one re.search per dictionary entry, patterns rebuilt each call
+    text_lower = (text or "").lower()
+    found = set()
+    for skill in skills:
+        pattern = r'\b' + re.escape(skill.lower()) + r's?\b'
+        if re.search(pattern, text_lower):
+            found.add(skill)
+    return sorted(found)
+
+
+def _rate(fn, docs):
+    t0 = time.perf_counter()
+    for d in docs:
+        fn(d)
+    elapsed = time.perf_counter() - t0
+    mb = sum(len(d) for d in docs) / 1e6
+    return len(docs) / elapsed, mb / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--skills", type=int, default=5000)
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--from-db", action="store_true")
+    parser.add_argument("--legacy-docs", type=int, default=50, help="docs for the slow per-skill loop")
+    args = parser.parse_args()
+
+    taxonomy = synthetic_taxonomy(args.skills)
+    docs = db_docs(args.docs) if args.from_db else synthetic_docs(taxonomy, args.docs)
+    if not docs:
+        logger.error("No documents to benchmark on.")
+        return
+    t0 = time.perf_counter()
+    matcher = SkillMatcher(taxonomy)
+    build_s = time.perf_counter() - t0
+    n_terms = len(matcher.canonical)
+
+    new_docs, new_mb = _rate(matcher.find, docs)
+    skills = list(taxonomy)
+    old_docs, old_mb = _rate(lambda d: legacy_extract(d, skills), docs[:args.legacy_docs])
+    avg_len = sum(len(d) for d in docs) / len(docs)
+    print(f"\n{len(taxonomy)} skills ({n_terms} terms incl. aliases), {len(docs)} docs, avg {avg_len:.0f} chars")
+    print(f"matcher build: {build_s * 1000:.0f} ms")
+    print(f"{'extractor':<12}{'docs/s':>10}{'MB/s':>8}")
+    print(f"{'compiled':<12}{new_docs:>10.1f}{new_mb:>8.2f}")
+    print(f"{'per-skill':<12}{old_docs:>10.1f}{old_mb:>8.2f}")
+    print(f"speedup: {new_docs / old_docs:.0f}x")
+
+
+if __name__ == '__main__':
+    main()
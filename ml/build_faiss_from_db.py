@@ -1,23 +1,106 @@
-from ai_job_dashboard.db.db import get_session
-from ai_job_dashboard.db.models import Job
-from ai_job_dashboard.ml.faiss_index import build_index
-from ai_job_dashboard.nlp.embeddings import get_model
+"""
+Build or refresh the FAISS job index from the DB.
+Usage:
+    python -m ai_job_dashboard.ml.build_faiss_from_db              # full rebuild
+    python -m ai_job_dashboard.ml.build_faiss_from_db --incremental
+"""
+import argparse
+from sqlalchemy import select, func, or_, and_, delete
+from ai_job_dashboard.db.db import get_session, timestamp_param
+from ai_job_dashboard.db.models import Job, JobDeletion
+from ai_job_dashboard.ml.faiss_index import build_index, update_index, current_meta
+from ai_job_dashboard.ml.embedding_store import get_vectors
 from ai_job_dashboard.utils.logger import get_logger
 
 logger = get_logger("build_faiss")
 
-def main(limit=5000):
-    session = get_session()
-    rows = session.query(Job).limit(limit).all()
-    texts = []
-    ids = []
-    for j in rows:
-        texts.append((j.title or "") + " " + (j.description or ""))
-        ids.append(j.job_id)
-    if not texts:
+# rows touched since the last run; created_at covers rows written before updated_at existed
+CHANGED_AT = func.coalesce(Job.updated_at, Job.created_at)
+# stored with the index so searches can filter on them (posted_date falls back to created_at)
+ATTRIBUTE_COLUMNS = (Job.location, Job.source, Job.salary_min, Job.salary_max, Job.posted_date, Job.created_at)
+
+
+def _collect(session, rows):
+    """Vectors come from the embedding store; only jobs whose text changed are encoded."""
+    ids, keys, skills, attributes = [], [], [], []
+    watermark = None
+    for r in rows:
+        ids.append(r.job_id)
+        keys.append(r.id)
+        skills.append(r.skills or [])
+        attributes.append((r.location, r.source, r.salary_min, r.salary_max, r.posted_date or r.created_at))
+        # (changed_at, id): the position of the newest row read, in _job_rows' keyset order
+        if r.changed_at is not None and (watermark is None or (r.changed_at, r.id) > watermark):
+            watermark = (r.changed_at, r.id)
+    emb = get_vectors(session, [(r.id, r.title, r.description) for r in rows]) if rows else None
+    return emb, ids, keys, skills, attributes, watermark
+
+
+def _job_rows(session, since=None, limit=None):
+    stmt = select(Job.id, Job.job_id, Job.title, Job.description, Job.skills, *ATTRIBUTE_COLUMNS,
+                  CHANGED_AT.label("changed_at")).order_by(Job.id)
+    if since is not None:
+        # strictly after the watermark row; ties on changed_at are broken by id
+        changed_at = timestamp_param(since[0], session.get_bind().dialect.name)
+        stmt = stmt.where(or_(CHANGED_AT > changed_at, and_(CHANGED_AT == changed_at, Job.id > since[1])))
+    if limit:
+        stmt = stmt.limit(limit)
+    return session.execute(stmt).all()
+
+
+def full_rebuild(session, limit=None):
+    emb, ids, keys, skills, attributes, watermark = _collect(session, _job_rows(session, limit=limit))
+    if not ids:
         logger.error("No jobs to index.")
-        return
-    build_index(texts, ids)
+        return None
+    return build_index(None, ids, keys=keys, watermark=watermark, emb=emb, skills=skills,
+                       attributes=attributes)
+
+
+def _deleted_keys(session, since):
+    """Keys logged by the jobs delete trigger since the watermark; older entries are pruned."""
+    deleted_at = timestamp_param(since, session.get_bind().dialect.name)
+    keys = set(session.execute(select(JobDeletion.job_id).where(JobDeletion.deleted_at >= deleted_at)).scalars())
+    # sqlite can hand a deleted id to a new row; that key is live again
+    keys -= set(session.execute(select(Job.id).where(Job.id.in_(keys))).scalars()) if keys else set()
+    # anything older was already applied to the generation that set this watermark
+    session.execute(delete(JobDeletion).where(JobDeletion.deleted_at < deleted_at))
+    session.commit()
+    return sorted(keys)
+
+
+def incremental_refresh(session):
+    meta = current_meta()
+    if meta is None or not isinstance(meta.get("watermark"), tuple):
+        # generations before (changed_at, id) watermarks also predate the deletion log
+        logger.info("No indexed watermark found; falling back to a full rebuild.")
+        return full_rebuild(session)
+    emb, ids, keys, skills, attributes, watermark = _collect(session, _job_rows(session, since=meta["watermark"]))
+    removed = [k for k in _deleted_keys(session, meta["watermark"][0]) if k in meta["ids"]]
+    if not keys and not removed:
+        logger.info("FAISS index already up to date.")
+        return None
+    try:
+        return update_index(None, ids, keys, remove_keys=removed, watermark=watermark, emb=emb, skills=skills,
+                            attributes=attributes)
+    except NotImplementedError:
+        logger.info("Live index type cannot delete in place; doing a full rebuild.")
+        return full_rebuild(session)
+
+
+def main(limit=None, incremental=False):
+    session = get_session()
+    try:
+        if incremental:
+            return incremental_refresh(session)
+        return full_rebuild(session, limit=limit)
+    finally:
+        session.close()
+
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--incremental", action="store_true")
+    parser.add_argument("--limit", type=int, default=None)
+    args = parser.parse_args()
+    main(limit=args.limit, incremental=args.incremental)
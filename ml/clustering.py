@@ -1,21 +1,30 @@
 from sklearn.cluster import KMeans
 from sklearn.decomposition import PCA
 from ai_job_dashboard.nlp.embeddings import embed_texts
+from ai_job_dashboard.ml.embedding_store import get_vectors
 import numpy as np
 from ai_job_dashboard.utils.logger import get_logger
 
 logger = get_logger("Clustering")
 
-def cluster_job_descriptions(descriptions, n_clusters=8):
-    if not descriptions:
+def cluster_job_descriptions(descriptions, n_clusters=8, embeddings=None):
+    if not descriptions and embeddings is None:
         return []
-    embeddings = embed_texts(descriptions)
+    if embeddings is None:
+        embeddings = embed_texts(descriptions)
     # optional dimensionality reduction for stability
     if embeddings.shape[1] > 50:
         pca = PCA(n_components=50)
         emb = pca.fit_transform(embeddings)
     else:
         emb = embeddings
-    kmeans = KMeans(n_clusters=min(n_clusters, len(descriptions)), random_state=42)
+    kmeans = KMeans(n_clusters=min(n_clusters, len(embeddings)), random_state=42)
     labels = kmeans.fit_predict(emb)
     return labels, embeddings
+
+def cluster_jobs(session, jobs, n_clusters=8):
+    """Cluster Job rows using stored embeddings; only jobs with changed text are re-encoded."""
+    if not jobs:
+        return []
+    embeddings = get_vectors(session, [(j.id, j.title, j.description) for j in jobs])
+    return cluster_job_descriptions(None, n_clusters=n_clusters, embeddings=embeddings)
@@ -0,0 +1,43 @@
+import hashlib
+import numpy as np
+from ai_job_dashboard.nlp.embeddings import MODEL_ID
+from ai_job_dashboard.utils.config import EMBED_CACHE_SIZE, EMBED_CACHE_TTL
+from ai_job_dashboard.utils.lru import LRUCache
+from ai_job_dashboard.utils.redis_client import get_bytes, set_bytes
+from ai_job_dashboard.utils import metrics
+
+_local = LRUCache(maxsize=EMBED_CACHE_SIZE)
+
+
+def normalize_text(text):
+    # the model's tokenizer is uncased and whitespace-insensitive, so these map to one embedding
+    return " ".join((text or "").lower().split())
+
+
+def cache_key(text, model_name=MODEL_ID):
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"emb:{model_name}:{digest}"
+
+
+def get(text, model_name=MODEL_ID):
+    """Cached float32 embedding for ``text`` (LRU, then redis), or None."""
+    key = cache_key(text, model_name)
+    vec = _local.get(key)
+    if vec is not None:
+        metrics.inc("embed_cache_hits_total", tier="local")
+        return vec
+    raw = get_bytes(key)
+    if raw:
+        vec = np.frombuffer(raw, dtype='float32')
+        _local.set(key, vec)
+        metrics.inc("embed_cache_hits_total", tier="redis")
+        return vec
+    metrics.inc("embed_cache_misses_total")
+    return None
+
+
+def put(text, vec, model_name=MODEL_ID):
+    key = cache_key(text, model_name)
+    vec = np.ascontiguousarray(vec, dtype='float32')
+    _local.set(key, vec)
+    set_bytes(key, vec.tobytes(), ex=EMBED_CACHE_TTL)
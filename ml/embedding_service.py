@@ -0,0 +1,108 @@
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+import numpy as np
+from ai_job_dashboard.nlp.embeddings import get_model
+from ai_job_dashboard.utils.config import EMBED_BATCHING, EMBED_MAX_BATCH, EMBED_MAX_WAIT_MS
+from ai_job_dashboard.utils.logger import get_logger
+from ai_job_dashboard.utils import metrics
+
+logger = get_logger("EmbeddingService")
+
+
+class BatchingEncoder:
+    """
+    Collects encode requests from many threads/coroutines for up to ``max_wait_ms``
+    (or until ``max_batch`` texts are waiting) and runs them as a single model.encode call.
+    """
+
+    def __init__(self, max_batch=EMBED_MAX_BATCH, max_wait_ms=EMBED_MAX_WAIT_MS):
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+                    self._thread.start()
+
+    def submit(self, text):
+        self._ensure_started()
+        fut = Future()
+        self._queue.put((text, fut, time.perf_counter()))
+        return fut
+
+    def encode(self, texts):
+        futures = [self.submit(t) for t in texts]
+        return np.vstack([f.result() for f in futures])
+
+    async def encode_async(self, text):
+        return await asyncio.wrap_future(self.submit(text))
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            # callers that timed out cancel their future; skip their texts
+            batch = [item for item in self._collect() if item[1].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            started = time.perf_counter()
+            try:
+                emb = get_model().encode([t for t, _, _ in batch], show_progress_bar=False, convert_to_numpy=True)
+            except Exception as e:
+                logger.exception("batch encode failed")
+                for _, fut, _ in batch:
+                    fut.set_exception(e)
+                continue
+            done = time.perf_counter()
+            for (_, fut, enqueued), vec in zip(batch, emb):
+                fut.set_result(vec)
+                # time spent waiting for the batch to fill and for earlier batches to finish
+                metrics.inc("embed_queue_wait_ms_sum", (started - enqueued) * 1000)
+            metrics.inc("embed_texts_total", len(batch))
+            metrics.inc("embed_batches_total")
+            metrics.set_gauge("embed_last_batch_size", len(batch))
+            metrics.set_gauge("embed_texts_per_sec", len(batch) / max(done - started, 1e-9))
+
+
+_encoder = None
+
+
+def get_encoder():
+    global _encoder
+    if _encoder is None:
+        _encoder = BatchingEncoder()
+    return _encoder
+
+
+def encode(texts):
+    """Encode a few query texts, batched with whatever other requests are in flight."""
+    if not EMBED_BATCHING:
+        return get_model().encode(texts, show_progress_bar=False, convert_to_numpy=True)
+    return get_encoder().encode(texts)
+
+
+async def encode_async(text):
+    """Single-text encode for coroutines; never blocks the event loop."""
+    if not EMBED_BATCHING:
+        loop = asyncio.get_running_loop()
+        return (await loop.run_in_executor(None, encode, [text]))[0]
+    return await get_encoder().encode_async(text)
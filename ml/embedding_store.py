@@ -0,0 +1,81 @@
+import hashlib
+import numpy as np
+from sqlalchemy import select
+from ai_job_dashboard.db.models import JobEmbedding
+from ai_job_dashboard.nlp.embeddings import embed_texts, MODEL_ID
+from ai_job_dashboard.utils.logger import get_logger
+
+logger = get_logger("EmbeddingStore")
+CHUNK_SIZE = 1000
+
+
+def job_text(title, description):
+    return (title or "") + " " + (description or "")
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _normalize(emb):
+    emb = np.asarray(emb, dtype='float32')
+    norms = np.linalg.norm(emb, axis=1, keepdims=True)
+    return emb / np.maximum(norms, 1e-12)
+
+
+def _stored(session, keys, model_name):
+    stmt = select(JobEmbedding).where(JobEmbedding.job_id.in_(keys), JobEmbedding.model_name == model_name)
+    return {e.job_id: e for e in session.execute(stmt).scalars()}
+
+
+def get_vectors(session, rows, model_name=MODEL_ID):
+    """
+    rows: iterable of (Job.id, title, description).
+    Returns an (n, dim) float32 array aligned with rows; only rows whose text hash
+    changed (or that were never embedded) go through the model.
+    """
+    rows = list(rows)
+    out = [None] * len(rows)
+    encoded = 0
+    for start in range(0, len(rows), CHUNK_SIZE):
+        chunk = rows[start:start + CHUNK_SIZE]
+        stored = _stored(session, [r[0] for r in chunk], model_name)
+        todo, texts, hashes = [], [], []
+        for i, (key, title, description) in enumerate(chunk):
+            text = job_text(title, description)
+            h = content_hash(text)
+            e = stored.get(key)
+            if e is not None and e.content_hash == h:
+                out[start + i] = np.frombuffer(e.vector, dtype='float32')
+            else:
+                todo.append(i)
+                texts.append(text)
+                hashes.append(h)
+        if not todo:
+            continue
+        emb = _normalize(embed_texts(texts))
+        for i, h, vec in zip(todo, hashes, emb):
+            key = chunk[i][0]
+            e = stored.get(key)
+            if e is None:
+                session.add(JobEmbedding(job_id=key, model_name=model_name, content_hash=h, vector=vec.tobytes()))
+            else:
+                e.content_hash = h
+                e.vector = vec.tobytes()
+            out[start + i] = vec
+        session.commit()
+        encoded += len(todo)
+    logger.info(f"Embeddings: {len(rows) - encoded} reused, {encoded} encoded")
+    if not out:
+        return np.empty((0, 0), dtype='float32')
+    return np.vstack(out)
+
+
+def load_vectors(session, keys, model_name=MODEL_ID):
+    """Stored vectors for Job.id keys, without any inference. Missing keys are omitted."""
+    out = {}
+    keys = list(keys)
+    for start in range(0, len(keys), CHUNK_SIZE):
+        for key, e in _stored(session, keys[start:start + CHUNK_SIZE], model_name).items():
+            out[key] = np.frombuffer(e.vector, dtype='float32')
+    return out
@@ -1,16 +1,33 @@
 from sentence_transformers import SentenceTransformer
+from ai_job_dashboard.utils.config import EMBEDDING_BACKEND
 from ai_job_dashboard.utils.logger import get_logger
 
 logger = get_logger("Embeddings")
 MODEL_NAME = "all-MiniLM-L6-v2"
+# stored/cached vectors are keyed by this, so switching backends never mixes their outputs
+MODEL_ID = MODEL_NAME if EMBEDDING_BACKEND == "torch" else f"{MODEL_NAME}:{EMBEDDING_BACKEND}"
 
 model = None
 
+def load_model(backend=EMBEDDING_BACKEND, model_name=MODEL_NAME):
+    """Any backend returns an object with SentenceTransformer's encode() signature."""
+    if backend == "torch":
+        return SentenceTransformer(model_name)
+    if backend == "int8":
+        import torch
+        st = SentenceTransformer(model_name, device="cpu")
+        # int8 weights for every Linear layer, activations quantized on the fly
+        return torch.quantization.quantize_dynamic(st, {torch.nn.Linear}, dtype=torch.qint8)
+    if backend in ("onnx", "onnx-int8"):
+        from ai_job_dashboard.ml.onnx_encoder import OnnxEncoder
+        return OnnxEncoder(model_name, quantize=backend == "onnx-int8")
+    raise ValueError(f"Unknown embedding backend: {backend}")
+
 def get_model():
     global model
     if model is None:
-        logger.info(f"Loading embedding model {MODEL_NAME}...")
-        model = SentenceTransformer(MODEL_NAME)
+        logger.info(f"Loading embedding model {MODEL_NAME} ({EMBEDDING_BACKEND})...")
+        model = load_model()
     return model
 
 def embed_texts(texts):
@@ -1,41 +1,562 @@
 import os
+import glob
+import time
+import threading
+import weakref
 import numpy as np
 import faiss
 import joblib
 from ai_job_dashboard.nlp.embeddings import get_model
+from ai_job_dashboard.ml import embedding_service, embedding_cache
+from ai_job_dashboard.ml.skill_matrix import build_skill_matrix, merge_skill_matrix
+from ai_job_dashboard.ml.job_filters import build_attributes, merge_attributes, matching_keys
+from ai_job_dashboard.utils.config import (
+    FAISS_INDEX_DIR, FAISS_MMAP, FAISS_RELOAD_INTERVAL, FAISS_KEEP_GENERATIONS,
+    FAISS_INDEX_TYPE, FAISS_NLIST, FAISS_PQ_M, FAISS_HNSW_M, FAISS_TRAIN_SIZE, FAISS_NPROBE, FAISS_EF_SEARCH,
+    FAISS_NEIGHBORS, FAISS_FILTER_EXACT_MAX,
+)
 from ai_job_dashboard.utils.logger import get_logger
+from ai_job_dashboard.utils import metrics
 
 logger = get_logger("FaissIndex")
-INDEX_PATH = "models/faiss_index.bin"
-META_PATH = "models/faiss_meta.joblib"
+# every build is published as a new generation; CURRENT_PATH points at the live one
+INDEX_PATH = os.path.join(FAISS_INDEX_DIR, "faiss_index.{generation}.bin")
+META_PATH = os.path.join(FAISS_INDEX_DIR, "faiss_meta.{generation}.joblib")
+CURRENT_PATH = os.path.join(FAISS_INDEX_DIR, "faiss_current")
 
-def build_index(texts, ids, dim=None):
+
+def current_generation():
+    try:
+        with open(CURRENT_PATH, "r") as f:
+            return int(f.read().strip())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _atomic_write(path, write_fn):
+    tmp = f"{path}.tmp{os.getpid()}"
+    write_fn(tmp)
+    os.replace(tmp, path)
+
+
+def _write_text(path, text):
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def publish(index, meta):
+    """Write index + meta as a new generation, then flip the pointer file."""
+    os.makedirs(FAISS_INDEX_DIR, exist_ok=True)
+    generation = (current_generation() or 0) + 1
+    _atomic_write(INDEX_PATH.format(generation=generation), lambda p: faiss.write_index(index, p))
+    _atomic_write(META_PATH.format(generation=generation), lambda p: joblib.dump(meta, p))
+    # the pointer is written last so readers never see a half-published pair
+    _atomic_write(CURRENT_PATH, lambda p: _write_text(p, str(generation)))
+    _prune(generation)
+    logger.info(f"Published FAISS generation {generation} with {index.ntotal} vectors")
+    return generation
+
+
+def _prune(generation):
+    # open (or mmapped) files stay readable after unlink, so in-flight readers are safe
+    keep = generation - FAISS_KEEP_GENERATIONS
+    for path in glob.glob(os.path.join(FAISS_INDEX_DIR, "faiss_*.*.*")):
+        try:
+            gen = int(path.rsplit(".", 2)[-2])
+        except ValueError:
+            continue
+        if gen <= keep:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+class IndexSnapshot:
+    """An immutable (index, meta) pair; requests keep a reference for their whole lifetime."""
+
+    __slots__ = ("index", "meta", "generation", "_keys")
+
+    def __init__(self, index, meta, generation):
+        self.index = index
+        self.meta = meta
+        self.generation = generation
+        self._keys = None
+
+    @property
+    def ids(self):
+        return self.meta["ids"]
+
+    def key_for(self, job_id):
+        """FAISS key (Job.id) for a public job id, or None if it is not indexed."""
+        if self._keys is None:
+            self._keys = {v: k for k, v in self.ids.items()}
+        return self._keys.get(job_id)
+
+
+def index_description(kind, n, dim, nlist=FAISS_NLIST, pq_m=FAISS_PQ_M, hnsw_m=FAISS_HNSW_M):
+    """faiss.index_factory string for one of flat | ivf_flat | ivf_pq | hnsw."""
+    if kind == "flat":
+        return "Flat"
+    if kind in ("ivf_flat", "ivf_pq"):
+        # ~4*sqrt(n) lists, but never more than the corpus can train (faiss wants ~39 points per list)
+        nlist = nlist or int(4 * np.sqrt(max(n, 1)))
+        nlist = max(1, min(nlist, n // 39 or 1))
+        if kind == "ivf_flat":
+            return f"IVF{nlist},Flat"
+        if dim % pq_m:
+            raise ValueError(f"PQ sub-quantizers ({pq_m}) must divide the embedding dim ({dim})")
+        return f"IVF{nlist},PQ{pq_m}"
+    if kind == "hnsw":
+        return f"HNSW{hnsw_m},Flat"
+    raise ValueError(f"Unknown FAISS index type: {kind}")
+
+
+def make_index(emb, kind=FAISS_INDEX_TYPE, train_size=FAISS_TRAIN_SIZE, **kwargs):
+    """
+    Create (and train on a sample of ``emb`` if needed) an inner-product index keyed by Job.id.
+    IVF stores the keys itself; flat and HNSW cannot, so they are wrapped in IndexIDMap2.
+    """
+    n, dim = emb.shape
+    desc = index_description(kind, n, dim, **kwargs)
+    index = faiss.index_factory(dim, desc, faiss.METRIC_INNER_PRODUCT)
+    if getattr(index, "do_polysemous_training", False):
+        # only serves polysemous (Hamming) search, which is never enabled; it dominates PQ training
+        index.do_polysemous_training = False
+    if not index.is_trained:
+        rng = np.random.default_rng(42)
+        sample = emb[rng.choice(n, min(n, train_size), replace=False)] if n > train_size else emb
+        index.train(sample)
+    if _ivf(index) is not None:
+        # not IDMap2: its remove_ids compacts the id map while the inverted lists keep the old
+        # positions. The hashtable direct map gives reconstruct(key) and removal by key.
+        _ivf(index).set_direct_map_type(faiss.DirectMap.Hashtable)
+    else:
+        index = faiss.IndexIDMap2(index)
+    set_search_params(index)
+    logger.info(f"Created FAISS index {desc} for {n} vectors")
+    return index
+
+
+def _inner(index):
+    return faiss.downcast_index(index.index) if hasattr(index, "id_map") else index
+
+
+def _ivf(index):
+    try:
+        return faiss.extract_index_ivf(_inner(index))
+    except RuntimeError:
+        return None
+
+
+def set_search_params(index, nprobe=FAISS_NPROBE, ef_search=FAISS_EF_SEARCH):
+    """Index-wide query-time defaults; per-request overrides go through search_index()."""
+    inner = _inner(index)
+    if _ivf(index) is not None:
+        _ivf(index).nprobe = nprobe
+    if hasattr(inner, "hnsw"):
+        inner.hnsw.efSearch = ef_search
+
+
+def search_params(index, nprobe=None, ef_search=None, sel=None):
+    """
+    Per-query faiss.SearchParameters for the index that actually searches (the inner one of
+    an IndexIDMap2), or None when nothing is overridden. sel must use that index's ids.
+    """
+    inner = _inner(index)
+    if hasattr(inner, "hnsw"):
+        if ef_search is None and sel is None:
+            return None
+        return faiss.SearchParametersHNSW(efSearch=ef_search or inner.hnsw.efSearch, sel=sel)
+    ivf = _ivf(index)
+    if ivf is not None:
+        if nprobe is None and sel is None:
+            return None
+        return faiss.SearchParametersIVF(nprobe=nprobe or ivf.nprobe, sel=sel)
+    return faiss.SearchParameters(sel=sel) if sel is not None else None
+
+
+def _search_with(index, qemb, k, params):
+    if params is None:
+        return index.search(qemb, k)
+    if not hasattr(index, "id_map"):
+        return index.search(qemb, k, params=params)
+    # IndexIDMap2 rejects SearchParameters (faiss 1.7.4): search its inner index and map the
+    # positions it returns back to keys
+    D, I = _inner(index).search(qemb, k, params=params)
+    id_map = index.id_map
+    return D, np.array([[id_map.at(int(i)) if i >= 0 else -1 for i in row] for row in I], dtype='int64')
+
+
+def search_index(index, qemb, k, nprobe=None, ef_search=None):
+    """(D, I) of keys for a batch of queries, with optional per-query nprobe / efSearch."""
+    return _search_with(index, qemb, k, search_params(index, nprobe=nprobe, ef_search=ef_search))
+
+
+def id_selector(keys):
+    """Selector for a set of FAISS keys: a bitmap when they are dense, a hashed batch otherwise."""
+    keys = np.asarray(keys, dtype='int64')
+    top = int(keys.max()) + 1
+    if top <= 64 * len(keys):
+        # one bit per possible key is smaller than the batch's hash set and faster to probe
+        mask = np.zeros(top, dtype=bool)
+        mask[keys] = True
+        bitmap = np.packbits(mask, bitorder="little")
+        sel = faiss.IDSelectorBitmap(len(bitmap), faiss.swig_ptr(bitmap))
+        sel.referenced_objects = [bitmap]
+        return sel
+    return faiss.IDSelectorBatch(keys)
+
+
+# IndexIDMap2 -> (keys in position order, their argsort); newer faiss refuses new attributes on its objects
+_id_tables = weakref.WeakKeyDictionary()
+
+
+def _id_table(index):
+    """Keys of an IndexIDMap2 in position order and their argsort, cached per index object."""
+    table = _id_tables.get(index)
+    if table is None or len(table[0]) != index.ntotal:
+        ids = faiss.vector_to_array(index.id_map)
+        table = _id_tables[index] = (ids, np.argsort(ids, kind="stable"))
+    return table
+
+
+def _positions(index, keys):
+    """Positions of ``keys`` in an IndexIDMap2's inner index; keys it does not hold are dropped."""
+    ids, order = _id_table(index)
+    if not len(ids):
+        return np.empty(0, dtype='int64')
+    pos = np.minimum(np.searchsorted(ids, keys, sorter=order), len(ids) - 1)
+    found = ids[order[pos]] == keys
+    return order[pos[found]]
+
+
+def _widened(index, nprobe, ef_search, factor):
+    """nprobe / efSearch scaled by ``factor``, capped at what the index has."""
+    inner = _inner(index)
+    if hasattr(inner, "hnsw"):
+        return nprobe, int(min(index.ntotal, factor * (ef_search or inner.hnsw.efSearch)))
+    ivf = _ivf(index)
+    if ivf is None:
+        return nprobe, ef_search
+    return int(min(ivf.nlist, factor * (nprobe or ivf.nprobe))), ef_search
+
+
+def search_filtered(index, qemb, top_k, keys, nprobe=None, ef_search=None, exact_max=None):
+    """
+    (D, I) for the top_k among ``keys`` only, filtered inside the search rather than after it.
+    Up to exact_max (FAISS_FILTER_EXACT_MAX) keys are scored exactly from their stored vectors;
+    more go through an ID selector with the probe widened as the filter narrows, and once more
+    if it came back short.
+    """
+    keys = np.asarray(keys, dtype='int64')
+    exact_max = FAISS_FILTER_EXACT_MAX if exact_max is None else exact_max
+    if len(keys) <= exact_max:
+        try:
+            vecs = index.reconstruct_batch(keys)
+        except RuntimeError:
+            vecs = None
+        if vecs is not None:
+            scores = vecs @ qemb[0]
+            k = min(top_k, len(keys))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            D = np.full((1, top_k), -np.inf, dtype='float32')
+            I = np.full((1, top_k), -1, dtype='int64')
+            D[0, :k], I[0, :k] = scores[top], keys[top]
+            return D, I
+        # no stored vectors to score (IVF generations built inside IDMap2): probe every list;
+        # the selector is checked before any distance is computed, so this stays cheap
+        factor = index.ntotal
+    else:
+        # fewer allowed ids per probed list / graph neighbourhood as the filter narrows
+        factor = min(8.0, 1 / np.sqrt(len(keys) / index.ntotal))
+    # the selector sees the ids of the index that searches: positions for IDMap2's inner index
+    sel_ids = _positions(index, keys) if hasattr(index, "id_map") else keys
+    if not len(sel_ids):
+        return np.full((1, top_k), -np.inf, dtype='float32'), np.full((1, top_k), -1, dtype='int64')
+    sel = id_selector(sel_ids)
+    nprobe, ef_search = _widened(index, nprobe, ef_search, factor)
+    D, I = _search_with(index, qemb, top_k, search_params(index, nprobe=nprobe, ef_search=ef_search, sel=sel))
+    if (I[0] >= 0).sum() < min(top_k, len(sel_ids)):
+        wide = _widened(index, nprobe, ef_search, 4)
+        if wide != (nprobe, ef_search):
+            D, I = _search_with(index, qemb, top_k, search_params(index, nprobe=wide[0], ef_search=wide[1], sel=sel))
+    return D, I
+
+
+def load_snapshot(generation, mmap=False):
+    flags = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY if mmap else 0
+    index = faiss.read_index(INDEX_PATH.format(generation=generation), flags)
+    set_search_params(index)
+    meta = joblib.load(META_PATH.format(generation=generation))
+    return IndexSnapshot(index, meta, generation)
+
+
+class IndexHolder:
+    """Process-wide holder that loads the live generation once and hot-swaps newer ones."""
+
+    def __init__(self, mmap=FAISS_MMAP, check_interval=FAISS_RELOAD_INTERVAL):
+        self.mmap = mmap
+        self.check_interval = check_interval
+        self._snapshot = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+
+    def get(self):
+        snap = self._snapshot
+        if snap is None or time.monotonic() - self._last_check >= self.check_interval:
+            # only one thread reloads; others keep serving the snapshot they already have
+            blocking = snap is None
+            if self._lock.acquire(blocking=blocking):
+                try:
+                    self._maybe_reload()
+                finally:
+                    self._lock.release()
+            snap = self._snapshot
+        if snap is None:
+            raise FileNotFoundError("Index not found.")
+        return snap
+
+    def refresh(self):
+        with self._lock:
+            self._maybe_reload()
+        return self._snapshot
+
+    def _maybe_reload(self):
+        self._last_check = time.monotonic()
+        generation = current_generation()
+        if generation is None:
+            return
+        if self._snapshot is not None and self._snapshot.generation == generation:
+            return
+        start = time.perf_counter()
+        snap = load_snapshot(generation, mmap=self.mmap)
+        # plain reference assignment is atomic; in-flight searches keep the old snapshot alive
+        self._snapshot = snap
+        metrics.set_gauge("faiss_index_generation", generation)
+        metrics.set_gauge("faiss_index_size", snap.index.ntotal)
+        logger.info(f"Loaded FAISS generation {generation} in {time.perf_counter() - start:.2f}s")
+
+
+holder = IndexHolder()
+
+
+def get_snapshot():
+    return holder.get()
+
+
+def _encode(texts):
     model = get_model()
-    emb = model.encode(texts, convert_to_numpy=True)
-    dim = emb.shape[1] if dim is None else dim
-    index = faiss.IndexFlatIP(dim)  # inner product over L2-normalized vectors works as cosine
-    # normalize
+    emb = model.encode(texts, convert_to_numpy=True).astype('float32')
+    # inner product over L2-normalized vectors works as cosine
     faiss.normalize_L2(emb)
-    index.add(emb.astype('float32'))
-    os.makedirs(os.path.dirname(INDEX_PATH) or ".", exist_ok=True)
-    faiss.write_index(index, INDEX_PATH)
-    joblib.dump({"ids": ids}, META_PATH)
+    return emb
+
+
+def compute_neighbors(index, emb, keys, n=FAISS_NEIGHBORS, batch_size=4096):
+    """Top-n neighbours (self excluded) for every row of ``emb``, as a table sorted by key."""
+    keys = np.asarray(keys, dtype='int64')
+    nbr_ids = np.full((len(keys), n), -1, dtype='int64')
+    nbr_scores = np.full((len(keys), n), -np.inf, dtype='float32')
+    for start in range(0, len(keys), batch_size):
+        D, I = index.search(emb[start:start + batch_size], n + 1)
+        for row, (d, i) in enumerate(zip(D, I), start):
+            mask = (i != keys[row]) & (i >= 0)
+            i, d = i[mask][:n], d[mask][:n]
+            nbr_ids[row, :len(i)] = i
+            nbr_scores[row, :len(d)] = d
+    order = np.argsort(keys)
+    return {"keys": keys[order], "ids": nbr_ids[order], "scores": nbr_scores[order]}
+
+
+def merge_neighbors(table, delta, drop_keys):
+    """
+    Fold the neighbour rows of new/changed jobs into an existing table. Removed and changed
+    jobs are taken out of every row (their old scores are stale), their own rows are
+    replaced, and each delta job is inserted into the rows of its own neighbours when it
+    beats their current worst entry. Rows left short are padded with -1; neighbors() then
+    falls back to a search. Cost is O(delta * n) plus one vectorized pass over the table.
+    """
+    stale = np.concatenate([np.asarray(list(drop_keys), dtype='int64'), delta["keys"]])
+    keep = ~np.isin(table["keys"], stale)
+    keys, ids, scores = table["keys"][keep], table["ids"][keep].copy(), table["scores"][keep].copy()
+    gone = np.isin(ids, stale)
+    if gone.any():
+        ids[gone], scores[gone] = -1, -np.inf
+        rows = np.flatnonzero(gone.any(axis=1))
+        order = np.argsort(-scores[rows], axis=1, kind="stable")
+        ids[rows] = np.take_along_axis(ids[rows], order, axis=1)
+        scores[rows] = np.take_along_axis(scores[rows], order, axis=1)
+    if len(keys):
+        for q, row_ids, row_scores in zip(delta["keys"], delta["ids"], delta["scores"]):
+            for p, sc in zip(row_ids, row_scores):
+                if p < 0:
+                    break
+                i = np.searchsorted(keys, p)
+                if i >= len(keys) or keys[i] != p or sc <= scores[i, -1]:
+                    continue
+                ids[i, -1], scores[i, -1] = q, sc
+                order = np.argsort(-scores[i], kind="stable")
+                ids[i], scores[i] = ids[i][order], scores[i][order]
+    keys = np.concatenate([keys, delta["keys"]])
+    order = np.argsort(keys)
+    return {
+        "keys": keys[order],
+        "ids": np.concatenate([ids, delta["ids"]])[order],
+        "scores": np.concatenate([scores, delta["scores"]])[order],
+    }
+
+
+def neighbors(snapshot, key, top_k=10):
+    """Precomputed neighbours of ``key``; None when not available (or short) so callers can search instead."""
+    table = snapshot.meta.get("neighbors")
+    if table is None or top_k > table["ids"].shape[1]:
+        return None
+    i = np.searchsorted(table["keys"], key)
+    if i >= len(table["keys"]) or table["keys"][i] != key:
+        return None
+    ids = snapshot.ids
+    results = []
+    for idx, score in zip(table["ids"][i], table["scores"][i]):
+        # rows can reference jobs removed by a later incremental refresh
+        job_id = ids.get(int(idx)) if idx >= 0 else None
+        if job_id is None:
+            continue
+        results.append({"idx": int(idx), "id": job_id, "score": float(score)})
+        if len(results) == top_k:
+            return results
+    # a row thinned by deletions (or padded with -1) would give a short list
+    return None
+
+
+def reconstruct(snapshot, key):
+    """The indexed vector for ``key`` (approximate for PQ), or None."""
+    try:
+        return snapshot.index.reconstruct(int(key))
+    except RuntimeError:
+        return None
+
+
+def build_index(texts, ids, keys=None, watermark=None, kind=FAISS_INDEX_TYPE, emb=None, skills=None, attributes=None):
+    """
+    Full rebuild. ``keys`` are int64 FAISS ids (Job.id); ``ids`` the public job ids.
+    Pass precomputed normalized vectors as ``emb`` to skip encoding ``texts``, each
+    job's skill list as ``skills`` to store the job x skill matrix used for hybrid ranking,
+    and (location, source, salary_min, salary_max, posted) rows as ``attributes`` for filtering.
+    """
+    keys = np.arange(len(ids), dtype='int64') if keys is None else np.asarray(keys, dtype='int64')
+    emb = _encode(texts) if emb is None else np.ascontiguousarray(emb, dtype='float32')
+    index = make_index(emb, kind=kind)
+    index.add_with_ids(emb, keys)
+    meta = {"ids": dict(zip(keys.tolist(), ids)), "watermark": watermark, "index_type": kind}
+    if FAISS_NEIGHBORS:
+        meta["neighbors"] = compute_neighbors(index, emb, keys)
+    if skills is not None:
+        meta["skills"] = build_skill_matrix(keys, skills)
+    if attributes is not None:
+        meta["attributes"] = build_attributes(keys, attributes)
+    publish(index, meta)
     logger.info(f"FAISS index saved with {len(ids)} items")
     return index
 
-def search(query_text, top_k=10):
-    model = get_model()
-    qemb = model.encode([query_text], convert_to_numpy=True)
+
+def update_index(texts, ids, keys, remove_keys=(), watermark=None, emb=None, skills=None, attributes=None):
+    """Apply a delta to the live generation: re-add changed/new keys, drop removed ones."""
+    generation = current_generation()
+    if generation is None:
+        raise FileNotFoundError("Index not found; run a full build first.")
+    # always read into memory: an mmapped index is read-only
+    snap = load_snapshot(generation, mmap=False)
+    index, id_map = snap.index, dict(snap.ids)
+    keys = np.asarray(keys, dtype='int64')
+    # only keys already in the index need removing; pure adds work on every index type
+    stale = np.asarray(sorted({k for k in keys.tolist() + list(remove_keys) if k in id_map}), dtype='int64')
+    if len(stale):
+        if hasattr(index, "id_map") and _ivf(index) is not None:
+            # generations built when IVF was wrapped in IDMap2: removing through the wrapper
+            # desyncs its id map from the inverted lists
+            raise NotImplementedError("IVF inside IndexIDMap2 cannot remove ids")
+        try:
+            # the IVF hashtable direct map only removes through an IDSelectorArray
+            index.remove_ids(faiss.IDSelectorArray(stale))
+        except RuntimeError as e:
+            # e.g. HNSW cannot delete; callers fall back to a full rebuild
+            raise NotImplementedError(f"index does not support removal: {e}")
+        for k in stale.tolist():
+            id_map.pop(k, None)
+    if len(keys):
+        emb = _encode(texts) if emb is None else np.ascontiguousarray(emb, dtype='float32')
+        index.add_with_ids(emb, keys)
+        id_map.update(zip(keys.tolist(), ids))
+    meta = dict(snap.meta, ids=id_map, watermark=watermark or snap.meta.get("watermark"))
+    table = snap.meta.get("neighbors")
+    if table is not None:
+        delta = compute_neighbors(index, emb, keys, n=table["ids"].shape[1])
+        meta["neighbors"] = merge_neighbors(table, delta, stale.tolist())
+    if snap.meta.get("skills") is not None:
+        if skills is None:
+            # rows for the changed keys would be stale; matching falls back to FAISS order
+            meta.pop("skills")
+        else:
+            meta["skills"] = merge_skill_matrix(snap.meta["skills"], keys, skills, stale.tolist())
+    if snap.meta.get("attributes") is not None:
+        if attributes is None:
+            # filtering needs rows for every key; searches with filters require a rebuild
+            meta.pop("attributes")
+        else:
+            meta["attributes"] = merge_attributes(snap.meta["attributes"], keys, attributes, stale.tolist())
+    publish(index, meta)
+    logger.info(f"FAISS index updated: {len(keys)} added/changed, {len(remove_keys)} removed")
+    return index
+
+
+def current_meta():
+    generation = current_generation()
+    if generation is None:
+        return None
+    return joblib.load(META_PATH.format(generation=generation))
+
+
+def normalize_query(vec):
+    qemb = np.array(vec, dtype='float32').reshape(1, -1)
     faiss.normalize_L2(qemb)
-    if not os.path.exists(INDEX_PATH):
-        raise FileNotFoundError("Index not found.")
-    index = faiss.read_index(INDEX_PATH)
-    D, I = index.search(qemb.astype('float32'), top_k)
-    meta = joblib.load(META_PATH)
-    ids = meta["ids"]
+    return qemb
+
+
+def encode_query(query_text):
+    vec = embedding_cache.get(query_text)
+    if vec is None:
+        # micro-batched with other in-flight queries
+        vec = embedding_service.encode([query_text])[0]
+        embedding_cache.put(query_text, vec)
+    return normalize_query(vec)
+
+
+def search_vector(qemb, top_k=10, snapshot=None, nprobe=None, ef_search=None, filters=None):
+    """filters: job_filters.matching_keys() arguments (location, source, salary range, posted_after)."""
+    snap = snapshot or get_snapshot()
+    qemb = np.asarray(qemb, dtype='float32').reshape(1, -1)
+    if filters:
+        table = snap.meta.get("attributes")
+        if table is None:
+            raise ValueError("This index generation has no job attributes; rebuild it to search with filters.")
+        allowed = matching_keys(table, **filters)
+        if not len(allowed):
+            return []
+        D, I = search_filtered(snap.index, qemb, top_k, allowed, nprobe=nprobe, ef_search=ef_search)
+    else:
+        D, I = search_index(snap.index, qemb, top_k, nprobe=nprobe, ef_search=ef_search)
+    metrics.inc("faiss_searches_total", generation=snap.generation)
+    ids = snap.ids
     results = []
     for idx, score in zip(I[0], D[0]):
-        if idx < 0 or idx >= len(ids):
+        job_id = ids.get(int(idx)) if idx >= 0 else None
+        if job_id is None:
             continue
-        results.append({"idx": int(idx), "id": ids[int(idx)], "score": float(score)})
+        results.append({"idx": int(idx), "id": job_id, "score": float(score)})
     return results
+
+
+def search(query_text, top_k=10, snapshot=None, **params):
+    return search_vector(encode_query(query_text), top_k=top_k, snapshot=snapshot, **params)
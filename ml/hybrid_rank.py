@@ -0,0 +1,51 @@
+"""
+Hybrid resume matching: a wide FAISS candidate set is re-scored by skill overlap and the
+two rankings are fused. Skill overlap comes from a sparse job x skill matrix that is built
+with each index generation (meta["skills"]), so re-scoring is one sparse product over the
+candidate rows instead of a skill_gap() call per job.
+"""
+import numpy as np
+from ai_job_dashboard.ml.faiss_index import search_vector, get_snapshot
+from ai_job_dashboard.ml.skill_gap import skill_gap_sets
+from ai_job_dashboard.ml.skill_matrix import skill_scores, job_skills
+from ai_job_dashboard.utils.config import MATCH_CANDIDATES, MATCH_FUSION, MATCH_SKILL_WEIGHT, MATCH_RRF_K
+
+
+def _ranks(scores):
+    # 0 = best; ties keep the semantic (candidate) order
+    ranks = np.empty(len(scores), dtype='int64')
+    ranks[np.argsort(-scores, kind="stable")] = np.arange(len(scores))
+    return ranks
+
+
+def fuse(semantic, skill, method=MATCH_FUSION, weight=MATCH_SKILL_WEIGHT, rrf_k=MATCH_RRF_K):
+    """weighted: blend of cosine and skill share; rrf: weighted reciprocal-rank fusion."""
+    if method == "weighted":
+        return (1 - weight) * semantic + weight * skill
+    if method == "rrf":
+        return (1 - weight) / (rrf_k + _ranks(semantic)) + weight / (rrf_k + _ranks(skill))
+    raise ValueError(f"Unknown fusion method: {method}")
+
+
+def hybrid_search(qemb, resume_skills, top_k=10, snapshot=None, candidates=MATCH_CANDIDATES,
+                  fusion=MATCH_FUSION, weight=MATCH_SKILL_WEIGHT, with_gap=False, **params):
+    """
+    top_k matches for a resume vector and its extracted skills. Falls back to plain FAISS
+    order for generations built before skill matrices existed.
+    """
+    snap = snapshot or get_snapshot()
+    results = search_vector(qemb, top_k=max(candidates, top_k), snapshot=snap, **params)
+    table = snap.meta.get("skills")
+    if table is None or not results:
+        return results[:top_k]
+    resume_skills = set(resume_skills)
+    semantic = np.asarray([r["score"] for r in results], dtype='float32')
+    skill = skill_scores(table, [r["idx"] for r in results], resume_skills)
+    fused = fuse(semantic, skill, method=fusion, weight=weight)
+    ranked = []
+    for i in np.argsort(-fused, kind="stable")[:top_k]:
+        res = dict(results[i], score=float(fused[i]), semantic_score=float(semantic[i]), skill_score=float(skill[i]))
+        if with_gap:
+            res["skill_gap"] = skill_gap_sets(resume_skills, job_skills(table, res["idx"]))
+        ranked.append(res)
+    return ranked
@@ -0,0 +1,74 @@
+"""
+Columnar job attributes stored with each FAISS generation (meta["attributes"]): one array
+per field, aligned with the sorted FAISS keys (Job.id). A filter turns into the set of
+allowed keys with a few vectorized comparisons, which the search then applies inside FAISS.
+"""
+import numpy as np
+
+# query-side filter names accepted by matching_keys()
+FILTERS = ("location", "source", "min_salary", "max_salary", "posted_after")
+# per-job arrays; "locations" / "sources" hold the vocabularies behind the integer codes
+ARRAYS = ("location", "source", "salary_min", "salary_max", "posted")
+
+
+def _codes(values, vocab):
+    """Integer codes for strings; unseen values are appended to the vocabulary."""
+    columns = {v: i for i, v in enumerate(vocab)}
+    codes = np.fromiter((columns.setdefault(v or "", len(columns)) for v in values), dtype='int32', count=len(values))
+    return codes, list(columns)
+
+
+def _columns(rows, locations=(), sources=()):
+    # rows: (location, source, salary_min, salary_max, posted) per job
+    location, locations = _codes([r[0] for r in rows], locations)
+    source, sources = _codes([(r[1] or "").lower() for r in rows], sources)
+    return {
+        "location": location, "locations": locations,
+        "source": source, "sources": sources,
+        "salary_min": np.array([np.nan if r[2] is None else r[2] for r in rows], dtype='float32'),
+        "salary_max": np.array([np.nan if r[3] is None else r[3] for r in rows], dtype='float32'),
+        "posted": np.array([np.datetime64(r[4], 'D') if r[4] else np.datetime64('NaT') for r in rows],
+                           dtype='datetime64[D]'),
+    }
+
+
+def _sorted(keys, table):
+    order = np.argsort(keys, kind="stable")
+    return dict(table, keys=keys[order], **{f: table[f][order] for f in ARRAYS})
+
+
+def build_attributes(keys, rows):
+    """Attribute columns for ``keys`` from (location, source, salary_min, salary_max, posted) rows."""
+    return _sorted(np.asarray(keys, dtype='int64'), _columns(rows))
+
+
+def merge_attributes(table, keys, rows, drop_keys):
+    """Replace the rows of ``drop_keys`` and append rows for new/changed ``keys``."""
+    keys = np.asarray(keys, dtype='int64')
+    keep = ~np.isin(table["keys"], np.concatenate([np.asarray(list(drop_keys), dtype='int64'), keys]))
+    delta = _columns(rows, table["locations"], table["sources"])
+    merged = dict(delta, **{f: np.concatenate([table[f][keep], delta[f]]) for f in ARRAYS})
+    return _sorted(np.concatenate([table["keys"][keep], keys]), merged)
+
+
+def matching_keys(table, location=None, source=None, min_salary=None, max_salary=None, posted_after=None):
+    """
+    Sorted keys of jobs passing every given filter. location is a case-insensitive substring
+    ("bangalore" matches "Bangalore, Karnataka"); source is exact. Salary filters keep jobs whose
+    range reaches min_salary / starts at or below max_salary, and drop jobs with no salary.
+    """
+    mask = np.ones(len(table["keys"]), dtype=bool)
+    if location:
+        term = location.lower()
+        mask &= np.isin(table["location"], [i for i, v in enumerate(table["locations"]) if term in v.lower()])
+    if source:
+        mask &= np.isin(table["source"], [i for i, v in enumerate(table["sources"]) if v == source.lower()])
+    if min_salary is not None:
+        top = np.where(np.isnan(table["salary_max"]), table["salary_min"], table["salary_max"])
+        mask &= top >= min_salary
+    if max_salary is not None:
+        bottom = np.where(np.isnan(table["salary_min"]), table["salary_max"], table["salary_min"])
+        mask &= bottom <= max_salary
+    if posted_after is not None:
+        mask &= table["posted"] >= np.datetime64(posted_after, 'D')
+    return table["keys"][mask]
@@ -0,0 +1,116 @@
+import json
+import os
+import numpy as np
+from ai_job_dashboard.utils.config import ONNX_DIR
+from ai_job_dashboard.utils.logger import get_logger
+
+logger = get_logger("OnnxEncoder")
+
+
+def _paths(model_name, onnx_dir):
+    base = os.path.join(onnx_dir, model_name.replace("/", "_"))
+    return {
+        "fp32": base + ".onnx",
+        "int8": base + ".int8.onnx",
+        "tokenizer": base + "_tokenizer",
+        "config": base + ".json",
+    }
+
+
+def export_onnx(model_name, onnx_dir=ONNX_DIR, quantize=False):
+    """
+    Export the SentenceTransformer's transformer to ONNX once (and an int8 dynamically
+    quantized copy if asked). Pooling/normalization are replayed in numpy by OnnxEncoder.
+    """
+    paths = _paths(model_name, onnx_dir)
+    if not os.path.exists(paths["fp32"]):
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        logger.info(f"Exporting {model_name} to ONNX...")
+        os.makedirs(onnx_dir, exist_ok=True)
+        st = SentenceTransformer(model_name, device="cpu")
+        transformer = st[0]
+        tokenizer = transformer.tokenizer
+        tokenizer.save_pretrained(paths["tokenizer"])
+
+        class _Wrapper(torch.nn.Module):
+            def __init__(self, hf):
+                super().__init__()
+                self.hf = hf
+
+            def forward(self, input_ids, attention_mask, token_type_ids):
+                return self.hf(input_ids=input_ids, attention_mask=attention_mask,
+                               token_type_ids=token_type_ids)[0]
+
+        dummy = tokenizer(["hello world"], return_tensors="pt")
+        axes = {0: "batch", 1: "seq"}
+        torch.onnx.export(
+            _Wrapper(transformer.auto_model).eval(),
+            (dummy["input_ids"], dummy["attention_mask"], dummy["token_type_ids"]),
+            paths["fp32"],
+            input_names=["input_ids", "attention_mask", "token_type_ids"],
+            output_names=["last_hidden_state"],
+            dynamic_axes={"input_ids": axes, "attention_mask": axes, "token_type_ids": axes,
+                          "last_hidden_state": axes},
+            opset_version=14,
+        )
+        with open(paths["config"], "w") as f:
+            json.dump({
+                "max_seq_length": st.max_seq_length,
+                "normalize": any(type(m).__name__ == "Normalize" for m in st),
+                "pooling": st[1].get_pooling_mode_str() if len(st) > 1 else "mean",
+            }, f)
+    if quantize and not os.path.exists(paths["int8"]):
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+
+        logger.info(f"Quantizing {paths['fp32']} to int8...")
+        quantize_dynamic(paths["fp32"], paths["int8"], weight_type=QuantType.QInt8)
+    return paths
+
+
+class OnnxEncoder:
+    """ONNX Runtime replacement for SentenceTransformer with the same encode() signature."""
+
+    def __init__(self, model_name, quantize=False, onnx_dir=ONNX_DIR):
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            raise RuntimeError("EMBEDDING_BACKEND=onnx needs onnxruntime (pip install onnxruntime)")
+        from transformers import AutoTokenizer
+
+        paths = export_onnx(model_name, onnx_dir, quantize=quantize)
+        with open(paths["config"]) as f:
+            config = json.load(f)
+        self.max_seq_length = config["max_seq_length"]
+        self.normalize = config["normalize"]
+        self.pooling = config.get("pooling", "mean")
+        if self.pooling not in ("mean", "cls"):
+            raise RuntimeError(f"ONNX backend does not support {self.pooling} pooling")
+        self.tokenizer = AutoTokenizer.from_pretrained(paths["tokenizer"])
+        opts = ort.SessionOptions()
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(paths["int8" if quantize else "fp32"], opts,
+                                            providers=["CPUExecutionProvider"])
+        self.input_names = [i.name for i in self.session.get_inputs()]
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False, convert_to_numpy=True, **kwargs):
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        out = []
+        for start in range(0, len(texts), batch_size):
+            enc = self.tokenizer(texts[start:start + batch_size], padding=True, truncation=True,
+                                 max_length=self.max_seq_length, return_tensors="np")
+            feeds = {name: enc[name].astype('int64') for name in self.input_names}
+            hidden = self.session.run(None, feeds)[0]
+            if self.pooling == "cls":
+                emb = hidden[:, 0]
+            else:
+                # mean over real tokens, as the SentenceTransformer Pooling module does
+                mask = enc["attention_mask"][..., None].astype('float32')
+                emb = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            if self.normalize:
+                emb = emb / np.clip(np.linalg.norm(emb, axis=1, keepdims=True), 1e-12, None)
+            out.append(emb.astype('float32'))
+        emb = np.vstack(out) if out else np.empty((0, 0), dtype='float32')
+        return emb[0] if single else emb
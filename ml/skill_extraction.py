@@ -1,23 +1,105 @@
+import json
+import os
 import re
+from functools import lru_cache
 from typing import List
 from ai_job_dashboard.utils.logger import get_logger
 logger = get_logger("SkillExtraction")
 
-# small dictionary you can expand with thousands of skills
-SKILL_DICTIONARY = [
-    "python","sql","tensorflow","pytorch","spark","hadoop","aws","azure","gcp","pandas","numpy",
-    "scikit-learn","docker","kubernetes","git","excel","power bi","tableau","nlp","computer vision",
-    "deep learning","machine learning","javascript","react","java"
-]
+# canonical skill -> aliases/synonyms (e.g. "kubernetes": ["k8s"]), or
+# {"aliases": [...], "parents": [...]} for a skill that implies broader ones ("aws lambda" -> "aws")
+TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "skills_taxonomy.json")
+
+# a match must not be glued to other word characters; the tail also rejects "+"/"#"
+# so "c++" / "c#" never match a shorter skill. A plural or an attached version number
+# ("c++11", "vue3", "python3.11") still counts as the skill
+_HEAD = r"(?<![a-z0-9_])"
+_TAIL = r"(?:e?s|\d+(?:\.\d+)*)?(?![a-z0-9_+#])"
+
+
+def load_taxonomy(path=TAXONOMY_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+SKILL_TAXONOMY = load_taxonomy()
+SKILL_DICTIONARY = list(SKILL_TAXONOMY)
+
+
+def _entry(value):
+    """(aliases, parents) of one taxonomy value."""
+    if isinstance(value, dict):
+        return value.get("aliases") or [], value.get("parents") or []
+    return value or [], []
+
+
+def _trie_regex(trie):
+    """Serialize a character trie into a regex that never backtracks across siblings."""
+    end = "" in trie
+    branches = []
+    for ch in sorted(k for k in trie if k):
+        # any run of spaces/hyphens matches a space in the dictionary ("power-bi", "power  bi")
+        head = r"[\s\-]+" if ch == " " else re.escape(ch)
+        branches.append(head + _trie_regex(trie[ch]))
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    # greedy optional: the longer skill wins ("java" vs "javascript")
+    return "(?:" + body + ")?" if end else body
+
+
+class SkillMatcher:
+    """Every skill, alias and plural of a taxonomy compiled into one trie-shaped regex."""
+
+    def __init__(self, taxonomy):
+        self.canonical = {}
+        self.parents = {}
+        for skill, value in taxonomy.items():
+            aliases, parents = _entry(value)
+            if parents:
+                self.parents[skill] = list(parents)
+            for term in [skill] + list(aliases):
+                term = " ".join(term.lower().split())
+                if term:
+                    self.canonical.setdefault(term, skill)
+        trie = {}
+        for term in self.canonical:
+            node = trie
+            for ch in term:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+        self.pattern = re.compile(_HEAD + "(" + _trie_regex(trie) + ")" + _TAIL)
+
+    def find(self, text):
+        canonical = self.canonical
+        found = set()
+        for m in self.pattern.finditer((text or "").lower()):
+            term = " ".join(m.group(1).replace("-", " ").split())
+            skill = canonical.get(term) or canonical.get(m.group(1))
+            if skill:
+                found.add(skill)
+        # the longest match hides nested skills ("aws" in "aws lambda"); the taxonomy adds them back
+        pending = [p for skill in found for p in self.parents.get(skill, ())]
+        while pending:
+            skill = pending.pop()
+            if skill not in found:
+                found.add(skill)
+                pending.extend(self.parents.get(skill, ()))
+        return sorted(found)
+
+
+@lru_cache(maxsize=32)
+def _matcher(extra):
+    taxonomy = dict(SKILL_TAXONOMY)
+    for skill in extra:
+        taxonomy.setdefault(skill, [])
+    return SkillMatcher(taxonomy)
+
+
+def get_matcher(expand_dictionary=None):
+    """Compiled once per distinct dictionary; expand_dictionary adds extra canonical skills."""
+    return _matcher(tuple(sorted(set(expand_dictionary or []))))
+
 
 def extract_skills_from_text(text: str, expand_dictionary=None) -> List[str]:
-    text_lower = (text or "").lower()
-    found = set()
-    dic = (SKILL_DICTIONARY + (expand_dictionary or []))
-    for skill in dic:
-        # match whole words and common variations
-        skill_esc = re.escape(skill.lower())
-        pattern = r'\\b' + skill_esc + r's?\\b'
-        if re.search(pattern, text_lower):
-            found.add(skill)
-    return sorted(list(found))
+    return get_matcher(expand_dictionary).find(text)
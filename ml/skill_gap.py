@@ -1,9 +1,13 @@
 from typing import List, Dict
 from ai_job_dashboard.nlp.skill_extraction import SKILL_DICTIONARY, extract_skills_from_text
 
-def skill_gap(resume_text: str, target_job_text: str, expand_dictionary=None):
-    resume_skills = set(extract_skills_from_text(resume_text, expand_dictionary))
-    job_skills = set(extract_skills_from_text(target_job_text, expand_dictionary))
+def skill_gap_sets(resume_skills, job_skills):
+    resume_skills, job_skills = set(resume_skills), set(job_skills)
     missing = sorted(list(job_skills - resume_skills))
     extra = sorted(list(resume_skills - job_skills))
     return {"missing": missing, "extra": extra, "job_skills": sorted(list(job_skills)), "resume_skills": sorted(list(resume_skills))}
+
+def skill_gap(resume_text: str, target_job_text: str, expand_dictionary=None):
+    resume_skills = extract_skills_from_text(resume_text, expand_dictionary)
+    job_skills = extract_skills_from_text(target_job_text, expand_dictionary)
+    return skill_gap_sets(resume_skills, job_skills)
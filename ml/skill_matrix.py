@@ -0,0 +1,82 @@
+"""
+Sparse job x skill matrix stored with each FAISS generation (meta["skills"]): rows are
+FAISS keys (Job.id, sorted), columns a skill vocabulary, plus per-skill IDF weights.
+"""
+import numpy as np
+import scipy.sparse as sp
+
+
+def _rows(skills, columns):
+    """CSR (indptr, indices) for lists of skill names; unseen skills are appended to ``columns``."""
+    indptr, indices = [0], []
+    for row in skills:
+        indices.extend(sorted({columns.setdefault(s, len(columns)) for s in row or []}))
+        indptr.append(len(indices))
+    return np.asarray(indptr, dtype='int64'), np.asarray(indices, dtype='int32')
+
+
+def _table(keys, matrix, vocab):
+    order = np.argsort(keys, kind="stable")
+    matrix = matrix[order]
+    # rare skills say more about a job than "communication" does
+    df = np.bincount(matrix.indices, minlength=len(vocab))
+    idf = (np.log((1 + len(keys)) / (1 + df)) + 1).astype('float32')
+    return {"keys": keys[order], "matrix": matrix, "vocab": vocab, "idf": idf}
+
+
+def build_skill_matrix(keys, skills):
+    """Binary CSR job x skill matrix; rows follow FAISS keys (sorted), columns ``vocab``."""
+    keys = np.asarray(keys, dtype='int64')
+    columns = {}
+    indptr, indices = _rows(skills, columns)
+    matrix = sp.csr_matrix((np.ones(len(indices), dtype='float32'), indices, indptr), shape=(len(keys), len(columns)))
+    return _table(keys, matrix, list(columns))
+
+
+def merge_skill_matrix(table, keys, skills, drop_keys):
+    """Replace the rows of ``drop_keys`` and append rows for new/changed ``keys``."""
+    keys = np.asarray(keys, dtype='int64')
+    drop = np.concatenate([np.asarray(list(drop_keys), dtype='int64'), keys])
+    keep = ~np.isin(table["keys"], drop)
+    columns = {s: i for i, s in enumerate(table["vocab"])}
+    indptr, indices = _rows(skills, columns)
+    old = table["matrix"][keep]
+    old = sp.csr_matrix((old.data, old.indices, old.indptr), shape=(old.shape[0], len(columns)))
+    new = sp.csr_matrix((np.ones(len(indices), dtype='float32'), indices, indptr), shape=(len(keys), len(columns)))
+    return _table(np.concatenate([table["keys"][keep], keys]), sp.vstack([old, new], format="csr"), list(columns))
+
+
+def _positions(table, keys):
+    """Row of each key in the table, and whether it is there at all."""
+    if not len(table["keys"]):
+        return np.zeros(len(keys), dtype='int64'), np.zeros(len(keys), dtype=bool)
+    pos = np.minimum(np.searchsorted(table["keys"], keys), len(table["keys"]) - 1)
+    return pos, table["keys"][pos] == keys
+
+
+def skill_scores(table, keys, resume_skills):
+    """
+    IDF-weighted share of each job's skills that the resume has, in [0, 1]; 0 for jobs
+    without skills or missing from the table.
+    """
+    keys = np.asarray(keys, dtype='int64')
+    pos, found = _positions(table, keys)
+    scores = np.zeros(len(keys), dtype='float32')
+    columns = [i for i, s in enumerate(table["vocab"]) if s in resume_skills]
+    if not columns or not found.any():
+        return scores
+    idf = table["idf"]
+    have = np.zeros(len(idf), dtype='float32')
+    have[columns] = idf[columns]
+    # numerator and denominator for all candidates in one sparse product
+    num, den = (table["matrix"][pos[found]] @ np.column_stack([have, idf])).T
+    scores[found] = np.divide(num, den, out=np.zeros_like(num), where=den > 0)
+    return scores
+
+
+def job_skills(table, key):
+    pos, found = _positions(table, np.asarray([key], dtype='int64'))
+    if not found[0]:
+        return []
+    row = table["matrix"][int(pos[0])]
+    return [table["vocab"][i] for i in row.indices]
@@ -0,0 +1,149 @@
+import asyncio
+import random
+import threading
+import time
+from collections import namedtuple
+from urllib.parse import urlsplit
+import aiohttp
+from ai_job_dashboard.scraper.response_cache import get_cache
+from ai_job_dashboard.utils.config import (
+    SCRAPER_MAX_CONNECTIONS, SCRAPER_CONNECTIONS_PER_HOST, SCRAPER_RATE_PER_HOST, SCRAPER_BURST, SCRAPER_RETRIES,
+)
+from ai_job_dashboard.utils.logger import get_logger
+from ai_job_dashboard.utils.proxy_pool import get_proxy_pool, PROXY_FAILURE_STATUSES
+logger = get_logger("AsyncFetcher")
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# status 304 means the validators matched and text is empty
+Page = namedtuple("Page", ["status", "text", "etag", "last_modified"])
+
+
+class TokenBucket:
+    """
+    Per-host rate limit. Reservation style and guarded by a thread lock, so one bucket
+    is shared by every fetcher/event loop in the process (ETL runs several at once).
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+
+    async def acquire(self):
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def bucket_for(host, rate=SCRAPER_RATE_PER_HOST, burst=SCRAPER_BURST):
+    with _buckets_lock:
+        if host not in _buckets:
+            _buckets[host] = TokenBucket(rate, burst)
+        return _buckets[host]
+
+
+class RetryableStatus(Exception):
+    def __init__(self, status, retry_after=None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class AsyncFetcher:
+    """aiohttp client with a bounded keep-alive pool, per-host rate limits and jittered retries."""
+
+    def __init__(self, headers=None, proxy_pool=None, limit=SCRAPER_MAX_CONNECTIONS,
+                 limit_per_host=SCRAPER_CONNECTIONS_PER_HOST, retries=SCRAPER_RETRIES, backoff=1.0, timeout=30,
+                 cache=None):
+        self.headers = dict(headers or {})
+        self.cache = cache or get_cache()
+        self.proxy_pool = proxy_pool or get_proxy_pool()
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.session = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host,
+                                         ttl_dns_cache=300, keepalive_timeout=30)
+        self.session = aiohttp.ClientSession(connector=connector, headers=self.headers,
+                                             timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.session.close()
+
+    def _delay(self, attempt, retry_after=None):
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        # exponential backoff with jitter so parallel retries do not stampede together
+        return self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+    async def fetch(self, url, **kwargs):
+        return (await self._request(url, **kwargs)).text
+
+    async def fetch_conditional(self, url, etag=None, last_modified=None, **kwargs):
+        """GET with If-None-Match / If-Modified-Since when validators from an earlier fetch are known."""
+        headers = dict(kwargs.pop("headers", None) or {})
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return await self._request(url, headers=headers, **kwargs)
+
+    async def _request(self, url, **kwargs):
+        if self.cache and self.cache.reads:
+            # replay mode raises CacheMiss here instead of going to the network
+            html = self.cache.get(url, self.headers)
+            if html is not None:
+                return Page(200, html, None, None)
+        bucket = bucket_for(urlsplit(url).netloc)
+        for attempt in range(self.retries + 1):
+            await bucket.acquire()
+            proxy = self.proxy_pool.get() if self.proxy_pool else None
+            t0 = time.perf_counter()
+            try:
+                async with self.session.get(url, proxy=proxy, **kwargs) as resp:
+                    if self.proxy_pool:
+                        self.proxy_pool.report(proxy, resp.status not in PROXY_FAILURE_STATUSES, time.perf_counter() - t0)
+                    if resp.status in RETRY_STATUSES:
+                        raise RetryableStatus(resp.status, resp.headers.get("Retry-After"))
+                    resp.raise_for_status()
+                    text = "" if resp.status == 304 else await resp.text()
+                    if self.cache:
+                        self.cache.put(url, text, self.headers)
+                    return Page(resp.status, text, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+            except (RetryableStatus, aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if self.proxy_pool and not isinstance(e, RetryableStatus):
+                    self.proxy_pool.report(proxy, False)
+                if attempt == self.retries:
+                    raise
+                delay = self._delay(attempt, getattr(e, "retry_after", None))
+                logger.info(f"GET {url} failed ({e!r}); retry {attempt + 1} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+    async def fetch_many(self, urls, **kwargs):
+        """Fetch all urls concurrently; failed ones come back as the exception instead of text."""
+        return await asyncio.gather(*[self.fetch(u, **kwargs) for u in urls], return_exceptions=True)
+
+    async def fetch_many_conditional(self, urls, validators):
+        """Like fetch_many, returning Page tuples; validators maps url -> (etag, last_modified)."""
+        return await asyncio.gather(*[self.fetch_conditional(u, *validators.get(u, (None, None))) for u in urls],
+                                    return_exceptions=True)
@@ -1,23 +1,72 @@
+import asyncio
+import time
 import requests
-from bs4 import BeautifulSoup
-from ai_job_dashboard.utils.config import USER_AGENT, PROXY_URL
+from ai_job_dashboard.scraper.async_fetcher import AsyncFetcher
+from ai_job_dashboard.scraper.html_parser import parse_html
+from ai_job_dashboard.scraper.response_cache import get_cache
+from ai_job_dashboard.utils.config import USER_AGENT
 from ai_job_dashboard.utils.logger import get_logger
+from ai_job_dashboard.utils.proxy_pool import get_proxy_pool, PROXY_FAILURE_STATUSES
 logger = get_logger("BaseScraper")
 
 DEFAULT_HEADERS = {"User-Agent": USER_AGENT}
 
 class BaseScraper:
-    def __init__(self, session=None):
+    def __init__(self, session=None, proxy_pool=None):
         self.session = session or requests.Session()
         self.session.headers.update(DEFAULT_HEADERS)
-        if PROXY_URL:
-            self.session.proxies.update({"http": PROXY_URL, "https": PROXY_URL})
+        # the pool picks a proxy per request; shared by every scraper in the process
+        self.proxy_pool = proxy_pool or get_proxy_pool()
+
+    def close(self):
+        self.session.close()
 
     def get(self, url, **kwargs):
+        cache = get_cache()
+        if cache and cache.reads:
+            html = cache.get(url, self.session.headers)
+            if html is not None:
+                return html
         logger.info(f"GET {url}")
-        resp = self.session.get(url, timeout=30, **kwargs)
+        proxy = self.proxy_pool.get()
+        if proxy:
+            kwargs.setdefault("proxies", {"http": proxy, "https": proxy})
+        t0 = time.perf_counter()
+        try:
+            resp = self.session.get(url, timeout=30, **kwargs)
+        except requests.RequestException:
+            self.proxy_pool.report(proxy, False)
+            raise
+        self.proxy_pool.report(proxy, resp.status_code not in PROXY_FAILURE_STATUSES, time.perf_counter() - t0)
         resp.raise_for_status()
+        if cache:
+            cache.put(url, resp.text, self.session.headers)
         return resp.text
 
+    def fetch_many(self, urls, **kwargs):
+        """
+        Fetch many pages (e.g. job detail pages) concurrently over a pooled aiohttp client.
+        Returns one entry per url, in order: the page text, or the exception it failed with.
+        """
+        if not urls:
+            return []
+        logger.info(f"GET {len(urls)} pages concurrently")
+        return asyncio.run(self._fetch_many(list(urls), **kwargs))
+
+    async def _fetch_many(self, urls, **kwargs):
+        async with AsyncFetcher(headers=self.session.headers, proxy_pool=self.proxy_pool) as fetcher:
+            return await fetcher.fetch_many(urls, **kwargs)
+
+    def fetch_many_conditional(self, urls, validators):
+        """fetch_many with ETag/Last-Modified revalidation; returns Page tuples (or exceptions)."""
+        if not urls:
+            return []
+        logger.info(f"GET {len(urls)} pages concurrently ({len(validators)} conditional)")
+        return asyncio.run(self._fetch_many_conditional(list(urls), validators))
+
+    async def _fetch_many_conditional(self, urls, validators):
+        async with AsyncFetcher(headers=self.session.headers, proxy_pool=self.proxy_pool) as fetcher:
+            return await fetcher.fetch_many_conditional(urls, validators)
+
     def parse(self, html):
-        return BeautifulSoup(html, "lxml")
+        return parse_html(html)
@@ -0,0 +1,105 @@
+"""
+Parse-path throughput of each HTML_PARSER backend over stored pages (no network).
+Usage:
+    python -m ai_job_dashboard.scraper.bench_parse --from-cache          # pages recorded with SCRAPER_CACHE=record
+    python -m ai_job_dashboard.scraper.bench_parse --pages 400           # synthetic Indeed listing/detail pages
+"""
+import argparse
+import random
+import string
+import time
+from ai_job_dashboard.scraper import html_parser
+from ai_job_dashboard.scraper.indeed_scraper import IndeedScraper
+from ai_job_dashboard.scraper.linkedin_scraper import LinkedInScraper
+from ai_job_dashboard.scraper.naukri_scraper import NaukriScraper
+from ai_job_dashboard.scraper.response_cache import ResponseCache
+from ai_job_dashboard.utils.logger import get_logger
+
+logger = get_logger("bench_parse")
+
+
+def _words(rng, n):
+    return " ".join("".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9))) for _ in range(n))
+
+
+def _chrome(rng, kb):
+    # the navigation, inline scripts and footers that make up most of a real page
+    blocks = []
+    while sum(len(b) for b in blocks) < kb * 1024:
+        blocks.append(f'<div class="nav-{rng.randint(0, 99)}"><ul>'
+                      + "".join(f'<li><a href="/x/{i}">{_words(rng, 3)}</a></li>' for i in range(10))
+                      + f"</ul><script>var s{rng.randint(0, 9999)} = '{_words(rng, 40)}';</script></div>")
+    return "".join(blocks)
+
+
+def synthetic_pages(n_pages, seed=0):
+    """Indeed-shaped (url, html) pairs: one listing page with 15 cards per 15 detail pages."""
+    rng = random.Random(seed)
+    pages = []
+    while len(pages) < n_pages:
+        cards = []
+        for _ in range(15):
+            jk = "".join(rng.choices(string.hexdigits.lower(), k=16))
+            cards.append(f'<a class="tapItem" data-jk="{jk}" href="/viewjob?jk={jk}"><h2><span>{_words(rng, 3)}</span></h2>'
+                         f'<span class="companyName">{_words(rng, 2)}</span>'
+                         f'<div class="companyLocation">{_words(rng, 1)}, India</div></a>')
+            body = "".join(f"<p>{_words(rng, 60)}</p><ul>" + "".join(f"<li>{_words(rng, 8)}</li>" for _ in range(5)) + "</ul>"
+                           for _ in range(4))
+            pages.append((f"https://www.indeed.com/viewjob?jk={jk}",
+                          f"<html><body>{_chrome(rng, 150)}<div id=\"jobDescriptionText\">{body}</div>{_chrome(rng, 50)}</body></html>"))
+        pages.append((f"https://www.indeed.com/jobs?q=x&l=y&start={len(pages)}",
+                      f"<html><body>{_chrome(rng, 100)}<div id=\"mosaic\">{''.join(cards)}</div></body></html>"))
+    return pages[:n_pages]
+
+
+def _parser_for(url, scrapers):
+    indeed, naukri, linkedin = scrapers
+
+    def indeed_listing(html):
+        soup = html_parser.parse_html(html)
+        cards = soup.select("a.tapItem") or soup.select("div.job_seen_beacon")
+        return [indeed._parse_card(c, None, fetch_description=False) for c in cards]
+
+    if "indeed." in url:
+        return indeed_listing if "/jobs?" in url else indeed._description_from_html
+    if "naukri." in url and "-jobs-in-" in url:
+        return lambda html: naukri._parse_results(html, "")
+    if "linkedin." in url and "/jobs/search" in url:
+        return lambda html: linkedin._parse_results(html, "")
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--from-cache", action="store_true")
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--backends", default=",".join(html_parser.BACKENDS))
+    args = parser.parse_args()
+
+    pages = list(ResponseCache(mode="replay").iter_pages())[:args.pages] if args.from_cache else synthetic_pages(args.pages)
+    scrapers = IndeedScraper(use_proxies=False), NaukriScraper(), LinkedInScraper()
+    work = [(fn, html) for fn, html in ((_parser_for(url, scrapers), html) for url, html in pages) if fn]
+    if not work:
+        logger.error("No parseable pages to benchmark on.")
+        return
+    mb = sum(len(html) for _, html in work) / 1e6
+    print(f"\n{len(work)} pages, {mb:.1f} MB")
+    print(f"{'backend':<12}{'pages/s':>10}{'MB/s':>8}  same as bs4")
+    baseline = None
+    for backend in args.backends.split(","):
+        html_parser.set_backend(backend)
+        try:
+            t0 = time.perf_counter()
+            out = [fn(html) for fn, html in work]
+            elapsed = time.perf_counter() - t0
+        except RuntimeError as e:
+            print(f"{backend:<12}skipped: {e}")
+            continue
+        if backend == "bs4":
+            baseline = out
+        same = "-" if baseline is None else ("yes" if out == baseline else "NO")
+        print(f"{backend:<12}{len(work) / elapsed:>10.1f}{mb / elapsed:>8.2f}  {same}")
+
+
+if __name__ == '__main__':
+    main()
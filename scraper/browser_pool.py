@@ -0,0 +1,209 @@
+import asyncio
+import atexit
+import itertools
+import random
+import threading
+import time
+from playwright.async_api import async_playwright
+from playwright_stealth import stealth_async
+from ai_job_dashboard.scraper.response_cache import get_cache
+from ai_job_dashboard.utils import metrics
+from ai_job_dashboard.utils.config import (
+    BROWSER_CONTEXTS, BROWSER_TABS_PER_CONTEXT, BROWSER_BLOCK_RESOURCES, BROWSER_HEADLESS,
+)
+from ai_job_dashboard.utils.logger import get_logger
+from ai_job_dashboard.utils.proxy_pool import get_proxy_pool, playwright_proxy, PROXY_FAILURE_STATUSES
+logger = get_logger("BrowserPool")
+
+
+class _Slot:
+    """One of the pool's contexts; the browser context behind it is replaced when its proxy goes bad."""
+    __slots__ = ("ctx", "proxy", "lock")
+
+    def __init__(self, ctx, proxy):
+        self.ctx = ctx
+        self.proxy = proxy
+        self.lock = asyncio.Lock()
+
+
+class BrowserPool:
+    """
+    One long-lived Chromium with N contexts, driven by the async Playwright API on a
+    private event loop thread so that any (sync) scraper thread can submit page loads.
+    At most contexts * tabs pages are open at a time.
+    """
+
+    def __init__(self, contexts=BROWSER_CONTEXTS, tabs=BROWSER_TABS_PER_CONTEXT, headless=BROWSER_HEADLESS,
+                 block=BROWSER_BLOCK_RESOURCES, proxy_pool=None):
+        self.n_contexts = contexts
+        self.tabs = tabs
+        self.headless = headless
+        self.block = set(block)
+        self.proxy_pool = proxy_pool or get_proxy_pool()
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="browser-pool", daemon=True)
+        self._thread.start()
+        self.pages = 0
+        self.bytes = 0
+        self.started = time.perf_counter()
+        self._submit(self._start()).result()
+
+    def _submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    async def _start(self):
+        self._pw = await async_playwright().start()
+        self.browser = await self._pw.chromium.launch(headless=self.headless)
+        # open pages per browser context, and replaced contexts to close once they are idle
+        self._open = {}
+        self._retired = set()
+        self.contexts = [_Slot(*await self._new_context()) for _ in range(self.n_contexts)]
+        self._next_context = itertools.cycle(self.contexts)
+        self._slots = asyncio.Semaphore(self.n_contexts * self.tabs)
+        logger.info(f"Browser pool up: {self.n_contexts} contexts x {self.tabs} tabs, blocking {sorted(self.block)}")
+
+    async def _new_context(self):
+        # a context's exit is fixed for its lifetime; outcomes are still reported per page
+        proxy = self.proxy_pool.get()
+        ctx = await self.browser.new_context(proxy=playwright_proxy(proxy))
+        if self.block:
+            await ctx.route("**/*", self._route)
+        return ctx, proxy
+
+    async def _checkout(self, slot):
+        """The slot's context for one page; a quarantined or failing exit is swapped for a fresh proxy first."""
+        async with slot.lock:
+            # only worth it when the pool has a live proxy to switch to
+            if not self.proxy_pool.healthy(slot.proxy) and self.proxy_pool.available():
+                old = slot.ctx
+                slot.ctx, slot.proxy = await self._new_context()
+                logger.info(f"context moved to proxy {slot.proxy}")
+                self._retired.add(old)
+                await self._close_if_idle(old)
+            self._open[slot.ctx] = self._open.get(slot.ctx, 0) + 1
+            return slot.ctx, slot.proxy
+
+    async def _checkin(self, ctx):
+        self._open[ctx] -= 1
+        await self._close_if_idle(ctx)
+
+    async def _close_if_idle(self, ctx):
+        # pages still loading on a replaced context finish before it is closed
+        if ctx in self._retired and not self._open.get(ctx):
+            self._retired.discard(ctx)
+            self._open.pop(ctx, None)
+            try:
+                await ctx.close()
+            except Exception:
+                logger.exception("closing a replaced context failed")
+
+    async def _route(self, route):
+        # images/fonts/media are never parsed; dropping them saves most of the bandwidth and render time
+        if route.request.resource_type in self.block:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _fetch(self, url, scroll=False, delay=(0.3, 1.0)):
+        cache = get_cache()
+        if cache and cache.reads:
+            html = cache.get(url)
+            if html is not None:
+                return html
+        html = await self._load(url, scroll, delay)
+        if cache:
+            cache.put(url, html)
+        return html
+
+    async def _load(self, url, scroll, delay):
+        async with self._slots:
+            ctx, proxy = await self._checkout(next(self._next_context))
+            try:
+                page = await ctx.new_page()
+                transferred = 0
+
+                async def count(request):
+                    nonlocal transferred
+                    try:
+                        sizes = await request.sizes()
+                        transferred += sizes["responseBodySize"] + sizes["responseHeadersSize"]
+                    except Exception:
+                        pass
+
+                page.on("requestfinished", count)
+                try:
+                    try:
+                        await stealth_async(page)
+                    except Exception:
+                        pass
+                    t0 = time.perf_counter()
+                    try:
+                        resp = await page.goto(url, timeout=60000, wait_until="domcontentloaded")
+                    except Exception:
+                        self._report(proxy, False)
+                        raise
+                    self._report(proxy, resp is None or resp.status not in PROXY_FAILURE_STATUSES, time.perf_counter() - t0)
+                    if scroll:
+                        for _ in range(random.randint(3, 6)):
+                            await page.evaluate("window.scrollBy(0, window.innerHeight);")
+                            await asyncio.sleep(random.uniform(0.2, 0.6))
+                    # politeness delay; it only holds this tab, the other tabs keep loading
+                    await asyncio.sleep(random.uniform(*delay))
+                    return await page.content()
+                finally:
+                    await page.close()
+                    self.pages += 1
+                    self.bytes += transferred
+                    metrics.inc("browser_pages_total")
+                    metrics.inc("browser_bytes_total", transferred)
+            finally:
+                await self._checkin(ctx)
+
+    def _report(self, proxy, ok, latency=None):
+        self.proxy_pool.report(proxy, ok, latency)
+
+    def fetch(self, url, scroll=False):
+        return self._submit(self._fetch(url, scroll=scroll)).result()
+
+    def fetch_many(self, urls):
+        """Load urls concurrently on the pool's tabs; failures come back as the exception."""
+        async def run():
+            return await asyncio.gather(*[self._fetch(u) for u in urls], return_exceptions=True)
+        return self._submit(run()).result() if urls else []
+
+    def stats(self):
+        minutes = max(time.perf_counter() - self.started, 1e-9) / 60
+        return {
+            "pages": self.pages,
+            "bytes": self.bytes,
+            "pages_per_min": self.pages / minutes,
+            "bytes_per_page": self.bytes / max(self.pages, 1),
+        }
+
+    async def _stop(self):
+        for ctx in [slot.ctx for slot in self.contexts] + list(self._retired):
+            await ctx.close()
+        await self.browser.close()
+        await self._pw.stop()
+
+    def close(self):
+        if self.loop.is_running():
+            try:
+                self._submit(self._stop()).result(timeout=30)
+            except Exception:
+                logger.exception("browser pool shutdown failed")
+            self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool():
+    """Process-wide pool on the process-wide proxy pool, started on first use and shut down at exit."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool(proxy_pool=get_proxy_pool())
+            atexit.register(_pool.close)
+        return _pool
@@ -0,0 +1,47 @@
+from collections import namedtuple
+from datetime import timedelta
+from sqlalchemy import select, func
+from ai_job_dashboard.db.db import get_session
+from ai_job_dashboard.db.models import Job
+from ai_job_dashboard.utils.config import SCRAPER_DEDUP, SCRAPER_REFETCH_AFTER_HOURS
+from ai_job_dashboard.utils.logger import get_logger
+logger = get_logger("ScrapeDedup")
+
+CHUNK_SIZE = 1000
+
+# fresh: stored description is recent enough to skip the detail page entirely
+# etag / last_modified: validators from the last detail fetch, for a conditional re-fetch
+KnownJob = namedtuple("KnownJob", ["fresh", "etag", "last_modified"])
+
+
+def known_jobs(job_ids, max_age_hours=SCRAPER_REFETCH_AFTER_HOURS):
+    """
+    Batch lookup of scraped card ids before any detail page is fetched. Only jobs that
+    already have a description are returned; ids missing from the result need a full fetch.
+    """
+    job_ids = [j for j in dict.fromkeys(job_ids) if j]
+    if not SCRAPER_DEDUP or not job_ids:
+        return {}
+    seen = func.coalesce(Job.fetched_at, Job.updated_at, Job.created_at)
+    found = {}
+    session = get_session()
+    try:
+        # compare against the database clock, which is what wrote the timestamps
+        cutoff = session.execute(select(func.now())).scalar() - timedelta(hours=max_age_hours)
+        for start in range(0, len(job_ids), CHUNK_SIZE):
+            stmt = (select(Job.job_id, seen.label("seen"),
+                           Job.raw_data["etag"].as_string().label("etag"),
+                           Job.raw_data["last_modified"].as_string().label("last_modified"))
+                    .where(Job.job_id.in_(job_ids[start:start + CHUNK_SIZE]))
+                    .where(Job.description.isnot(None), Job.description != ""))
+            for row in session.execute(stmt):
+                found[row.job_id] = KnownJob(row.seen is not None and row.seen >= cutoff, row.etag, row.last_modified)
+    except Exception:
+        # dedup is an optimisation; without the db every card is simply fetched
+        logger.exception("known job lookup failed")
+        return {}
+    finally:
+        session.close()
+    fresh = sum(1 for k in found.values() if k.fresh)
+    logger.info(f"{len(job_ids)} cards: {fresh} fresh, {len(found) - fresh} stale, {len(job_ids) - len(found)} new")
+    return found
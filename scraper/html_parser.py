@@ -0,0 +1,167 @@
+"""
+Pluggable HTML parsing for the scrapers. Every backend returns nodes with the small subset of
+the BeautifulSoup API the scrapers use (select, select_one, get, get_text), so the same CSS
+selectors and fallback chains work unchanged.
+
+HTML_PARSER backends:
+    bs4         BeautifulSoup over lxml; builds a Python object per node (default)
+    lxml        lxml.html + cssselect; C tree, only matched nodes are wrapped
+    selectolax  selectolax's Lexbor engine; C tree and C CSS matching, usually fastest
+"""
+from ai_job_dashboard.utils.config import HTML_PARSER
+
+BACKENDS = ("bs4", "lxml", "selectolax")
+# elements whose contents never count as text (bs4 already skips script/style/template strings)
+SKIP_TEXT = ("script", "style", "noscript", "template")
+
+
+def _join(parts, separator, strip):
+    # BeautifulSoup semantics: with strip=True each text run is stripped and empty runs dropped
+    if strip:
+        parts = [p.strip() for p in parts]
+        parts = [p for p in parts if p]
+    return separator.join(parts)
+
+
+def _soup_strings(el, out):
+    from bs4.element import NavigableString, CData
+    for child in el.children:
+        if type(child) in (NavigableString, CData):
+            out.append(str(child))
+        elif getattr(child, "name", None) and child.name not in SKIP_TEXT:
+            _soup_strings(child, out)
+    return out
+
+
+def _lxml_strings(el, out):
+    if el.text:
+        out.append(el.text)
+    for child in el:
+        # comments and processing instructions have a non-string tag; only their tail is text
+        if isinstance(child.tag, str) and child.tag not in SKIP_TEXT:
+            _lxml_strings(child, out)
+        if child.tail:
+            out.append(child.tail)
+    return out
+
+
+def _lexbor_strings(node, out):
+    for child in node.iter(include_text=True):
+        if child.tag == "-text":
+            out.append(child.text_content)
+        elif child.tag not in SKIP_TEXT:
+            _lexbor_strings(child, out)
+    return out
+
+
+class SoupNode:
+    __slots__ = ("el",)
+
+    def __init__(self, el):
+        self.el = el
+
+    def select(self, css):
+        return [SoupNode(e) for e in self.el.select(css)]
+
+    def select_one(self, css):
+        e = self.el.select_one(css)
+        return SoupNode(e) if e is not None else None
+
+    def get(self, attr, default=None):
+        return self.el.get(attr, default)
+
+    def get_text(self, separator="", strip=False):
+        if self.el.find("noscript") is None:
+            return self.el.get_text(separator, strip=strip)
+        return _join(_soup_strings(self.el, []), separator, strip)
+
+
+class LxmlNode:
+    __slots__ = ("el",)
+    _compiled = {}
+
+    def __init__(self, el):
+        self.el = el
+
+    @classmethod
+    def _xpath(cls, css):
+        # translating CSS to XPath is the slow part of cssselect; do it once per selector
+        if css not in cls._compiled:
+            from lxml.cssselect import CSSSelector
+            cls._compiled[css] = CSSSelector(css)
+        return cls._compiled[css]
+
+    def select(self, css):
+        return [LxmlNode(e) for e in self._xpath(css)(self.el)]
+
+    def select_one(self, css):
+        found = self._xpath(css)(self.el)
+        return LxmlNode(found[0]) if found else None
+
+    def get(self, attr, default=None):
+        return self.el.get(attr, default)
+
+    def get_text(self, separator="", strip=False):
+        if next(self.el.iter(*SKIP_TEXT), None) is None:
+            return _join(list(self.el.itertext()), separator, strip)
+        return _join(_lxml_strings(self.el, []), separator, strip)
+
+
+class LexborNode:
+    __slots__ = ("el",)
+
+    def __init__(self, el):
+        self.el = el
+
+    def select(self, css):
+        return [LexborNode(e) for e in self.el.css(css)]
+
+    def select_one(self, css):
+        e = self.el.css_first(css)
+        return LexborNode(e) if e is not None else None
+
+    def get(self, attr, default=None):
+        value = self.el.attributes.get(attr)
+        return default if value is None else value
+
+    def get_text(self, separator="", strip=False):
+        if self.el.css_first(",".join(SKIP_TEXT)) is None:
+            # \x00 never occurs in html text, so it safely marks the text-node boundaries
+            return _join(self.el.text(separator="\x00").split("\x00"), separator, strip)
+        # the document itself is a parser object; the walk starts from its <html> node
+        return _join(_lexbor_strings(getattr(self.el, "root", self.el), []), separator, strip)
+
+
+_backend = HTML_PARSER
+
+
+def set_backend(name):
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown HTML parser backend: {name}")
+    global _backend
+    _backend = name
+
+
+def get_backend():
+    return _backend
+
+
+def parse_html(html, backend=None):
+    backend = backend or _backend
+    if backend == "bs4":
+        from bs4 import BeautifulSoup
+        return SoupNode(BeautifulSoup(html, "lxml"))
+    if backend == "lxml":
+        try:
+            import lxml.html
+            import cssselect  # noqa: F401
+        except ImportError:
+            raise RuntimeError("HTML_PARSER=lxml needs lxml and cssselect (pip install lxml cssselect)")
+        return LxmlNode(lxml.html.document_fromstring(html or "<html></html>"))
+    if backend == "selectolax":
+        try:
+            from selectolax.lexbor import LexborHTMLParser
+        except ImportError:
+            raise RuntimeError("HTML_PARSER=selectolax needs selectolax (pip install selectolax)")
+        return LexborNode(LexborHTMLParser(html or ""))
+    raise ValueError(f"Unknown HTML parser backend: {backend}")
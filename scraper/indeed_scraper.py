@@ -1,31 +1,32 @@
 from playwright.sync_api import sync_playwright, BrowserContext
 from playwright_stealth import stealth_sync
-from bs4 import BeautifulSoup
 import time, random, os
+from ai_job_dashboard.scraper.browser_pool import get_browser_pool
+from ai_job_dashboard.scraper.dedup import known_jobs
+from ai_job_dashboard.scraper.html_parser import parse_html
+from ai_job_dashboard.scraper.response_cache import get_cache, CachedPages
+from ai_job_dashboard.utils.config import INDEED_BROWSER_POOL
 from ai_job_dashboard.utils.logger import get_logger
-from ai_job_dashboard.utils.proxy_pool import ProxyPool
+from ai_job_dashboard.utils.proxy_pool import ProxyPool, get_proxy_pool, playwright_proxy
 
 logger = get_logger("IndeedStealth")
 
-# Load proxies from file (optional)
-def load_proxies(path="proxies.txt"):
-    if not os.path.exists(path):
-        return []
-    with open(path,"r") as f:
-        return [l.strip() for l in f.readlines() if l.strip()]
-
 class IndeedScraper:
     BASE_URL = "https://www.indeed.com/jobs?q={query}&l={location}&start={start}"
 
-    def __init__(self, headless=False, use_proxies=True, profile_dir="browser_profiles"):
+    def __init__(self, headless=False, use_proxies=True, profile_dir="browser_profiles", browser_pool=INDEED_BROWSER_POOL,
+                 proxy_pool=None):
         self.headless = headless
+        self.browser_pool = browser_pool
         self.use_proxies = use_proxies
         self.profile_dir = profile_dir
-        if use_proxies:
-            proxies = load_proxies()
-            self.proxy_pool = ProxyPool(proxies=proxies)
-        else:
-            self.proxy_pool = ProxyPool(proxies=[])
+        # the process-wide pool, so proxy health carries over between scraper instances
+        self.proxy_pool = (proxy_pool or get_proxy_pool()) if use_proxies else ProxyPool(proxies=[])
+        # browser mode keeps one context (and its proxy) open across search() calls; see close()
+        self._pw = None
+        self._ctx = None
+        self._page = None
+        self._proxy = None
 
     def _new_context(self, p, proxy=None, profile_name=None, user_agent=None):
         # create or reuse persistent context directory for profile reuse & cookie persistence
@@ -34,6 +35,8 @@ class IndeedScraper:
             os.makedirs(self.profile_dir, exist_ok=True)
             persistent = os.path.join(self.profile_dir, profile_name)
         launch_args = {"headless": self.headless}
+        if proxy:
+            launch_args["proxy"] = playwright_proxy(proxy)
         # open browser once, create context or persistent context
         browser = p.chromium.launch_persistent_context(persistent, **launch_args) if persistent else p.chromium.launch(**launch_args).new_context()
         # Note: when using launch_persistent_context, a real user profile is used and cookies persist
@@ -46,63 +49,161 @@ class IndeedScraper:
             pass
         return ctx
 
-    def search(self, query="data scientist", location="India", max_pages=1):
+    def search(self, query="data scientist", location="India", max_pages=1, start_page=0):
+        cache = get_cache()
+        if cache and cache.replay:
+            # no browser at all: listing and detail pages come from the response cache
+            return self._search_pooled(query, location, max_pages, start_page, pool=CachedPages(cache))
+        if self.browser_pool:
+            return self._search_pooled(query, location, max_pages, start_page)
         results = []
-        proxies_tried = set()
-        with sync_playwright() as p:
-            # pick proxy if available
-            proxy = self.proxy_pool.get() if self.use_proxies else None
-            logger.info(f"Using proxy: {proxy}")
-            # profile name to reuse cookies/profiles (randomized)
-            profile_name = f"profile_{random.randint(1,1000)}"
-            ctx = self._new_context(p, proxy=proxy, profile_name=profile_name)
-            # ensure page exists
-            page = ctx.pages[0] if ctx.pages else ctx.new_page()
-            for page_no in range(max_pages):
-                url = self.BASE_URL.format(query=query.replace(" ", "+"),
-                                           location=location.replace(" ", "+"),
-                                           start=page_no * 10)
+        page = self._open()
+        for page_no in range(start_page, start_page + max_pages):
+            url = self.BASE_URL.format(query=query.replace(" ", "+"),
+                                       location=location.replace(" ", "+"),
+                                       start=page_no * 10)
+            html = cache.get(url) if cache and cache.reads else None
+            fetched = html is None
+            if html is None:
                 try:
                     logger.info(f"Visiting Indeed: {url}")
+                    t0 = time.perf_counter()
                     page.goto(url, timeout=60000, wait_until="domcontentloaded")
-                except Exception as e:
+                except Exception:
                     logger.exception("goto failed")
+                    self.proxy_pool.report(self._proxy, False)
                     # rotate proxy and retry once
                     if self.use_proxies:
-                        proxy = self.proxy_pool.get()
-                        proxies_tried.add(proxy)
-                        logger.info(f"Retrying with proxy {proxy}")
-                        ctx.close()
-                        ctx = self._new_context(p, proxy=proxy, profile_name=profile_name)
-                        page = ctx.pages[0] if ctx.pages else ctx.new_page()
-                        page.goto(url, timeout=60000, wait_until="domcontentloaded")
+                        self._rotate()
+                        page = self._open()
+                        logger.info(f"Retrying with proxy {self._proxy}")
+                        t0 = time.perf_counter()
+                        try:
+                            page.goto(url, timeout=60000, wait_until="domcontentloaded")
+                        except Exception:
+                            self.proxy_pool.report(self._proxy, False)
+                            raise
+                latency = time.perf_counter() - t0
                 # human-like actions
                 self._human_interaction(page)
                 self._auto_scroll(page)
                 html = page.content()
-                soup = BeautifulSoup(html, "lxml")
-                cards = soup.select("a.tapItem")
-                # if no cards, try different selectors (indeed sometimes uses other classes)
-                if not cards:
-                    cards = soup.select("div.job_seen_beacon")
-                if not cards:
-                    logger.error("No cards found; possible detection. rotating proxy / waiting and retrying.")
-                    time.sleep(random.uniform(2,5))
-                    continue
-                for card in cards:
-                    try:
-                        job = self._parse_card(card, page)
-                        if job:
-                            results.append(job)
-                    except Exception:
-                        logger.exception("card parse failed")
-            # close context
+                if cache:
+                    cache.put(url, html)
+            soup = parse_html(html)
+            cards = soup.select("a.tapItem")
+            # if no cards, try different selectors (indeed sometimes uses other classes)
+            if not cards:
+                cards = soup.select("div.job_seen_beacon")
+            if not cards:
+                logger.error("No cards found; possible detection. rotating proxy / waiting and retrying.")
+                if fetched:
+                    # a block page counts against the exit it came through
+                    self.proxy_pool.report(self._proxy, False)
+                    if self.use_proxies and self.proxy_pool.proxies:
+                        self._rotate()
+                        page = self._open()
+                time.sleep(random.uniform(2,5))
+                continue
+            if fetched:
+                self.proxy_pool.report(self._proxy, True, latency)
+            jobs = []
+            for card in cards:
+                try:
+                    job = self._parse_card(card, page, fetch_description=False)
+                    if job:
+                        jobs.append(job)
+                except Exception:
+                    logger.exception("card parse failed")
+            for job in self._needs_detail(jobs):
+                job["description"] = self._fetch_description(page, job["url"])
+            results += jobs
+        return results
+
+    def _open(self):
+        """The page of this scraper's browser context, opened on first use and kept across searches."""
+        if self._ctx is not None and self.use_proxies and not self.proxy_pool.healthy(self._proxy) \
+                and self.proxy_pool.available():
+            # the exit went bad since the last search; move to a live one
+            self._rotate()
+        if self._ctx is None:
+            if self._pw is None:
+                # sync Playwright is bound to this thread; the ETL keeps one scraper per worker thread
+                self._pw = sync_playwright().start()
+            self._proxy = self.proxy_pool.get() if self.use_proxies else None
+            logger.info(f"Using proxy: {self._proxy}")
+            # profile name to reuse cookies/profiles (randomized)
+            profile_name = f"profile_{random.randint(1,1000)}"
+            self._ctx = self._new_context(self._pw, proxy=self._proxy, profile_name=profile_name)
+            # ensure page exists
+            self._page = self._ctx.pages[0] if self._ctx.pages else self._ctx.new_page()
+        return self._page
+
+    def _rotate(self):
+        # drop the context and its exit; the next _open() starts one on a fresh proxy
+        if self._ctx is not None:
             try:
-                ctx.close()
+                self._ctx.close()
             except Exception:
                 pass
+        self._ctx = self._page = None
+
+    def close(self):
+        """Close the browser; call from the thread that ran search()."""
+        self._rotate()
+        if self._pw is not None:
+            try:
+                self._pw.stop()
+            except Exception:
+                pass
+            self._pw = None
+
+    def _search_pooled(self, query, location, max_pages, start_page, pool=None):
+        # shared long-lived browser; detail pages of a results page load in parallel tabs
+        # the shared browser always routes through the shared proxy pool
+        pool = pool or get_browser_pool()
+        before = pool.stats()
+        t0 = time.perf_counter()
+        results = []
+        for page_no in range(start_page, start_page + max_pages):
+            url = self.BASE_URL.format(query=query.replace(" ", "+"),
+                                       location=location.replace(" ", "+"),
+                                       start=page_no * 10)
+            logger.info(f"Visiting Indeed: {url}")
+            try:
+                html = pool.fetch(url, scroll=True)
+            except Exception:
+                logger.exception("goto failed")
+                continue
+            soup = parse_html(html)
+            cards = soup.select("a.tapItem") or soup.select("div.job_seen_beacon")
+            if not cards:
+                logger.error("No cards found; possible detection.")
+                continue
+            jobs = []
+            for card in cards:
+                try:
+                    job = self._parse_card(card, None, fetch_description=False)
+                    if job:
+                        jobs.append(job)
+                except Exception:
+                    logger.exception("card parse failed")
+            todo = self._needs_detail(jobs)
+            for job, html in zip(todo, pool.fetch_many([j["url"] for j in todo])):
+                job["description"] = self._description_from_html(html) if isinstance(html, str) else ""
+            results += jobs
+        after = pool.stats()
+        loaded = after["pages"] - before["pages"]
+        minutes = max(time.perf_counter() - t0, 1e-9) / 60
+        logger.info(f"Indeed pool: {loaded} pages, {loaded / minutes:.1f} pages/min, "
+                    f"{(after['bytes'] - before['bytes']) / max(len(results), 1) / 1024:.0f} KB per job")
         return results
 
+    def _needs_detail(self, jobs):
+        # cards whose description is already stored and recent keep it (empty description = keep)
+        known = known_jobs([j["job_id"] for j in jobs])
+        return [j for j in jobs if j["url"] and not (j["job_id"] in known and known[j["job_id"]].fresh)]
+
     def _human_interaction(self, page):
         # small random viewport change, mouse moves and small clicks
         try:
@@ -126,7 +227,7 @@ class IndeedScraper:
         except Exception:
             pass
 
-    def _parse_card(self, card, page):
+    def _parse_card(self, card, page, fetch_description=True):
         title = card.select_one("h2 span") or card.select_one("h2")
         company = card.select_one(".companyName") or card.select_one(".company")
         location = card.select_one(".companyLocation")
@@ -135,7 +236,7 @@ class IndeedScraper:
         link = "https://www.indeed.com" + href if href and href.startswith("/") else href
 
         description = ""
-        if link:
+        if link and fetch_description:
             description = self._fetch_description(page, link)
         return {
             "source": "indeed",
@@ -148,6 +249,10 @@ class IndeedScraper:
         }
 
     def _fetch_description(self, page, link):
+        cache = get_cache()
+        html = cache.get(link) if cache and cache.reads else None
+        if html is not None:
+            return self._description_from_html(html)
         try:
             newp = page.context.new_page()
             try:
@@ -158,8 +263,13 @@ class IndeedScraper:
             time.sleep(random.uniform(0.8,2.0))
             html = newp.content()
             newp.close()
-            soup = BeautifulSoup(html, "lxml")
-            desc = soup.select_one("#jobDescriptionText") or soup.select_one(".jobsearch-jobDescriptionText")
-            return desc.get_text("\n", strip=True) if desc else ""
+            if cache:
+                cache.put(link, html)
+            return self._description_from_html(html)
         except Exception:
             return ""
+
+    def _description_from_html(self, html):
+        soup = parse_html(html)
+        desc = soup.select_one("#jobDescriptionText") or soup.select_one(".jobsearch-jobDescriptionText")
+        return desc.get_text("\n", strip=True) if desc else ""
@@ -1,44 +1,108 @@
+import time
 from playwright.sync_api import sync_playwright
+from ai_job_dashboard.scraper.html_parser import parse_html
+from ai_job_dashboard.scraper.response_cache import get_cache
 from ai_job_dashboard.utils.logger import get_logger
+from ai_job_dashboard.utils.proxy_pool import get_proxy_pool, playwright_proxy, PROXY_FAILURE_STATUSES
 logger = get_logger("LinkedInScraper")
 
 class LinkedInScraper:
     BASE_SEARCH = "https://www.linkedin.com/jobs/search/?keywords={query}&location={location}&start={start}"
 
-    def __init__(self, headless=True):
+    def __init__(self, headless=True, proxy_pool=None):
         self.headless = headless
+        self.proxy_pool = proxy_pool or get_proxy_pool()
+        # one browser kept across search() calls; see close()
+        self._pw = None
+        self._browser = None
+        self._page = None
+        self._proxy = None
 
-    def search(self, query="data scientist", location="India", max_pages=1):
+    def search(self, query="data scientist", location="India", max_pages=1, start_page=0):
+        urls = [self.BASE_SEARCH.format(query=query.replace(" ", "%20"), location=location.replace(" ", "%20"), start=start)
+                for start in range(start_page*25, (start_page+max_pages)*25, 25)]
+        cache = get_cache()
+        if cache and cache.replay:
+            return [job for url in urls for job in self._parse_results(cache.get(url), location)]
         results = []
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=self.headless)
-            page = browser.new_page()
-            for start in range(0, max_pages*25, 25):
-                url = self.BASE_SEARCH.format(query=query.replace(" ", "%20"), location=location.replace(" ", "%20"), start=start)
+        page = self._open()
+        for url in urls:
+            html = cache.get(url) if cache and cache.reads else None
+            if html is None:
                 logger.info(f"Visit {url}")
-                page.goto(url, timeout=60000)
+                t0 = time.perf_counter()
+                try:
+                    resp = page.goto(url, timeout=60000)
+                except Exception:
+                    self.proxy_pool.report(self._proxy, False)
+                    # the next search starts a browser on another exit
+                    self._rotate()
+                    raise
+                self.proxy_pool.report(self._proxy, resp is None or resp.status not in PROXY_FAILURE_STATUSES,
+                                       time.perf_counter() - t0)
                 page.wait_for_timeout(3000)
-                job_cards = page.query_selector_all("ul.jobs-search__results-list li")
-                if not job_cards:
-                    # fallback selectors
-                    job_cards = page.query_selector_all(".job-card-container")
-                for card in job_cards:
-                    try:
-                        title = card.query_selector("h3") and card.query_selector("h3").inner_text().strip()
-                        company = card.query_selector(".base-search-card__subtitle") and card.query_selector(".base-search-card__subtitle").inner_text().strip()
-                        link_el = card.query_selector("a")
-                        link = link_el.get_attribute("href") if link_el else None
-                        job = {
-                            "source": "linkedin",
-                            "job_id": link.split("/")[-1] if link else None,
-                            "title": title,
-                            "company": company,
-                            "location": location,
-                            "description": "",  # fetch later if desired
-                            "url": link
-                        }
-                        results.append(job)
-                    except Exception:
-                        logger.exception("card parse error")
-            browser.close()
+                html = page.content()
+                if cache:
+                    cache.put(url, html)
+            results += self._parse_results(html, location)
+        return results
+
+    def _open(self):
+        """The browser page, launched on first use and reused until its proxy goes bad."""
+        if self._browser is not None and not self.proxy_pool.healthy(self._proxy) and self.proxy_pool.available():
+            self._rotate()
+        if self._browser is None:
+            if self._pw is None:
+                # sync Playwright is bound to this thread; the ETL keeps one scraper per worker thread
+                self._pw = sync_playwright().start()
+            # the browser's exit is fixed at launch; each page load is reported against it
+            self._proxy = self.proxy_pool.get()
+            self._browser = self._pw.chromium.launch(headless=self.headless, proxy=playwright_proxy(self._proxy))
+            self._page = self._browser.new_page()
+        return self._page
+
+    def _rotate(self):
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception:
+                pass
+        self._browser = self._page = None
+
+    def close(self):
+        """Close the browser; call from the thread that ran search()."""
+        self._rotate()
+        if self._pw is not None:
+            try:
+                self._pw.stop()
+            except Exception:
+                pass
+            self._pw = None
+
+    def _parse_results(self, html, location):
+        # parsed from the page html rather than live element handles, so cached pages replay
+        soup = parse_html(html)
+        job_cards = soup.select("ul.jobs-search__results-list li")
+        if not job_cards:
+            # fallback selectors
+            job_cards = soup.select(".job-card-container")
+        results = []
+        for card in job_cards:
+            try:
+                title = card.select_one("h3") and card.select_one("h3").get_text(strip=True)
+                company = card.select_one(".base-search-card__subtitle") and card.select_one(".base-search-card__subtitle").get_text(strip=True)
+                link_el = card.select_one("a")
+                link = link_el.get("href") if link_el else None
+                job = {
+                    "source": "linkedin",
+                    "job_id": link.split("/")[-1] if link else None,
+                    "title": title,
+                    "company": company,
+                    "location": location,
+                    "description": "",  # fetch later if desired
+                    "url": link
+                }
+                results.append(job)
+            except Exception:
+                logger.exception("card parse error")
         return results
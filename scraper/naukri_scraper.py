@@ -1,35 +1,54 @@
 from ai_job_dashboard.scraper.base_scraper import BaseScraper
-from bs4 import BeautifulSoup
+from ai_job_dashboard.scraper.dedup import known_jobs
+from ai_job_dashboard.scraper.html_parser import parse_html
 from ai_job_dashboard.utils.logger import get_logger
 logger = get_logger("NaukriScraper")
 
 class NaukriScraper(BaseScraper):
-    SEARCH_URL = "https://www.naukri.com/{query}-jobs-in-{location}?k={query}&l={location}"
+    SEARCH_URL = "https://www.naukri.com/{query}-jobs-in-{location}{page}?k={query}&l={location}"
 
-    def search(self, query="data scientist", location="Bangalore", max_pages=1):
+    def search(self, query="data scientist", location="Bangalore", max_pages=1, start_page=0):
+        results = []
+        for page_no in range(start_page, start_page + max_pages):
+            results += self._search_page(query, location, page_no)
+        return results
+
+    def _search_page(self, query, location, page_no):
         q = query.replace(" ", "-")
         loc = location.replace(" ", "-")
-        url = self.SEARCH_URL.format(query=q, location=loc)
-        html = self.get(url)
-        soup = BeautifulSoup(html, "lxml")
+        # naukri numbers result pages from 2 as a path suffix: ...-jobs-in-bangalore-2
+        url = self.SEARCH_URL.format(query=q, location=loc, page=f"-{page_no + 1}" if page_no else "")
+        results = self._parse_results(self.get(url), location)
+        # only new or stale postings need their detail page; stale ones are revalidated
+        known = known_jobs([job["job_id"] for job in results])
+        todo = [job for job in results if job["url"] and not (job["job_id"] in known and known[job["job_id"]].fresh)]
+        validators = {job["url"]: known[job["job_id"]][1:] for job in todo if job["job_id"] in known}
+        # detail pages are fetched together instead of one blocking GET per card
+        pages = self.fetch_many_conditional([job["url"] for job in todo], validators)
+        for job, page in zip(todo, pages):
+            if isinstance(page, BaseException):
+                logger.info(f"detail page {job['url']} failed: {page!r}")
+            elif page.status == 304:
+                # unchanged since the last fetch: the stored description and validators are kept
+                etag, last_modified = validators[job["url"]]
+                job.update(not_modified=True, etag=page.etag or etag, last_modified=page.last_modified or last_modified)
+            else:
+                job.update(description=page.text, etag=page.etag, last_modified=page.last_modified)
+        return results
+
+    def _parse_results(self, html, location):
         results = []
-        for card in soup.select("article.jobTuple"):
+        for card in parse_html(html).select("article.jobTuple"):
             title = card.select_one("a.title")
             company = card.select_one("a.subTitle")
-            link = title['href'] if title else None
-            desc = ""
-            if link:
-                try:
-                    desc = self.get(link)
-                except Exception:
-                    desc = ""
+            link = title.get('href') if title else None
             results.append({
                 "source": "naukri",
                 "job_id": card.get("data-job-id", link),
                 "title": title.get_text(strip=True) if title else None,
                 "company": company.get_text(strip=True) if company else None,
                 "location": location,
-                "description": desc,
+                "description": "",
                 "url": link
             })
         return results
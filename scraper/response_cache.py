@@ -0,0 +1,159 @@
+"""
+Content-addressed on-disk cache of fetched pages, so parsers can be developed, benchmarked
+and whole ETL runs reproduced without touching the live sites.
+
+SCRAPER_CACHE modes:
+    off     no caching (default)
+    on      serve fresh hits, fetch and store misses
+    record  always fetch, store every page
+    replay  serve only from the cache, ignoring the TTL; a miss is an error, nothing is fetched
+Replaying a production run through the full pipeline:
+    SCRAPER_CACHE=replay SCRAPER_DEDUP=0 python -c "from ai_job_dashboard.workers.pipeline import run_etl; run_etl('data scientist', 'India')"
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from ai_job_dashboard.utils.config import SCRAPER_CACHE, SCRAPER_CACHE_DIR, SCRAPER_CACHE_TTL_HOURS, SCRAPER_CACHE_MAX_MB
+from ai_job_dashboard.utils.logger import get_logger
+logger = get_logger("ResponseCache")
+
+# request headers that change the response and are therefore part of the key
+KEY_HEADERS = ("accept-language",)
+
+
+class CacheMiss(Exception):
+    pass
+
+
+class ResponseCache:
+    """url (+ KEY_HEADERS) -> gzip'd JSON record {url, fetched_at, html}, evicted oldest-first past max_bytes."""
+
+    def __init__(self, path=SCRAPER_CACHE_DIR, mode=SCRAPER_CACHE, ttl_hours=SCRAPER_CACHE_TTL_HOURS,
+                 max_mb=SCRAPER_CACHE_MAX_MB):
+        self.path = path
+        self.mode = mode
+        self.ttl = ttl_hours * 3600
+        self.max_bytes = int(max_mb * 2 ** 20)
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+        self.size = sum(os.path.getsize(f) for f in self._files())
+
+    @property
+    def reads(self):
+        return self.mode in ("on", "replay")
+
+    @property
+    def replay(self):
+        return self.mode == "replay"
+
+    def key(self, url, headers=None):
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        material = url + "".join(f"\n{h}:{headers[h]}" for h in KEY_HEADERS if h in headers)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _file(self, key):
+        return os.path.join(self.path, key[:2], key + ".json.gz")
+
+    def _files(self):
+        for root, _, names in os.walk(self.path):
+            for name in names:
+                if name.endswith(".json.gz"):
+                    yield os.path.join(root, name)
+
+    def get(self, url, headers=None):
+        """Cached html, or None. In replay mode the TTL is ignored and a miss raises CacheMiss."""
+        f = self._file(self.key(url, headers))
+        try:
+            if not self.replay and time.time() - os.path.getmtime(f) > self.ttl:
+                return None
+            with gzip.open(f, "rt", encoding="utf-8") as fh:
+                return json.load(fh)["html"]
+        except (OSError, ValueError, KeyError):
+            if self.replay:
+                raise CacheMiss(url)
+            return None
+
+    def put(self, url, html, headers=None):
+        if self.replay or not html:
+            return
+        f = self._file(self.key(url, headers))
+        os.makedirs(os.path.dirname(f), exist_ok=True)
+        tmp = f"{f}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=6) as fh:
+            json.dump({"url": url, "fetched_at": time.time(), "html": html}, fh)
+        old = os.path.getsize(f) if os.path.exists(f) else 0
+        os.replace(tmp, f)
+        with self._lock:
+            self.size += os.path.getsize(f) - old
+            if self.size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        # oldest first down to 90% of the budget, so eviction does not run on every put
+        files = sorted(self._files(), key=os.path.getmtime)
+        target = self.max_bytes * 0.9
+        removed = 0
+        for f in files:
+            if self.size <= target:
+                break
+            try:
+                n = os.path.getsize(f)
+                os.remove(f)
+                self.size -= n
+                removed += 1
+            except OSError:
+                pass
+        logger.info(f"Evicted {removed} cached pages, {self.size / 2 ** 20:.0f} MB left")
+
+    def iter_pages(self):
+        """(url, html) for every stored page, e.g. a parse benchmark corpus."""
+        for f in self._files():
+            try:
+                with gzip.open(f, "rt", encoding="utf-8") as fh:
+                    record = json.load(fh)
+                yield record["url"], record["html"]
+            except (OSError, ValueError, KeyError):
+                continue
+
+
+class CachedPages:
+    """Stand-in for BrowserPool that serves pages from the cache only (replay mode)."""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.pages = 0
+
+    def fetch(self, url, scroll=False):
+        html = self.cache.get(url)
+        self.pages += 1
+        return html
+
+    def fetch_many(self, urls):
+        out = []
+        for url in urls:
+            try:
+                out.append(self.fetch(url))
+            except CacheMiss as e:
+                out.append(e)
+        return out
+
+    def stats(self):
+        return {"pages": self.pages, "bytes": 0}
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """Process-wide cache, or None when SCRAPER_CACHE is off."""
+    global _cache
+    if SCRAPER_CACHE == "off":
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+        return _cache
@@ -1,18 +1,23 @@
 import streamlit as st
 from ai_job_dashboard.db.db import get_session
-from ai_job_dashboard.db.models import Job
+from ai_job_dashboard.db.models import SkillCount
+from ai_job_dashboard.db.skill_counts import top_skills
+from sqlalchemy import select
 import pandas as pd
 
 st.title("Skills Explorer")
 
 session = get_session()
-jobs = session.query(Job).limit(2000).all()
+sources = [""] + list(session.execute(select(SkillCount.source).distinct().order_by(SkillCount.source)).scalars())
+source = st.sidebar.selectbox("Source", sources, format_func=lambda s: s or "All")
+location = st.sidebar.text_input("Location (exact)")
+window = st.sidebar.date_input("Date window", value=())
+since, until = (window[0], window[-1]) if window else (None, None)
 
-skills = {}
-for j in jobs:
-    for s in j.skills or []:
-        skills[s] = skills.get(s, 0) + 1
+# counted in the database over every job (skill_counts roll-up)
+skills = top_skills(session, limit=None, source=source or None, location=location or None, since=since, until=until)
+session.close()
 
-sk_df = pd.DataFrame(sorted(skills.items(), key=lambda x: -x[1]), columns=["skill","count"])
+sk_df = pd.DataFrame(skills, columns=["skill","count"])
 st.dataframe(sk_df.head(200))
 st.download_button("Download CSV", sk_df.to_csv(index=False), file_name="skills.csv")
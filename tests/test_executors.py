@@ -0,0 +1,41 @@
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("fastapi")
+from fastapi import HTTPException  # noqa: E402
+from ai_job_dashboard.api.executors import Admission, run_in, with_timeout, work_pool  # noqa: E402
+
+
+def test_timed_out_request_holds_its_slot_until_work_finishes():
+    admission = Admission(limit=1, name="test")
+
+    async def request():
+        with admission.slot():
+            return await with_timeout(run_in(work_pool, time.sleep, 0.3), timeout=0.05)
+
+    async def scenario():
+        with pytest.raises(HTTPException) as timed_out:
+            await request()
+        assert timed_out.value.status_code == 504
+        # the sleep is still running on the pool, so a second request is turned away
+        assert admission.pending == 1
+        with pytest.raises(HTTPException) as busy:
+            await request()
+        assert busy.value.status_code == 429
+        await asyncio.sleep(0.5)
+        assert admission.pending == 0
+
+    asyncio.run(scenario())
+
+
+def test_finished_request_releases_its_slot():
+    admission = Admission(limit=1, name="test")
+
+    async def scenario():
+        with admission.slot():
+            assert await run_in(work_pool, sum, [1, 2]) == 3
+        assert admission.pending == 0
+
+    asyncio.run(scenario())
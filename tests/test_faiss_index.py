@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+
+faiss = pytest.importorskip("faiss")
+from ai_job_dashboard.ml import faiss_index  # noqa: E402
+from ai_job_dashboard.ml.faiss_index import make_index, search_index  # noqa: E402
+
+# per-query overrides that make every index type search exhaustively
+OVERRIDES = {"flat": {}, "ivf_flat": {"nprobe": 1024}, "ivf_pq": {"nprobe": 1024}, "hnsw": {"ef_search": 256}}
+
+
+def _corpus(n=2000, dim=32, seed=0):
+    x = np.random.default_rng(seed).standard_normal((n, dim)).astype('float32')
+    faiss.normalize_L2(x)
+    return x
+
+
+def _keys(n, start=7):
+    # FAISS keys are Job.ids, not positions
+    return start + 3 * np.arange(n, dtype='int64')
+
+
+def _built(kind, x, keys):
+    index = make_index(x, kind=kind, pq_m=8)
+    index.add_with_ids(x, keys)
+    return index
+
+
+@pytest.mark.parametrize("kind", sorted(OVERRIDES))
+def test_search_with_overrides_returns_keys(kind):
+    x, keys = _corpus(), _keys(2000)
+    index = _built(kind, x, keys)
+    _, I = search_index(index, x[:50], 5, **OVERRIDES[kind])
+    assert set(I.ravel().tolist()) <= set(keys.tolist())
+    # PQ distances are approximate; everything else finds each vector itself
+    assert (I[:, 0] == keys[:50]).mean() >= (0.9 if kind == "ivf_pq" else 1.0)
+
+
+@pytest.mark.parametrize("kind", ["flat", "ivf_flat"])
+def test_remove_then_add_keeps_keys(kind):
+    x, keys = _corpus(), _keys(2000)
+    index = _built(kind, x, keys)
+    index.remove_ids(faiss.IDSelectorArray(keys[:500]))
+    extra, extra_keys = _corpus(100, seed=1), _keys(100, start=10 ** 6)
+    index.add_with_ids(extra, extra_keys)
+    _, I = search_index(index, np.concatenate([x[500:], extra]), 1, **OVERRIDES[kind])
+    assert (I[:, 0] == np.concatenate([keys[500:], extra_keys])).all()
+
+
+@pytest.fixture
+def index_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(faiss_index, "INDEX_PATH", str(tmp_path / "faiss_index.{generation}.bin"))
+    monkeypatch.setattr(faiss_index, "META_PATH", str(tmp_path / "faiss_meta.{generation}.joblib"))
+    monkeypatch.setattr(faiss_index, "CURRENT_PATH", str(tmp_path / "faiss_current"))
+    monkeypatch.setattr(faiss_index, "FAISS_INDEX_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.mark.parametrize("kind", ["flat", "ivf_flat", "ivf_pq"])
+def test_incremental_update_in_place(index_dir, kind):
+    # build_index uses the configured FAISS_PQ_M (48), so the dim must be a multiple of it
+    x, keys = _corpus(dim=96), _keys(2000)
+    faiss_index.build_index(None, [f"j{k}" for k in keys], keys=keys, kind=kind, emb=x)
+    changed, fresh = _corpus(10, dim=96, seed=2), _keys(5, start=10 ** 6)
+    update_keys = np.concatenate([keys[:10], fresh])
+    faiss_index.update_index(None, [f"j{k}" for k in update_keys], update_keys, remove_keys=keys[10:20].tolist(),
+                             emb=np.concatenate([changed, _corpus(5, dim=96, seed=3)]))
+    snap = faiss_index.load_snapshot(faiss_index.current_generation())
+    assert snap.index.ntotal == 2000 - 10 + 5
+    assert faiss_index.reconstruct(snap, int(keys[15])) is None
+    _, I = search_index(snap.index, changed, 1, **OVERRIDES[kind])
+    assert (I[:, 0] == keys[:10]).mean() >= (0.9 if kind == "ivf_pq" else 1.0)
+
+
+@pytest.mark.parametrize("exact_max", [0, 5000])
+@pytest.mark.parametrize("kind", sorted(OVERRIDES))
+def test_filtered_search_above_and_below_exact_max(index_dir, monkeypatch, kind, exact_max):
+    # exact_max=0 forces the ID-selector path, 5000 the exact scoring of stored vectors
+    monkeypatch.setattr(faiss_index, "FAISS_FILTER_EXACT_MAX", exact_max)
+    x, keys = _corpus(dim=96), _keys(2000)
+    attributes = [("Pune" if i % 2 else "Delhi", "naukri", None, None, None) for i in range(2000)]
+    faiss_index.build_index(None, [f"j{k}" for k in keys], keys=keys, kind=kind, emb=x, attributes=attributes)
+    snap = faiss_index.load_snapshot(faiss_index.current_generation())
+    q = _corpus(1, dim=96, seed=4)
+    hits = faiss_index.search_vector(q, top_k=10, snapshot=snap, filters={"location": "pune"}, **OVERRIDES[kind])
+    pune = np.arange(1, 2000, 2)
+    assert len(hits) == 10
+    assert {h["idx"] for h in hits} <= set(keys[pune].tolist())
+    if kind != "ivf_pq":
+        truth = keys[pune[np.argsort(-(x[pune] @ q[0]))[:10]]]
+        assert [h["idx"] for h in hits] == truth.tolist()
+
+
+def test_merge_neighbors_drops_removed_and_changed_keys():
+    x, keys = _corpus(500), _keys(500)
+    index = _built("flat", x, keys)
+    table = faiss_index.compute_neighbors(index, x, keys, n=10)
+    removed, changed = keys[:20], keys[20:40]
+    index.remove_ids(faiss.IDSelectorArray(np.concatenate([removed, changed])))
+    moved = _corpus(20, seed=1)
+    index.add_with_ids(moved, changed)
+    delta = faiss_index.compute_neighbors(index, moved, changed, n=10)
+    merged = faiss_index.merge_neighbors(table, delta, removed.tolist() + changed.tolist())
+
+    assert not np.isin(merged["ids"], removed).any()
+    # a changed job only appears with its new score, i.e. where the delta inserted it
+    new_score = {int(k): dict(zip(r.tolist(), s.tolist()))
+                 for k, r, s in zip(delta["keys"], delta["ids"], delta["scores"])}
+    for key, row_ids, row_scores in zip(merged["keys"], merged["ids"], merged["scores"]):
+        for q, sc in zip(row_ids, row_scores):
+            if q in changed and key not in changed:
+                assert sc == pytest.approx(new_score[int(q)][int(key)])
+        # rows stay sorted best-first with -1 padding at the end
+        assert np.all(row_scores[:-1] >= row_scores[1:])
+
+
+def test_neighbors_short_row_falls_back():
+    keys = np.array([1, 2, 3], dtype='int64')
+    table = {"keys": keys, "ids": np.array([[2, 3], [1, -1], [1, 2]]),
+             "scores": np.array([[0.9, 0.8], [0.9, -np.inf], [0.8, 0.7]], dtype='float32')}
+    snap = faiss_index.IndexSnapshot(None, {"ids": {1: "a", 2: "b"}, "neighbors": table}, 1)
+    assert [r["id"] for r in faiss_index.neighbors(snap, 3, top_k=2)] == ["a", "b"]
+    assert faiss_index.neighbors(snap, 2, top_k=2) is None  # -1 padding
+    assert faiss_index.neighbors(snap, 1, top_k=2) is None  # key 3 was removed
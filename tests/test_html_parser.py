@@ -0,0 +1,41 @@
+import pytest
+
+from ai_job_dashboard.scraper import html_parser
+
+DETAIL = """<html><head><style>body { color: red }</style></head><body>
+<div id="jobDescriptionText">
+  <p>Build <b>data pipelines</b> in Python.</p>
+  <script>window.dataLayer = window.dataLayer || []; dataLayer.push({"jk": "abc"});</script>
+  <style>.apply { display: none }</style>
+  <ul><li>SQL</li><!-- tracking --><li>Airflow</li></ul>
+  <noscript>Please enable JavaScript</noscript>
+  <script type="application/ld+json">{"@type": "JobPosting"}</script>
+  <p>Remote friendly.</p>
+</div></body></html>"""
+
+EXPECTED = ["Build", "data pipelines", "in Python.", "SQL", "Airflow", "Remote friendly."]
+
+
+def _backend(name):
+    pytest.importorskip({"bs4": "bs4", "lxml": "lxml.html", "selectolax": "selectolax.lexbor"}[name])
+    if name == "lxml":
+        pytest.importorskip("cssselect")
+    return name
+
+
+@pytest.mark.parametrize("backend", html_parser.BACKENDS)
+def test_get_text_skips_inline_scripts(backend):
+    doc = html_parser.parse_html(DETAIL, backend=_backend(backend))
+    desc = doc.select_one("#jobDescriptionText")
+    assert desc.get_text("\n", strip=True).split("\n") == EXPECTED
+    assert "dataLayer" not in doc.get_text(" ") and "color: red" not in doc.get_text(" ")
+
+
+@pytest.mark.parametrize("backend", html_parser.BACKENDS)
+def test_get_text_matches_bs4(backend):
+    pytest.importorskip("bs4")
+    plain = "<div id='jobDescriptionText'> a <i>b</i>  c <p> d</p><p>e &amp; f</p></div>"
+    for html in (plain, DETAIL):
+        expected = html_parser.parse_html(html, backend="bs4").select_one("#jobDescriptionText")
+        got = html_parser.parse_html(html, backend=_backend(backend)).select_one("#jobDescriptionText")
+        assert got.get_text("|", strip=True) == expected.get_text("|", strip=True)
@@ -0,0 +1,19 @@
+import time
+from ai_job_dashboard.utils.lru import LRUCache
+
+
+def test_lru_evicts_least_recently_used():
+    c = LRUCache(maxsize=2)
+    c.set("a", 1)
+    c.set("b", 2)
+    assert c.get("a") == 1
+    c.set("c", 3)
+    assert c.get("b") is None
+    assert c.get("a") == 1 and c.get("c") == 3
+
+
+def test_lru_ttl_expires():
+    c = LRUCache(maxsize=2, ttl=0.01)
+    c.set("a", 1)
+    time.sleep(0.02)
+    assert c.get("a") is None
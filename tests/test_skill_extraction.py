@@ -0,0 +1,20 @@
+import pytest
+
+from ai_job_dashboard.ml.skill_extraction import SkillMatcher, extract_skills_from_text
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("aws lambda, aws s3", ["aws", "aws lambda", "s3"]),
+    ("SQL Server 2019", ["sql", "sql server"]),
+    ("c++11 / c++17", ["c++"]),
+    ("vue3 and python3.11", ["python", "vue"]),
+    ("sas7bdat files", []),
+    ("C# and c++", ["c#", "c++"]),
+])
+def test_extract_skills(text, expected):
+    assert extract_skills_from_text(text) == expected
+
+
+def test_parents_are_transitive():
+    matcher = SkillMatcher({"a": [], "b": {"parents": ["a"]}, "c d": {"aliases": ["cd"], "parents": ["b"]}})
+    assert matcher.find("we use cd") == ["a", "b", "c d"]
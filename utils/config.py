@@ -8,3 +8,92 @@ USER_AGENT = os.getenv("USER_AGENT", "ai-job-dashboard-bot/1.0")
 PROXY_URL = os.getenv("PROXY_URL", "")
 SECRET_KEY = os.getenv("SECRET_KEY", "change_me")
 HUGGINGFACE_TOKEN = os.getenv("HUGGINGFACE_TOKEN", "")
+
+# FAISS index location and hot-reload behaviour
+FAISS_INDEX_DIR = os.getenv("FAISS_INDEX_DIR", "models")
+FAISS_MMAP = os.getenv("FAISS_MMAP", "0") == "1"
+FAISS_RELOAD_INTERVAL = float(os.getenv("FAISS_RELOAD_INTERVAL", "5"))
+FAISS_KEEP_GENERATIONS = int(os.getenv("FAISS_KEEP_GENERATIONS", "3"))
+
+# FAISS index type: flat | ivf_flat | ivf_pq | hnsw (0 for FAISS_NLIST picks ~4*sqrt(n))
+FAISS_INDEX_TYPE = os.getenv("FAISS_INDEX_TYPE", "flat")
+FAISS_NLIST = int(os.getenv("FAISS_NLIST", "0"))
+FAISS_PQ_M = int(os.getenv("FAISS_PQ_M", "48"))
+FAISS_HNSW_M = int(os.getenv("FAISS_HNSW_M", "32"))
+FAISS_TRAIN_SIZE = int(os.getenv("FAISS_TRAIN_SIZE", "100000"))
+FAISS_NPROBE = int(os.getenv("FAISS_NPROBE", "16"))
+FAISS_EF_SEARCH = int(os.getenv("FAISS_EF_SEARCH", "64"))
+# neighbours precomputed per job at index time for /job/{id}/similar (0 disables)
+FAISS_NEIGHBORS = int(os.getenv("FAISS_NEIGHBORS", "20"))
+# filtered searches allowing at most this many jobs are scored exactly from stored vectors
+FAISS_FILTER_EXACT_MAX = int(os.getenv("FAISS_FILTER_EXACT_MAX", "2048"))
+
+# resume matching: FAISS candidates re-ranked by skill overlap (fusion: weighted | rrf)
+MATCH_HYBRID = os.getenv("MATCH_HYBRID", "1") == "1"
+MATCH_CANDIDATES = int(os.getenv("MATCH_CANDIDATES", "200"))
+MATCH_FUSION = os.getenv("MATCH_FUSION", "weighted")
+MATCH_SKILL_WEIGHT = float(os.getenv("MATCH_SKILL_WEIGHT", "0.3"))
+MATCH_RRF_K = int(os.getenv("MATCH_RRF_K", "60"))
+
+# in-process cache of hydrated job summaries used by the match endpoints
+HYDRATE_CACHE_SIZE = int(os.getenv("HYDRATE_CACHE_SIZE", "50000"))
+HYDRATE_CACHE_TTL = float(os.getenv("HYDRATE_CACHE_TTL", "300"))
+
+# match API worker pools, admission limit and per-request timeout (seconds)
+API_PARSE_WORKERS = int(os.getenv("API_PARSE_WORKERS", "2"))
+API_PARSE_PROCESSES = os.getenv("API_PARSE_PROCESSES", "1") == "1"
+API_WORKERS = int(os.getenv("API_WORKERS", "4"))
+API_MAX_PENDING = int(os.getenv("API_MAX_PENDING", "32"))
+API_REQUEST_TIMEOUT = float(os.getenv("API_REQUEST_TIMEOUT", "30"))
+
+# micro-batching of concurrent query encodes (set EMBED_BATCHING=0 to encode inline)
+EMBED_BATCHING = os.getenv("EMBED_BATCHING", "1") == "1"
+EMBED_MAX_BATCH = int(os.getenv("EMBED_MAX_BATCH", "32"))
+EMBED_MAX_WAIT_MS = float(os.getenv("EMBED_MAX_WAIT_MS", "5"))
+
+# query/resume embedding cache: in-process LRU in front of redis
+EMBED_CACHE_SIZE = int(os.getenv("EMBED_CACHE_SIZE", "2048"))
+EMBED_CACHE_TTL = int(os.getenv("EMBED_CACHE_TTL", "86400"))
+
+# embedding inference backend: torch | int8 (dynamic quantization) | onnx | onnx-int8
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch")
+ONNX_DIR = os.getenv("ONNX_DIR", "models/onnx")
+
+# rows per INSERT ... ON CONFLICT statement / transaction in the ETL writer
+ETL_BATCH_SIZE = int(os.getenv("ETL_BATCH_SIZE", "500"))
+# concurrent scrape tasks per source ("source=n,..."), and how long a source may run (seconds)
+ETL_SOURCE_CONCURRENCY = os.getenv("ETL_SOURCE_CONCURRENCY", "indeed=1,naukri=4,linkedin=1")
+ETL_SOURCE_TIMEOUT = float(os.getenv("ETL_SOURCE_TIMEOUT", "1800"))
+
+# async scraper HTTP: connection pool, per-host token bucket (requests/sec + burst), retries
+SCRAPER_MAX_CONNECTIONS = int(os.getenv("SCRAPER_MAX_CONNECTIONS", "20"))
+SCRAPER_CONNECTIONS_PER_HOST = int(os.getenv("SCRAPER_CONNECTIONS_PER_HOST", "8"))
+SCRAPER_RATE_PER_HOST = float(os.getenv("SCRAPER_RATE_PER_HOST", "5"))
+SCRAPER_BURST = int(os.getenv("SCRAPER_BURST", "10"))
+SCRAPER_RETRIES = int(os.getenv("SCRAPER_RETRIES", "3"))
+
+# Indeed browser pool: one long-lived Chromium, N contexts x tabs, heavy resources blocked
+INDEED_BROWSER_POOL = os.getenv("INDEED_BROWSER_POOL", "0") == "1"
+BROWSER_CONTEXTS = int(os.getenv("BROWSER_CONTEXTS", "2"))
+BROWSER_TABS_PER_CONTEXT = int(os.getenv("BROWSER_TABS_PER_CONTEXT", "4"))
+BROWSER_HEADLESS = os.getenv("BROWSER_HEADLESS", "1") == "1"
+BROWSER_BLOCK_RESOURCES = [r for r in os.getenv("BROWSER_BLOCK_RESOURCES", "image,font,media").split(",") if r]
+
+# skip detail pages of jobs already stored with a description fetched within this window
+SCRAPER_DEDUP = os.getenv("SCRAPER_DEDUP", "1") == "1"
+SCRAPER_REFETCH_AFTER_HOURS = float(os.getenv("SCRAPER_REFETCH_AFTER_HOURS", "168"))
+
+# on-disk scraper response cache: off | on | record | replay (see scraper/response_cache.py)
+SCRAPER_CACHE = os.getenv("SCRAPER_CACHE", "off")
+SCRAPER_CACHE_DIR = os.getenv("SCRAPER_CACHE_DIR", "data/http_cache")
+SCRAPER_CACHE_TTL_HOURS = float(os.getenv("SCRAPER_CACHE_TTL_HOURS", "24"))
+SCRAPER_CACHE_MAX_MB = float(os.getenv("SCRAPER_CACHE_MAX_MB", "2048"))
+
+# html parsing engine for the scrapers: bs4 | lxml | selectolax (see scraper/html_parser.py)
+HTML_PARSER = os.getenv("HTML_PARSER", "bs4")
+
+# a failing proxy is quarantined for base * 2^(consecutive failures - 1) seconds, capped at max
+PROXY_QUARANTINE_BASE = float(os.getenv("PROXY_QUARANTINE_BASE", "30"))
+PROXY_QUARANTINE_MAX = float(os.getenv("PROXY_QUARANTINE_MAX", "1800"))
+# one proxy URL per line; loaded (together with PROXY_URL) into the process-wide proxy pool
+PROXY_LIST_PATH = os.getenv("PROXY_LIST_PATH", "proxies.txt")
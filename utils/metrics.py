@@ -0,0 +1,29 @@
+import threading
+from collections import defaultdict
+
+# minimal in-process metrics registry, exposed as JSON by api/health.py
+
+_lock = threading.Lock()
+_counters = defaultdict(float)
+_gauges = {}
+
+
+def _key(name, labels):
+    if not labels:
+        return name
+    return name + "{" + ",".join(f"{k}={v}" for k, v in sorted(labels.items())) + "}"
+
+
+def inc(name, value=1, **labels):
+    with _lock:
+        _counters[_key(name, labels)] += value
+
+
+def set_gauge(name, value, **labels):
+    with _lock:
+        _gauges[_key(name, labels)] = value
+
+
+def snapshot():
+    with _lock:
+        return {"counters": dict(_counters), "gauges": dict(_gauges)}
@@ -1,38 +1,179 @@
+import os
 import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+import requests
+from ai_job_dashboard.utils import metrics
+from ai_job_dashboard.utils.config import PROXY_QUARANTINE_BASE, PROXY_QUARANTINE_MAX, PROXY_LIST_PATH, PROXY_URL
 from ai_job_dashboard.utils.logger import get_logger
 logger = get_logger("ProxyPool")
 
+# responses that count against the proxy that carried them: blocks, proxy auth, upstream errors
+PROXY_FAILURE_STATUSES = {403, 407, 429, 500, 502, 503, 504}
+
+
+class _ProxyStats:
+    __slots__ = ("success", "latency", "failures", "until", "uses")
+
+    def __init__(self):
+        self.success = 1.0  # EWMA of success (1) / failure (0); new proxies start trusted
+        self.latency = None  # EWMA of seconds per successful fetch
+        self.failures = 0  # consecutive failures; drives the quarantine backoff
+        self.until = 0.0  # quarantined until this time.monotonic()
+        self.uses = 0
+
+
 class ProxyPool:
-    def __init__(self, proxies=None, health_check_url="https://www.google.com", timeout=5):
+    """
+    Thread-safe scored proxy pool. Selection is weighted by success rate and latency EWMAs;
+    a failing proxy is quarantined with exponential backoff instead of being dropped, and
+    comes back on probation when the quarantine ends. Callers report outcomes via report().
+    """
+
+    def __init__(self, proxies=None, health_check_url="https://www.google.com", timeout=5, alpha=0.3,
+                 quarantine_base=PROXY_QUARANTINE_BASE, quarantine_max=PROXY_QUARANTINE_MAX):
         # proxies: list of proxy strings "http://user:pass@ip:port" or "http://ip:port"
-        self.proxies = proxies or []
         self.health_check_url = health_check_url
         self.timeout = timeout
-        self._i = 0
+        self.alpha = alpha
+        self.quarantine_base = quarantine_base
+        self.quarantine_max = quarantine_max
+        self._lock = threading.Lock()
+        self._stats = {p: _ProxyStats() for p in proxies or []}
+
+    @property
+    def proxies(self):
+        return list(self._stats)
 
     def add(self, proxy):
-        self.proxies.append(proxy)
+        with self._lock:
+            self._stats.setdefault(proxy, _ProxyStats())
+
+    def available(self):
+        now = time.monotonic()
+        with self._lock:
+            return [p for p, s in self._stats.items() if s.until <= now]
+
+    def _weight(self, s, default_latency):
+        # floors keep every live proxy in rotation so a recovered exit can earn its score back
+        return max(s.success, 0.05) ** 2 / max(s.latency or default_latency, 0.05)
 
     def get(self):
-        if not self.proxies:
-            return None
-        # round-robin
-        proxy = self.proxies[self._i % len(self.proxies)]
-        self._i += 1
-        return proxy
+        with self._lock:
+            if not self._stats:
+                return None
+            now = time.monotonic()
+            live = [(p, s) for p, s in self._stats.items() if s.until <= now]
+            if not live:
+                # everything is quarantined: use the one that recovers first rather than going direct
+                proxy = min(self._stats, key=lambda p: self._stats[p].until)
+            else:
+                known = [s.latency for _, s in live if s.latency]
+                default_latency = sum(known) / len(known) if known else 1.0
+                proxy = random.choices([p for p, _ in live], [self._weight(s, default_latency) for _, s in live])[0]
+            self._stats[proxy].uses += 1
+            return proxy
 
     def sample(self):
-        return random.choice(self.proxies) if self.proxies else None
-
-    def health_check(self, session):
-        good = []
-        for p in self.proxies:
-            try:
-                resp = session.get(self.health_check_url, timeout=self.timeout, proxies={"http":p, "https":p})
-                if resp.status_code == 200:
-                    good.append(p)
-            except Exception:
-                logger.info(f"proxy {p} failed health check")
-        self.proxies = good
-        return good
+        return self.get()
+
+    def report(self, proxy, ok, latency=None):
+        """Outcome of one request through proxy: ok=False for connection errors, blocks (403/429/captcha), 5xx."""
+        if proxy is None:
+            return
+        with self._lock:
+            s = self._stats.get(proxy)
+            if s is None:
+                return
+            s.success = (1 - self.alpha) * s.success + self.alpha * (1.0 if ok else 0.0)
+            if ok:
+                s.failures = 0
+                if latency is not None:
+                    s.latency = latency if s.latency is None else (1 - self.alpha) * s.latency + self.alpha * latency
+            else:
+                s.failures += 1
+                backoff = min(self.quarantine_max, self.quarantine_base * 2 ** (s.failures - 1))
+                s.until = time.monotonic() + backoff
+                logger.info(f"proxy {proxy} quarantined for {backoff:.0f}s after {s.failures} failure(s)")
+            live = sum(1 for x in self._stats.values() if x.until <= time.monotonic())
+        metrics.inc("proxy_requests_total", ok=ok)
+        metrics.set_gauge("proxy_available", live)
+
+    def healthy(self, proxy, min_success=0.5):
+        """False while proxy is quarantined or its success EWMA has dropped below min_success."""
+        if proxy is None:
+            return True
+        with self._lock:
+            s = self._stats.get(proxy)
+            return s is None or (s.until <= time.monotonic() and s.success >= min_success)
+
+    def stats(self):
+        now = time.monotonic()
+        with self._lock:
+            return {p: {"success": round(s.success, 3), "latency": s.latency, "failures": s.failures,
+                        "quarantined_for": max(0.0, s.until - now), "uses": s.uses}
+                    for p, s in self._stats.items()}
+
+    def _check(self, session, proxy):
+        t0 = time.perf_counter()
+        try:
+            resp = session.get(self.health_check_url, timeout=self.timeout, proxies={"http": proxy, "https": proxy})
+            ok = resp.status_code == 200
+        except Exception:
+            ok = False
+        self.report(proxy, ok, time.perf_counter() - t0)
+        if not ok:
+            logger.info(f"proxy {proxy} failed health check")
+        return ok
+
+    def health_check(self, session=None, workers=16):
+        """Probe every proxy concurrently; failures are quarantined, not removed. Returns the healthy ones."""
+        proxies = self.proxies
+        if not proxies:
+            return []
+        session = session or requests
+        with ThreadPoolExecutor(max_workers=min(workers, len(proxies))) as pool:
+            results = list(pool.map(lambda p: self._check(session, p), proxies))
+        return [p for p, ok in zip(proxies, results) if ok]
+
+
+def load_proxies(path=PROXY_LIST_PATH):
+    """Proxy URLs from a file, one per line; a missing file means no proxies."""
+    if not os.path.exists(path):
+        return []
+    with open(path, "r") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_proxy_pool():
+    """
+    Process-wide pool over PROXY_LIST_PATH (plus PROXY_URL). Every scraper, fetcher and the
+    browser pool share it, so health scores and quarantines outlive any one scraper.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            proxies = load_proxies()
+            if PROXY_URL and PROXY_URL not in proxies:
+                proxies.append(PROXY_URL)
+            _pool = ProxyPool(proxies=proxies)
+            logger.info(f"Proxy pool with {len(proxies)} proxies")
+        return _pool
+
+
+def playwright_proxy(proxy):
+    """Proxy string -> Playwright's proxy settings, with any credentials in the URL as username/password."""
+    if not proxy:
+        return None
+    parts = urlsplit(proxy if "://" in proxy else "http://" + proxy)
+    settings = {"server": f"{parts.scheme}://{parts.hostname}" + (f":{parts.port}" if parts.port else "")}
+    if parts.username:
+        settings["username"] = parts.username
+        settings["password"] = parts.password or ""
+    return settings
@@ -0,0 +1,100 @@
+"""
+Re-run skill extraction over the whole jobs table, e.g. after the skill taxonomy changed.
+Usage:
+    python -m ai_job_dashboard.workers.backfill_skills [--chunk-size 2000] [--workers 4] [--restart]
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from sqlalchemy import select, update
+from ai_job_dashboard.db.db import get_session
+from ai_job_dashboard.db.models import Job
+from ai_job_dashboard.db.skill_counts import refresh_job_skills
+from ai_job_dashboard.nlp.skill_extraction import SKILL_TAXONOMY, extract_skills_from_text
+from ai_job_dashboard.utils.logger import get_logger
+
+logger = get_logger("SkillBackfill")
+CHECKPOINT_PATH = "data/skills_backfill.json"
+
+
+def taxonomy_version():
+    return hashlib.sha256(json.dumps(SKILL_TAXONOMY, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def load_checkpoint(path=CHECKPOINT_PATH):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_checkpoint(state, path=CHECKPOINT_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+def _extract_batch(rows):
+    # runs in a pool worker; the compiled matcher is built once per process
+    return [(key, extract_skills_from_text(description or "")) for key, description in rows]
+
+
+def _split(rows, n):
+    size = max(1, -(-len(rows) // n))
+    return [rows[i:i + size] for i in range(0, len(rows), size)]
+
+
+def run(chunk_size=2000, workers=None, restart=False):
+    workers = workers or os.cpu_count() or 1
+    version = taxonomy_version()
+    state = load_checkpoint()
+    # a checkpoint from a different taxonomy is meaningless: start over
+    last_id = state.get("last_id", 0) if not restart and state.get("version") == version else 0
+    if last_id:
+        logger.info(f"Resuming skill backfill after id {last_id}")
+    session = get_session()
+    scanned = changed = 0
+    started = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            while True:
+                stmt = (select(Job.id, Job.description, Job.skills)
+                        .where(Job.id > last_id).order_by(Job.id).limit(chunk_size))
+                rows = session.execute(stmt).all()
+                if not rows:
+                    break
+                current = {r.id: sorted(r.skills or []) for r in rows}
+                batches = _split([(r.id, r.description) for r in rows], workers)
+                updates = []
+                for result in pool.map(_extract_batch, batches):
+                    updates += [{"id": key, "skills": skills} for key, skills in result if skills != current[key]]
+                if updates:
+                    # ORM bulk UPDATE by primary key: one executemany per chunk
+                    session.execute(update(Job), updates)
+                    refresh_job_skills(session, [u["id"] for u in updates])
+                    session.commit()
+                last_id = rows[-1].id
+                scanned += len(rows)
+                changed += len(updates)
+                save_checkpoint({"version": version, "last_id": last_id})
+                logger.info(f"Backfill: {scanned} scanned, {changed} updated (last id {last_id})")
+    finally:
+        session.close()
+    save_checkpoint({"version": version, "last_id": last_id, "done": True})
+    logger.info(f"Skill backfill finished: {scanned} rows, {changed} changed in {time.perf_counter() - started:.1f}s")
+    return changed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--restart", action="store_true")
+    args = parser.parse_args()
+    run(chunk_size=args.chunk_size, workers=args.workers, restart=args.restart)
@@ -0,0 +1,99 @@
+import time
+from sqlalchemy import select, update, func, or_, cast, Text, literal_column, null
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from ai_job_dashboard.db.models import Job
+from ai_job_dashboard.db.hydrate import invalidate
+from ai_job_dashboard.db.skill_counts import refresh_job_skills
+from ai_job_dashboard.nlp.skill_extraction import extract_skills_from_text
+from ai_job_dashboard.utils.config import ETL_BATCH_SIZE
+from ai_job_dashboard.utils.logger import get_logger
+
+logger = get_logger("BulkWriter")
+
+# scraped fields that only overwrite the stored value when non-empty
+TEXT_FIELDS = ("title", "company", "location", "description")
+
+
+def _row(job):
+    description = job.get("description") or None
+    return {
+        "source": job.get("source"),
+        "job_id": job["job_id"],
+        "title": job.get("title") or None,
+        "company": job.get("company") or None,
+        "location": job.get("location") or None,
+        "description": description,
+        # no description (e.g. detail page skipped) keeps the stored skills; SQL NULL, not JSON null
+        "skills": extract_skills_from_text(description) if description else null(),
+        "raw_data": job,
+        # a downloaded (or revalidated) detail page; None leaves fetched_at as it was
+        "fetched_at": func.now() if description or job.get("not_modified") else None,
+    }
+
+
+def _insert(dialect):
+    if dialect == "postgresql":
+        return pg_insert(Job)
+    if dialect == "sqlite":
+        return sqlite_insert(Job)
+    raise NotImplementedError(f"bulk upsert not supported on {dialect}")
+
+
+def _statement(dialect, rows):
+    stmt = _insert(dialect).values(rows)
+    new = stmt.excluded
+    set_ = {f: func.coalesce(getattr(new, f), getattr(Job, f)) for f in TEXT_FIELDS}
+    set_["skills"] = func.coalesce(new.skills, Job.skills)
+    set_["raw_data"] = new.raw_data
+    set_["fetched_at"] = func.coalesce(new.fetched_at, Job.fetched_at)
+    set_["updated_at"] = func.now()
+    # rows whose scraped fields are identical are left alone (not rewritten, not returned)
+    changed = [getattr(new, f).isnot(None) & getattr(new, f).is_distinct_from(getattr(Job, f)) for f in TEXT_FIELDS]
+    changed.append(new.skills.isnot(None) & cast(new.skills, Text).is_distinct_from(cast(Job.skills, Text)))
+    stmt = stmt.on_conflict_do_update(index_elements=[Job.job_id], set_=set_, where=or_(*changed))
+    if dialect == "postgresql":
+        # xmax = 0 only for freshly inserted tuples
+        return stmt.returning(Job.id, Job.job_id, literal_column("(xmax = 0)").label("inserted"))
+    return stmt.returning(Job.id, Job.job_id)
+
+
+def _write_chunk(session, dialect, rows):
+    existing = set()
+    if dialect != "postgresql":
+        existing = set(session.execute(select(Job.job_id).where(Job.job_id.in_([r["job_id"] for r in rows]))).scalars())
+    result = session.execute(_statement(dialect, rows)).all()
+    written = {r.job_id for r in result}
+    refetched = [r["job_id"] for r in rows if r["fetched_at"] is not None and r["job_id"] not in written]
+    if refetched:
+        # unchanged rows are skipped by the upsert, but their detail page was still checked;
+        # updated_at is pinned so this does not look like a content change to the FAISS refresh
+        session.execute(update(Job).where(Job.job_id.in_(refetched))
+                        .values(fetched_at=func.now(), updated_at=Job.updated_at))
+    # inserted/updated rows may have new skills or filter dimensions; same transaction as the upsert
+    refresh_job_skills(session, [r.id for r in result])
+    session.commit()
+    if dialect == "postgresql":
+        inserted = sum(1 for r in result if r.inserted)
+    else:
+        inserted = sum(1 for r in result if r.job_id not in existing)
+    invalidate([r.id for r in result])
+    return {"inserted": inserted, "updated": len(result) - inserted, "unchanged": len(rows) - len(result)}
+
+
+def upsert_jobs(session, jobs, chunk_size=ETL_BATCH_SIZE):
+    """
+    Insert or update scraped job dicts with one INSERT ... ON CONFLICT (job_id) DO UPDATE
+    per chunk and one transaction per chunk. Returns inserted/updated/unchanged totals.
+    """
+    dialect = session.get_bind().dialect.name
+    # a key may appear only once per statement; the last scrape of a job wins
+    rows = list({r["job_id"]: r for r in (_row(j) for j in jobs if j.get("job_id"))}.values())
+    totals = {"inserted": 0, "updated": 0, "unchanged": 0}
+    for start in range(0, len(rows), chunk_size):
+        t0 = time.perf_counter()
+        counts = _write_chunk(session, dialect, rows[start:start + chunk_size])
+        for k, v in counts.items():
+            totals[k] += v
+        logger.info(f"Upsert batch of {min(chunk_size, len(rows) - start)}: {counts} in {time.perf_counter() - t0:.2f}s")
+    return totals
@@ -2,61 +2,250 @@ from ai_job_dashboard.scraper.indeed_scraper import IndeedScraper
 from ai_job_dashboard.scraper.naukri_scraper import NaukriScraper
 from ai_job_dashboard.scraper.linkedin_scraper import LinkedInScraper
 from ai_job_dashboard.db.db import get_session, engine
-from ai_job_dashboard.db.models import Base, Job
-from ai_job_dashboard.nlp.skill_extraction import extract_skills_from_text
+from ai_job_dashboard.db.models import Base
+from ai_job_dashboard.db.fulltext import ensure_fulltext
+from ai_job_dashboard.db.schema import ensure_schema
+from ai_job_dashboard.workers.bulk_writer import upsert_jobs
+from ai_job_dashboard.utils.config import ETL_BATCH_SIZE, ETL_SOURCE_CONCURRENCY, ETL_SOURCE_TIMEOUT
 from ai_job_dashboard.utils.logger import get_logger
-from datetime import datetime
-import sqlalchemy
+from concurrent.futures import Future, wait
+import queue
+import threading
+import time
 
 logger = get_logger("ETL")
 
 def init_db():
     Base.metadata.create_all(bind=engine)
+    ensure_schema(engine)
+    ensure_fulltext(engine)
 
 def upsert_job(session, job_dict):
-    # creates or updates based on job_id
-    job_id = job_dict.get("job_id")
-    if not job_id:
+    # creates or updates based on job_id; batches should go through upsert_jobs
+    if not job_dict.get("job_id"):
         return
-    existing = session.query(Job).filter(Job.job_id == job_id).one_or_none()
-    skills = extract_skills_from_text(job_dict.get("description",""))
-    if existing:
-        existing.title = job_dict.get("title") or existing.title
-        existing.company = job_dict.get("company") or existing.company
-        existing.description = job_dict.get("description") or existing.description
-        existing.location = job_dict.get("location") or existing.location
-        existing.skills = skills
-    else:
-        new = Job(
-            source=job_dict.get("source"),
-            job_id=job_id,
-            title=job_dict.get("title"),
-            company=job_dict.get("company"),
-            location=job_dict.get("location"),
-            description=job_dict.get("description"),
-            skills=skills,
-            metadata=job_dict
-        )
-        session.add(new)
-    session.commit()
-
-def run_etl(query="data scientist", location="India"):
-    logger.info("ETL start")
-    init_db()
-    session = get_session()
-    # Scrapers
-    ind = IndeedScraper()
-    nau = NaukriScraper()
-    li = LinkedInScraper(headless=True)
+    upsert_jobs(session, [job_dict])
+
+# source name -> scraper factory; each scrape task gets its own instance (and browser)
+SCRAPERS = {
+    "indeed": IndeedScraper,
+    "naukri": NaukriScraper,
+    "linkedin": lambda: LinkedInScraper(headless=True),
+}
+
+def _source_limits(spec=ETL_SOURCE_CONCURRENCY):
+    limits = {}
+    for part in spec.split(","):
+        if "=" in part:
+            name, n = part.split("=", 1)
+            limits[name.strip()] = max(1, int(n))
+    return limits
+
+class SourceStats:
+    def __init__(self, name):
+        self.name = name
+        self.started = time.perf_counter()
+        self.last_done = None
+        self.timed_out = None
+        self.pages = 0
+        self.failed = 0
+        self.abandoned = 0
+        self.jobs = 0
+        self._lock = threading.Lock()
+
+    def record(self, jobs=0, failed=False):
+        """False once the source has timed out: the page was already counted as abandoned."""
+        with self._lock:
+            if self.timed_out:
+                return False
+            if failed:
+                self.failed += 1
+            else:
+                self.pages += 1
+                self.jobs += jobs
+            self.last_done = time.perf_counter()
+            return True
+
+    def time_out(self, submitted):
+        # every page not recorded by now is abandoned; its results are dropped if it ever finishes
+        with self._lock:
+            self.timed_out = time.perf_counter()
+            self.abandoned = submitted - self.pages - self.failed
+
+    def line(self):
+        if self.timed_out:
+            status = f"TIMED OUT after {self.timed_out - self.started:.1f}s"
+        else:
+            status = f"{(self.last_done or self.started) - self.started:.1f}s"
+        return (f"{self.name}: {self.jobs} jobs from {self.pages} pages "
+                f"({self.failed} failed, {self.abandoned} abandoned) in {status}")
+
+class DaemonPool:
+    """
+    Minimal ThreadPoolExecutor stand-in on daemon threads. Executor workers are joined at
+    interpreter exit, so a page stuck in a browser past the deadline would keep the ETL
+    process alive; these are not.
+    """
+
+    def __init__(self, max_workers, name, on_exit=None):
+        self._tasks = queue.Queue()
+        self._workers = max_workers
+        self._on_exit = on_exit
+        for i in range(max_workers):
+            threading.Thread(target=self._work, name=f"{name}_{i}", daemon=True).start()
+
+    def submit(self, fn, *args):
+        future = Future()
+        self._tasks.put((future, fn, args))
+        return future
+
+    def shutdown(self):
+        # cancel what has not started; running tasks finish on their own, idle workers exit
+        while True:
+            try:
+                task = self._tasks.get_nowait()
+            except queue.Empty:
+                break
+            if task is not None:
+                task[0].cancel()
+        for _ in range(self._workers):
+            self._tasks.put(None)
+
+    def _work(self):
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                if self._on_exit:
+                    self._on_exit()
+                return
+            future, fn, args = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+class StreamingWriter:
+    """Writer thread: scrape results are upserted in batches as soon as they arrive."""
+
+    def __init__(self, session, batch_size=ETL_BATCH_SIZE, flush_interval=5.0):
+        self.session = session
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.totals = {"inserted": 0, "updated": 0, "unchanged": 0}
+        self._queue = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="etl-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, jobs):
+        """Queue jobs for writing; False (and an error log) if the writer is already closed."""
+        with self._lock:
+            if not self._closed:
+                self._queue.put(jobs)
+                return True
+        logger.error(f"Writer already closed; dropped {len(jobs)} jobs")
+        return False
 
-    results = []
-    results += ind.search(query=query, location=location, max_pages=1)
-    results += nau.search(query=query, location=location, max_pages=1)
-    results += li.search(query=query, location=location, max_pages=1)
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+        return self.totals
 
-    for job in results:
+    def _flush(self, pending):
+        if not pending:
+            return
         try:
-            upsert_job(session, job)
+            for k, v in upsert_jobs(self.session, pending, chunk_size=self.batch_size).items():
+                self.totals[k] += v
         except Exception:
             logger.exception("Upsert failed")
-    logger.info("ETL complete")
+            self.session.rollback()
+
+    def _run(self):
+        pending = []
+        last_flush = time.monotonic()
+        while True:
+            try:
+                jobs = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                jobs = []
+            if jobs is None:
+                break
+            pending += jobs
+            if len(pending) >= self.batch_size or time.monotonic() - last_flush >= self.flush_interval:
+                self._flush(pending)
+                pending = []
+                last_flush = time.monotonic()
+        self._flush(pending)
+
+# per worker thread: source -> scraper, so a browser / HTTP session / proxy choice serves every
+# page that thread scrapes instead of being rebuilt per page (sync Playwright is thread-bound too)
+_scrapers = threading.local()
+
+def _scraper(source):
+    if not hasattr(_scrapers, "by_source"):
+        _scrapers.by_source = {}
+    if source not in _scrapers.by_source:
+        _scrapers.by_source[source] = SCRAPERS[source]()
+    return _scrapers.by_source[source]
+
+def _close_scrapers():
+    # runs on the worker thread as it exits, which is where its browsers were started
+    for source, scraper in getattr(_scrapers, "by_source", {}).items():
+        try:
+            scraper.close()
+        except Exception:
+            logger.exception(f"closing the {source} scraper failed")
+    _scrapers.by_source = {}
+
+def _scrape_page(source, query, location, page_no, writer, stats):
+    try:
+        jobs = _scraper(source).search(query=query, location=location, max_pages=1, start_page=page_no)
+    except Exception:
+        stats.record(failed=True)
+        logger.exception(f"{source} page {page_no} for {query!r} in {location!r} failed")
+        return
+    if not stats.record(jobs=len(jobs)):
+        logger.warning(f"{source} page {page_no} for {query!r} in {location!r} finished after the "
+                       f"source timed out; dropped {len(jobs)} jobs")
+        return
+    writer.put(jobs)
+
+def run_etl(query="data scientist", location="India", queries=None, locations=None, max_pages=1,
+            sources=None, timeout=ETL_SOURCE_TIMEOUT):
+    logger.info("ETL start")
+    init_db()
+    session = get_session()
+    queries = queries or [query]
+    locations = locations or [location]
+    limits = _source_limits()
+    writer = StreamingWriter(session)
+
+    # one bounded pool per source: a slow or blocked source only ever ties up its own workers
+    pools, futures, stats = {}, {}, {}
+    for source in sources or list(SCRAPERS):
+        pools[source] = DaemonPool(limits.get(source, 1), f"etl-{source}", on_exit=_close_scrapers)
+        stats[source] = SourceStats(source)
+        futures[source] = [
+            pools[source].submit(_scrape_page, source, q, loc, page_no, writer, stats[source])
+            for q in queries for loc in locations for page_no in range(max_pages)
+        ]
+
+    deadline = time.monotonic() + timeout
+    for source, fs in futures.items():
+        _, not_done = wait(fs, timeout=max(0.0, deadline - time.monotonic()))
+        if not_done:
+            stats[source].time_out(len(fs))
+        # leave stragglers behind instead of blocking the run on them
+        pools[source].shutdown()
+
+    counts = writer.close()
+    for s in stats.values():
+        logger.info(s.line())
+    logger.info(f"ETL complete: {counts}")
+    return counts
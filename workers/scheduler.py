@@ -1,5 +1,8 @@
 from apscheduler.schedulers.blocking import BlockingScheduler
 from ai_job_dashboard.etl.pipeline import run_etl
+from ai_job_dashboard.db.db import get_session
+from ai_job_dashboard.db.skill_counts import rebuild as rebuild_skill_counts
+from ai_job_dashboard.ml.build_faiss_from_db import main as build_faiss
 from ai_job_dashboard.utils.logger import get_logger
 
 logger = get_logger("Scheduler")
@@ -7,11 +10,28 @@ logger = get_logger("Scheduler")
 def job():
     logger.info("Running scheduled ETL job...")
     run_etl(query="data scientist", location="India")
+    # only the rows upserted by this run are embedded
+    build_faiss(incremental=True)
+
+def rebuild_index():
+    logger.info("Running nightly FAISS rebuild...")
+    build_faiss()
+
+def rebuild_skills():
+    # the ETL keeps skill counts current incrementally; this only corrects drift
+    logger.info("Running nightly skill count rebuild...")
+    session = get_session()
+    try:
+        rebuild_skill_counts(session)
+    finally:
+        session.close()
 
 def start_scheduler():
     scheduler = BlockingScheduler()
     scheduler.add_job(job, "interval", hours=12)
-    logger.info("Scheduler started – ETL will run every 12 hours.")
+    scheduler.add_job(rebuild_index, "cron", hour=3)
+    scheduler.add_job(rebuild_skills, "cron", hour=4)
+    logger.info("Scheduler started – ETL will run every 12 hours, full index rebuild nightly.")
     scheduler.start()
 
 if __name__ == "__main__":